@@ -2,22 +2,26 @@ from __future__ import annotations
 
 import json
 import os
-from app.config.llm import get_gemini_model_for_adk
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from google.adk.agents import Agent
-from google.adk.models.google_llm import Gemini
+from app.config.llm import get_gemini_model_for_adk
 
 from app.schemas.conversation_route import ConversationRouteDecision
 
+if TYPE_CHECKING:
+    from google.adk.agents import Agent
 
-def build_conversation_router_agent() -> Agent:
-    instruction = """
+
+@lru_cache(maxsize=None)
+def conversation_router_instruction() -> str:
+    return """
 You are a conversation router for a booking assistant.
 
 Return ONLY JSON in this exact format:
 
 {
-  "route": "<one of: search_update | listing_question | new_search | other>",
+  "route": "<one of: search_update | listing_question | new_search | show_more | other>",
   "reason": "<short explanation>"
 }
 
@@ -99,22 +103,45 @@ IMPORTANT:
 Do NOT use "new_search" just because the user mentions a different property type like hotel/apartment.
 Changing apartment -> hotel inside the same context is usually "search_update".
 
-4) other
+4) show_more
+Use this when the user asks for more options of the SAME search without changing anything.
+
+Examples:
+- "show me more"
+- "next 5"
+- "any other options?"
+- "покажи ещё"
+- "ещё варианты"
+
+IMPORTANT:
+If the user asks for more options AND changes something ("more, but with a balcony"), classify as "search_update".
+
+5) other
 Use for greetings, acknowledgements, chit-chat, or unrelated messages.
 
 Decision priority:
 1. listing_question
-2. search_update if the message continues or modifies the current search context
-3. new_search only if the user clearly starts over
-4. other
+2. show_more if the user only asks for more results
+3. search_update if the message continues or modifies the current search context
+4. new_search only if the user clearly starts over
+5. other
 
 Return ONLY JSON.
 """.strip()
 
+
+def build_conversation_router_agent() -> Agent:
+    instruction = conversation_router_instruction()
+
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError("Missing GEMINI_API_KEY/GOOGLE_API_KEY")
 
+    # google.adk is heavy: import it only when a live agent is built, so
+    # importing this module stays cheap for the ranking path.
+    from google.adk.agents import Agent
+    from google.adk.models.google_llm import Gemini
+
     llm = Gemini(
         model=get_gemini_model_for_adk(),
         api_key=api_key,
@@ -124,4 +151,20 @@ Return ONLY JSON.
         name="conversation_router",
         model=llm,
         instruction=instruction,
-    )
\ No newline at end of file
+    )
+
+
+_AGENT_CACHE: dict[tuple[str, str], Agent] = {}
+
+
+def get_conversation_router_agent() -> Agent:
+    """
+    Process-wide cached agent; the instruction is static, so it is only
+    rebuilt when the API key or model changes.
+    """
+    key = (os.getenv("GOOGLE_API_KEY") or "", get_gemini_model_for_adk())
+    agent = _AGENT_CACHE.get(key)
+    if agent is None:
+        agent = build_conversation_router_agent()
+        _AGENT_CACHE[key] = agent
+    return agent
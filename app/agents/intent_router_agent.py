@@ -1,18 +1,20 @@
 from __future__ import annotations
 
-import json
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 from app.config.llm import get_gemini_model_for_adk
 
-from google.adk.agents import Agent
-from google.adk.models.google_llm import Gemini
 from pydantic import BaseModel, Field as PydanticField, field_validator
 
 from app.schemas.constraints import UserConstraint
 from app.schemas.fields import Field
 from app.schemas.filters import SearchFilters
 from app.schemas.property_semantics import OccupancyType, PropertyType
+from app.services.serialization import dumps
+
+if TYPE_CHECKING:
+    from google.adk.agents import Agent
 
 
 class IntentRoute(BaseModel):
@@ -48,15 +50,16 @@ class IntentRoute(BaseModel):
         return SearchFilters() if v is None else v
 
 
-def build_intent_router_agent() -> Agent:
+@lru_cache(maxsize=None)
+def intent_router_instruction() -> str:
     allowed_fields = [f.value for f in Field]
     schema = IntentRoute.model_json_schema()
 
-    instruction = f"""
+    return f"""
 You are an intent router for a booking search assistant.
 
 Return ONLY VALID JSON matching this schema:
-{json.dumps(schema, ensure_ascii=False)}
+{dumps(schema)}
 
 Rules:
 
@@ -239,10 +242,19 @@ Return constraints containing:
 - unknown_requests=[]
 """.strip()
 
+
+def build_intent_router_agent() -> Agent:
+    instruction = intent_router_instruction()
+
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError("Missing GEMINI_API_KEY/GOOGLE_API_KEY")
 
+    # google.adk is heavy: import it only when a live agent is built, so
+    # importing IntentRoute & co. stays cheap for the ranking path.
+    from google.adk.agents import Agent
+    from google.adk.models.google_llm import Gemini
+
     llm = Gemini(
         model=get_gemini_model_for_adk(),
         api_key=api_key,
@@ -252,4 +264,20 @@ Return constraints containing:
         name="intent_router",
         model=llm,
         instruction=instruction,
-    )
\ No newline at end of file
+    )
+
+
+_AGENT_CACHE: dict[tuple[str, str], Agent] = {}
+
+
+def get_intent_router_agent() -> Agent:
+    """
+    Process-wide cached agent; the instruction is static, so it is only
+    rebuilt when the API key or model changes.
+    """
+    key = (os.getenv("GOOGLE_API_KEY") or "", get_gemini_model_for_adk())
+    agent = _AGENT_CACHE.get(key)
+    if agent is None:
+        agent = build_intent_router_agent()
+        _AGENT_CACHE[key] = agent
+    return agent
@@ -1,23 +1,27 @@
 from __future__ import annotations
 
-import json
 import os
-from app.config.llm import get_gemini_model_for_adk
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from google.adk.agents import Agent
-from google.adk.models.google_llm import Gemini
+from app.config.llm import get_gemini_model_for_adk
 
 from app.schemas.intent_patch import SearchIntentPatch
+from app.services.serialization import dumps
 
+if TYPE_CHECKING:
+    from google.adk.agents import Agent
 
-def build_intent_update_agent() -> Agent:
+
+@lru_cache(maxsize=None)
+def intent_update_instruction() -> str:
     schema = SearchIntentPatch.model_json_schema()
 
-    instruction = f"""
+    return f"""
 You update an existing structured booking search request.
 
 Return ONLY valid JSON matching this schema:
-{json.dumps(schema, ensure_ascii=False)}
+{dumps(schema)}
 
 IMPORTANT:
 - Return ONLY a PATCH, not the full state
@@ -192,10 +196,19 @@ Return:
 {{"clear_dates":true}}
 """.strip()
 
+
+def build_intent_update_agent() -> Agent:
+    instruction = intent_update_instruction()
+
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError("Missing GOOGLE_API_KEY")
 
+    # google.adk is heavy: import it only when a live agent is built, so
+    # importing this module stays cheap for the ranking path.
+    from google.adk.agents import Agent
+    from google.adk.models.google_llm import Gemini
+
     llm = Gemini(
         model=get_gemini_model_for_adk(),
         api_key=api_key,
@@ -205,4 +218,20 @@ Return:
         name="intent_update",
         model=llm,
         instruction=instruction,
-    )
\ No newline at end of file
+    )
+
+
+_AGENT_CACHE: dict[tuple[str, str], Agent] = {}
+
+
+def get_intent_update_agent() -> Agent:
+    """
+    Process-wide cached agent; the instruction is static, so it is only
+    rebuilt when the API key or model changes.
+    """
+    key = (os.getenv("GOOGLE_API_KEY") or "", get_gemini_model_for_adk())
+    agent = _AGENT_CACHE.get(key)
+    if agent is None:
+        agent = build_intent_update_agent()
+        _AGENT_CACHE[key] = agent
+    return agent
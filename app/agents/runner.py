@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING, Callable, Optional
+
+from app.config.llm import get_gemini_model_for_adk
+from app.services.cassette import get_cassette
+from app.services.llm_usage import record_usage_metadata
+
+if TYPE_CHECKING:
+    from google.adk.agents import Agent
+
+APP_NAME = "booking-ai-agent"
+USER_ID = "local-user"
+
+
+async def run_agent_text(
+    get_agent: Callable[[], Agent],
+    *,
+    name: str,
+    instruction: str,
+    prompt: str,
+) -> Optional[str]:
+    """
+    One-shot ADK run: send prompt, return the concatenated text parts (or None).
+
+    Goes through the cassette as kind "adk.<name>", keyed by model + the
+    agent's system instruction + prompt (like the gemini.* kinds), so a
+    prompt change never replays stale answers. instruction is passed in by
+    the caller: replay/stub modes need neither the agent nor an API key.
+    """
+
+    async def _run_live() -> Optional[str]:
+        # Only live runs need the ADK runtime; cassette replay never imports it.
+        from google.adk.agents.run_config import RunConfig
+        from google.adk.runners import Runner
+        from google.adk.sessions import InMemorySessionService
+        from google.genai.types import Content, Part
+
+        agent = get_agent()
+        session_service = InMemorySessionService()
+        runner = Runner(agent=agent, app_name=APP_NAME, session_service=session_service)
+
+        session_id = f"{name}-{uuid.uuid4().hex[:8]}"
+        await session_service.create_session(
+            app_name=APP_NAME,
+            user_id=USER_ID,
+            session_id=session_id,
+        )
+
+        msg = Content(role="user", parts=[Part.from_text(text=prompt)])
+        cfg = RunConfig(response_modalities=["TEXT"])
+
+        final_text: Optional[str] = None
+        async for ev in runner.run_async(
+            user_id=USER_ID,
+            session_id=session_id,
+            new_message=msg,
+            run_config=cfg,
+        ):
+            record_usage_metadata(getattr(ev, "usage_metadata", None))
+            content = getattr(ev, "content", None)
+            if content and getattr(content, "parts", None):
+                for p in content.parts:
+                    t = getattr(p, "text", None)
+                    if t:
+                        final_text = (final_text or "") + t
+
+        return final_text
+
+    return await get_cassette().acall(
+        f"adk.{name}",
+        {"model": get_gemini_model_for_adk(), "system": instruction, "prompt": prompt},
+        _run_live,
+    )
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+
+@dataclass
+class ApifyMockConfig:
+    """
+    Behaviour of the mock Apify API.
+
+    - listings: source items (dicts as the Booking actor returns them)
+    - latency_ms / latency_jitter_ms: delay of run-sync calls and of actor runs
+    - error_rate: share of run-sync / run-start calls answered with error_status
+    - items_per_run: force the result size (source is cycled with new ids);
+      None means min(maxItems, matching source items)
+    - description_padding: extra characters appended to every description,
+      to benchmark larger payloads
+    """
+    listings: list[dict[str, Any]] = field(default_factory=list)
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    items_per_run: int | None = None
+    description_padding: int = 0
+    seed: int = 0
+
+
+@dataclass
+class _MockRun:
+    run_id: str
+    actor: str
+    dataset_id: str
+    items: list[dict[str, Any]]
+    started_at: datetime
+    finishes_at: float
+    failed: bool = False
+
+    def status(self) -> str:
+        if time.monotonic() < self.finishes_at:
+            return "RUNNING"
+        return "FAILED" if self.failed else "SUCCEEDED"
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _listing_text(item: dict[str, Any]) -> str:
+    parts = [item.get("name"), item.get("address"), item.get("city"), item.get("description")]
+    return " ".join(str(p) for p in parts if p).lower()
+
+
+class _ApifyMockState:
+    def __init__(self, config: ApifyMockConfig) -> None:
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.runs: dict[str, _MockRun] = {}
+        self.datasets: dict[str, list[dict[str, Any]]] = {}
+        self.counters: dict[str, int] = {
+            "run_sync_total": 0,
+            "runs_started_total": 0,
+            "dataset_reads_total": 0,
+            "errors_injected_total": 0,
+        }
+
+    def latency_seconds(self) -> float:
+        cfg = self.config
+        jitter = self.random.uniform(-cfg.latency_jitter_ms, cfg.latency_jitter_ms) if cfg.latency_jitter_ms else 0.0
+        return max(0.0, cfg.latency_ms + jitter) / 1000.0
+
+    def inject_error(self) -> bool:
+        if self.config.error_rate > 0 and self.random.random() < self.config.error_rate:
+            self.counters["errors_injected_total"] += 1
+            return True
+        return False
+
+    def build_items(self, actor_input: dict[str, Any], max_items: int | None) -> list[dict[str, Any]]:
+        cfg = self.config
+        source = cfg.listings
+
+        # The Booking actor searches by "search" (city [+ property type]).
+        search = str(actor_input.get("search") or "").strip().lower()
+        city = search.split(" ")[0] if search else ""
+        if city:
+            matching = [it for it in source if city in _listing_text(it)]
+            source = matching or source
+
+        limit = cfg.items_per_run
+        if limit is None:
+            limit = min(len(source), max_items) if max_items else len(source)
+        elif max_items:
+            limit = min(limit, max_items)
+
+        if not source or limit <= 0:
+            return []
+
+        items: list[dict[str, Any]] = []
+        padding = "x" * cfg.description_padding if cfg.description_padding else ""
+        for i, base in enumerate(itertools.islice(itertools.cycle(source), limit)):
+            item = dict(base)
+            copy_no = i // len(source)
+            if copy_no:
+                # Synthetic expansion beyond the source size: keep ids unique.
+                item["id"] = f"{base.get('id') or 'listing'}-{copy_no}"
+                if item.get("url"):
+                    item["url"] = f"{item['url']}?copy={copy_no}"
+            if padding:
+                item["description"] = f"{item.get('description') or ''} {padding}".strip()
+            items.append(item)
+        return items
+
+    def run_payload(self, run: _MockRun) -> dict[str, Any]:
+        status = run.status()
+        finished = status != "RUNNING"
+        return {
+            "id": run.run_id,
+            "actId": run.actor,
+            "userId": "mock-user",
+            "actorTaskId": None,
+            "startedAt": _iso(run.started_at),
+            "finishedAt": _iso(datetime.now(timezone.utc)) if finished else None,
+            "status": status,
+            "statusMessage": None,
+            "isStatusMessageTerminal": finished,
+            "meta": {"origin": "API", "userAgent": "apify-mock"},
+            "stats": {
+                "inputBodyLen": 0,
+                "restartCount": 0,
+                "resurrectCount": 0,
+                "computeUnits": 0,
+            },
+            "options": {
+                "build": "latest",
+                "timeoutSecs": 3600,
+                "memoryMbytes": 1024,
+                "diskMbytes": 2048,
+            },
+            "buildId": "mock-build",
+            "buildNumber": "0.0.1",
+            "exitCode": (1 if run.failed else 0) if finished else None,
+            "defaultKeyValueStoreId": f"kvs-{run.run_id}",
+            "defaultDatasetId": run.dataset_id,
+            "defaultRequestQueueId": f"rq-{run.run_id}",
+            "containerUrl": f"https://{run.run_id}.runs.apify.net",
+            "usageTotalUsd": 0.0,
+            "pricingInfo": None,
+            "chargedEventCounts": None,
+            "generalAccess": "RESTRICTED",
+        }
+
+
+def _error(status: int, message: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status,
+        content={"error": {"type": "mock-injected-error", "message": message}},
+    )
+
+
+def _max_items(request: Request, actor_input: dict[str, Any]) -> int | None:
+    value = request.query_params.get("maxItems") or actor_input.get("maxItems")
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+async def _actor_input(request: Request) -> dict[str, Any]:
+    try:
+        body = await request.json()
+    except Exception:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
+def create_apify_mock_app(config: ApifyMockConfig | None = None) -> FastAPI:
+    """
+    Local stand-in for the Apify API endpoints used by this project:
+
+    - POST /v2/acts/{actor}/run-sync-get-dataset-items  (ApifyRetriever)
+    - POST /v2/acts/{actor}/runs, GET /v2/actor-runs/{run_id},
+      GET /v2/actor-runs/{run_id}/log,
+      GET /v2/datasets/{dataset_id}/items  (ApifyClient in ApifyBookingService)
+
+    Point APIFY_BASE_URL at it. Tokens are accepted but not checked.
+    """
+    state = _ApifyMockState(config or ApifyMockConfig())
+
+    app = FastAPI(title="apify-mock")
+    app.state.mock = state
+
+    @app.get("/mock/stats")
+    async def stats() -> dict[str, Any]:
+        return {**state.counters, "runs": len(state.runs)}
+
+    # apify-client 2.x uses /v2/acts/..., 3.x uses /v2/actors/...
+    @app.post("/v2/acts/{actor}/run-sync-get-dataset-items")
+    @app.post("/v2/actors/{actor}/run-sync-get-dataset-items")
+    async def run_sync_get_dataset_items(actor: str, request: Request) -> Any:
+        state.counters["run_sync_total"] += 1
+        actor_input = await _actor_input(request)
+
+        await asyncio.sleep(state.latency_seconds())
+        if state.inject_error():
+            return _error(state.config.error_status, "Injected error (run-sync)")
+
+        return state.build_items(actor_input, _max_items(request, actor_input))
+
+    @app.post("/v2/acts/{actor}/runs", status_code=201)
+    @app.post("/v2/actors/{actor}/runs", status_code=201)
+    async def start_run(actor: str, request: Request) -> Any:
+        state.counters["runs_started_total"] += 1
+        actor_input = await _actor_input(request)
+
+        if state.inject_error():
+            return _error(state.config.error_status, "Injected error (run start)")
+
+        run_id = uuid.uuid4().hex[:17]
+        run = _MockRun(
+            run_id=run_id,
+            actor=actor,
+            dataset_id=f"ds-{run_id}",
+            items=state.build_items(actor_input, _max_items(request, actor_input)),
+            started_at=datetime.now(timezone.utc),
+            finishes_at=time.monotonic() + state.latency_seconds(),
+        )
+        state.runs[run_id] = run
+        state.datasets[run.dataset_id] = run.items
+        return {"data": state.run_payload(run)}
+
+    @app.get("/v2/actor-runs/{run_id}")
+    async def get_run(run_id: str, request: Request) -> Any:
+        run = state.runs.get(run_id)
+        if run is None:
+            return _error(404, f"Run {run_id} not found")
+
+        try:
+            wait_for_finish = float(request.query_params.get("waitForFinish") or 0)
+        except ValueError:
+            wait_for_finish = 0.0
+
+        remaining = run.finishes_at - time.monotonic()
+        if remaining > 0 and wait_for_finish > 0:
+            await asyncio.sleep(min(remaining, wait_for_finish))
+
+        return {"data": state.run_payload(run)}
+
+    @app.get("/v2/actor-runs/{run_id}/log")
+    async def get_run_log(run_id: str) -> PlainTextResponse:
+        return PlainTextResponse("")
+
+    @app.get("/v2/datasets/{dataset_id}/items")
+    async def get_dataset_items(dataset_id: str, request: Request) -> Any:
+        items = state.datasets.get(dataset_id)
+        if items is None:
+            return _error(404, f"Dataset {dataset_id} not found")
+
+        state.counters["dataset_reads_total"] += 1
+        params = request.query_params
+        offset = max(0, int(params.get("offset") or 0))
+        limit = int(params.get("limit") or len(items) or 1)
+        desc = (params.get("desc") or "").lower() in {"1", "true"}
+
+        ordered = list(reversed(items)) if desc else items
+        page = ordered[offset: offset + limit]
+
+        return JSONResponse(
+            page,
+            headers={
+                "x-apify-pagination-total": str(len(items)),
+                "x-apify-pagination-offset": str(offset),
+                "x-apify-pagination-count": str(len(page)),
+                "x-apify-pagination-limit": str(limit),
+                "x-apify-pagination-desc": "true" if desc else "false",
+            },
+        )
+
+    return app
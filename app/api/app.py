@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+
+from app.api.limits import ConcurrencyLimiter, ServiceUnavailable
+from app.api.sessions import InMemorySessionStore, SessionStore
+from app.config.settings import (
+    API_MAX_CONCURRENCY,
+    API_MAX_SESSIONS,
+    API_QUEUE_TIMEOUT_SECONDS,
+    API_SESSION_TTL_SECONDS,
+    API_SHUTDOWN_GRACE_SECONDS,
+)
+from app.logic import conversation_flow
+from app.schemas.api import MessageRequest, SearchToolRequest
+from app.schemas.fallback_policy import FallbackPolicy
+from app.schemas.query import SearchRequest
+from app.services.llm_usage import PROCESS_USAGE
+from app.services.logs import configure_logging, get_logger
+from app.services.metrics import REGISTRY, Counter, Gauge, render_prometheus
+from app.services.serialization import dumps
+from app.tools import orchestrate_search_tool
+
+log = get_logger(__name__)
+
+
+def _unavailable(reason: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"error": "service_unavailable", "detail": reason},
+        headers={"Retry-After": "1"},
+    )
+
+
+def _json_body(result: dict[str, Any]) -> Response:
+    # Results are already JSON-ready (model_dump(mode="json")): encode once,
+    # skipping FastAPI's jsonable_encoder walk over the whole payload.
+    return Response(content=dumps(result), media_type="application/json")
+
+
+def _sse(event: dict[str, Any]) -> str:
+    data = dumps(event["data"])
+    return f"event: {event['event']}\ndata: {data}\n\n"
+
+
+def create_app(
+    *,
+    session_store: SessionStore | None = None,
+    max_concurrency: int = API_MAX_CONCURRENCY,
+    queue_timeout: float = API_QUEUE_TIMEOUT_SECONDS,
+    shutdown_grace: float = API_SHUTDOWN_GRACE_SECONDS,
+    warm_up_on_start: bool = False,
+) -> FastAPI:
+    """
+    ASGI service around handle_user_message / orchestrate_search.
+
+    Run with: uvicorn app.api:create_app --factory
+    """
+    configure_logging()
+    limiter = ConcurrencyLimiter(max_concurrent=max_concurrency, queue_timeout=queue_timeout)
+    # Not `session_store or ...`: an empty store is falsy (it has __len__).
+    sessions = session_store if session_store is not None else InMemorySessionStore(
+        max_sessions=API_MAX_SESSIONS,
+        ttl_seconds=API_SESSION_TTL_SECONDS,
+    )
+    counters: dict[str, int] = {"errors_total": 0}
+    started_at = time.time()
+
+    def service_metrics() -> list[Any]:
+        requests = Counter("booking_http_requests_total", "Requests admitted by the concurrency limiter.")
+        rejected = Counter("booking_http_rejected_total", "Requests rejected with 503 (queue timeout / draining).")
+        errors = Counter("booking_http_errors_total", "Requests that failed with an internal error.")
+        in_flight = Gauge("booking_http_in_flight", "Requests currently holding a slot.")
+        active_sessions = Gauge("booking_sessions", "Sessions in the session store.")
+        uptime = Gauge("booking_uptime_seconds", "Seconds since the service started.")
+
+        requests.inc(limiter.started_total)
+        rejected.inc(limiter.rejected_total)
+        errors.inc(counters["errors_total"])
+        in_flight.set(limiter.in_flight)
+        active_sessions.set(len(sessions))
+        uptime.set(round(time.time() - started_at, 3))
+        return [requests, rejected, errors, in_flight, active_sessions, uptime]
+
+    # Keyed: a newer app instance replaces the previous one's collector.
+    REGISTRY.register_collector("service", service_metrics)
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        if warm_up_on_start:
+            from app.services.warmup import warm_up
+
+            warm_up()
+        yield
+        # Graceful shutdown: reject new requests, let in-flight turns finish.
+        await limiter.drain(shutdown_grace)
+
+    app = FastAPI(title="booking-ai-agent", lifespan=lifespan)
+    app.state.limiter = limiter
+    app.state.sessions = sessions
+
+    @app.get("/healthz")
+    async def healthz() -> JSONResponse:
+        if limiter.draining:
+            return _unavailable("draining")
+        return JSONResponse({"status": "ok"})
+
+    @app.get("/metrics")
+    async def metrics() -> dict[str, Any]:
+        return {
+            "uptime_seconds": round(time.time() - started_at, 3),
+            "requests_total": limiter.started_total,
+            "in_flight": limiter.in_flight,
+            "rejected_total": limiter.rejected_total,
+            "errors_total": counters["errors_total"],
+            "max_concurrency": limiter.max_concurrent,
+            "sessions": len(sessions),
+            "draining": limiter.draining,
+            "llm": PROCESS_USAGE.to_dict(),
+        }
+
+    @app.get("/metrics/prometheus")
+    async def metrics_prometheus() -> PlainTextResponse:
+        """Pipeline, LLM, FX and service metrics in the Prometheus text format."""
+        return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+    @app.post("/v1/messages")
+    async def post_message(body: MessageRequest) -> Any:
+        try:
+            async with limiter.slot():
+                session = sessions.get_or_create(body.session_id)
+
+                # Turns of one session are applied in order.
+                async with session.lock:
+                    previous_state = (
+                        SearchRequest.model_validate(session.search_state)
+                        if session.search_state is not None
+                        else None
+                    )
+
+                    result = await conversation_flow.handle_user_message(
+                        user_message=body.message,
+                        previous_state=previous_state,
+                        source=body.source,
+                        top_n=body.top_n,
+                        max_items=body.max_items,
+                        shown_listing=body.shown_listing,
+                        latest_result_context=body.latest_result_context,
+                        result_context=session.result_context,
+                        debug_timings=body.debug_timings,
+                        llm_usage=session.llm_usage,
+                    )
+
+                    if result.get("state") is not None:
+                        session.search_state = result["state"]
+                    if body.debug_timings:
+                        result.setdefault("debug", {})["session_llm_usage"] = session.llm_usage.to_dict()
+
+                result["session_id"] = session.session_id
+                return _json_body(result)
+        except ServiceUnavailable as e:
+            return _unavailable(str(e))
+
+    @app.post("/v1/messages/stream")
+    async def post_message_stream(body: MessageRequest) -> Any:
+        """
+        Same turn as /v1/messages, streamed as server-sent events
+        (handle_user_message_events stages, "final" last).
+        """
+        # The slot is taken before the response starts so overload is still
+        # a plain 503; it is released when the stream ends.
+        stack = AsyncExitStack()
+        try:
+            await stack.enter_async_context(limiter.slot())
+        except ServiceUnavailable as e:
+            return _unavailable(str(e))
+
+        session = sessions.get_or_create(body.session_id)
+
+        # Locked right away, as in /v1/messages: a busy session is never
+        # evicted, so the turn cannot end up in an orphaned session while
+        # the response is waiting to start.
+        try:
+            await stack.enter_async_context(session.lock)
+        except BaseException:
+            await stack.aclose()
+            raise
+
+        async def events() -> AsyncIterator[str]:
+            async with stack:
+                previous_state = (
+                    SearchRequest.model_validate(session.search_state)
+                    if session.search_state is not None
+                    else None
+                )
+
+                try:
+                    async for event in conversation_flow.handle_user_message_events(
+                        user_message=body.message,
+                        previous_state=previous_state,
+                        source=body.source,
+                        top_n=body.top_n,
+                        max_items=body.max_items,
+                        shown_listing=body.shown_listing,
+                        latest_result_context=body.latest_result_context,
+                        result_context=session.result_context,
+                        debug_timings=body.debug_timings,
+                        llm_usage=session.llm_usage,
+                    ):
+                        if event["event"] == "final":
+                            result = event["data"]
+                            if result.get("state") is not None:
+                                session.search_state = result["state"]
+                            if body.debug_timings:
+                                result.setdefault("debug", {})["session_llm_usage"] = session.llm_usage.to_dict()
+                            result["session_id"] = session.session_id
+                        yield _sse(event)
+                except Exception as exc:
+                    # Headers are already sent: report the failure in-band.
+                    counters["errors_total"] += 1
+                    log.error("api.stream_error", session_id=session.session_id, exc_info=exc)
+                    yield _sse({
+                        "event": "error",
+                        "data": {"error": "internal_error", "detail": exc.__class__.__name__},
+                    })
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Session-Id": session.session_id},
+            # Releases the session lock and the slot even if the stream was
+            # never consumed.
+            background=BackgroundTask(stack.aclose),
+        )
+
+    @app.post("/v1/search")
+    async def post_search(body: SearchToolRequest) -> Any:
+        try:
+            async with limiter.slot():
+                result = await orchestrate_search_tool.orchestrate_search(
+                    user_text=body.user_text,
+                    intent=body.intent,
+                    top_n=body.top_n,
+                    max_items=body.max_items,
+                    source=body.source,
+                    fallback_policy=FallbackPolicy(
+                        enabled=body.fallback_enabled,
+                        top_k=body.fallback_top_k,
+                    ),
+                    debug_timings=body.debug_timings,
+                )
+                return _json_body(result)
+        except ServiceUnavailable as e:
+            return _unavailable(str(e))
+
+    @app.exception_handler(Exception)
+    async def on_error(request: Request, exc: Exception) -> JSONResponse:
+        counters["errors_total"] += 1
+        log.error("api.unhandled_error", path=request.url.path, exc_info=exc)
+        return JSONResponse(
+            status_code=500,
+            content={"error": "internal_error", "detail": exc.__class__.__name__},
+        )
+
+    return app
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+
+class ServiceUnavailable(Exception):
+    """Raised when a request cannot get a slot (overloaded or draining)."""
+
+
+class ConcurrencyLimiter:
+    """
+    Request-level concurrency limit with a bounded queue wait.
+
+    Requests beyond max_concurrent wait up to queue_timeout seconds for a
+    slot and are then rejected, so overload turns into fast 503s instead of
+    unbounded latency. drain() supports graceful shutdown.
+    """
+
+    def __init__(self, *, max_concurrent: int, queue_timeout: float) -> None:
+        self.max_concurrent = max(1, max_concurrent)
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+        self.in_flight = 0
+        self.draining = False
+        self.started_total = 0
+        self.rejected_total = 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if self.draining:
+            self.rejected_total += 1
+            raise ServiceUnavailable("service is shutting down")
+
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected_total += 1
+            raise ServiceUnavailable("too many concurrent requests") from None
+
+        self.in_flight += 1
+        self.started_total += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+            if self.in_flight == 0:
+                self._idle.set()
+
+    async def drain(self, timeout: float) -> bool:
+        """Stop admitting requests and wait for in-flight ones. True if drained."""
+        self.draining = True
+        deadline = time.monotonic() + max(0.0, timeout)
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=max(0.0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            return False
+        return True
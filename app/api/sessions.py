@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from app.logic.search_context import SearchResultContext
+from app.services.llm_usage import LLMUsage
+
+
+@dataclass
+class SessionState:
+    """
+    Conversation state of one API session.
+
+    search_state is the canonical SearchRequest JSON (what the UI keeps in
+    st.session_state); result_context is a process-local cache and may be
+    dropped at any time without changing answers.
+    """
+    session_id: str
+    search_state: dict[str, Any] | None = None
+    result_context: SearchResultContext = field(default_factory=SearchResultContext)
+    llm_usage: LLMUsage = field(default_factory=LLMUsage)
+    updated_at: float = field(default_factory=time.monotonic)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class SessionStore(Protocol):
+    def get_or_create(self, session_id: str | None) -> SessionState:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+
+class InMemorySessionStore:
+    """
+    LRU + TTL session store for a single worker process.
+
+    For several workers behind a load balancer either use sticky sessions
+    or provide a shared SessionStore implementation.
+    """
+
+    def __init__(self, *, max_sessions: int, ttl_seconds: float) -> None:
+        self.max_sessions = max(1, max_sessions)
+        self.ttl_seconds = ttl_seconds
+        self._sessions: OrderedDict[str, SessionState] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _evict(self, now: float) -> None:
+        # A session with a turn in flight (lock held) is never dropped,
+        # neither by TTL nor by the size bound.
+        #
+        # TTL: sessions are kept in last-use order, so expiry stops at the
+        # first one that is still fresh.
+        for session in list(self._sessions.values()):
+            if now - session.updated_at <= self.ttl_seconds:
+                break
+            if not session.lock.locked():
+                del self._sessions[session.session_id]
+
+        # Size bound (room for one new session): drop the least recently
+        # used idle sessions, skipping busy ones at the front.
+        excess = len(self._sessions) - self.max_sessions + 1
+        if excess > 0:
+            idle = [sid for sid, session in self._sessions.items() if not session.lock.locked()]
+            for sid in idle[:excess]:
+                del self._sessions[sid]
+
+    def get_or_create(self, session_id: str | None) -> SessionState:
+        now = time.monotonic()
+
+        if session_id and session_id in self._sessions:
+            session = self._sessions[session_id]
+            if now - session.updated_at <= self.ttl_seconds or session.lock.locked():
+                session.updated_at = now
+                self._sessions.move_to_end(session_id)
+                return session
+            del self._sessions[session_id]
+
+        self._evict(now)
+
+        session = SessionState(session_id=session_id or uuid.uuid4().hex)
+        self._sessions[session.session_id] = session
+        return session
@@ -49,4 +49,16 @@ def debug_print_llm_config() -> None:
     """
     print("=== LLM CONFIG ===")
     print("Primary model:", get_gemini_model())
-    print("Fallback models:", get_gemini_fallback_models())
\ No newline at end of file
+    print("Fallback models:", get_gemini_fallback_models())
+
+
+def get_gemini_model_for_adk() -> str:
+    """
+    Model name for ADK `Gemini(...)` wrappers and genai clients.
+
+    ADK expects a bare model id, so strip an optional "models/" prefix.
+    """
+    model = get_gemini_model()
+    if model.startswith("models/"):
+        return model[len("models/"):]
+    return model
@@ -7,4 +7,26 @@ FALLBACK_TOP_K_DEFAULT = 5
 FX_BASE_CURRENCY = os.getenv("FX_BASE_CURRENCY", "USD")
 FX_CACHE_TTL_DAYS = int(os.getenv("FX_CACHE_TTL_DAYS", "10"))
 FX_CACHE_PATH = os.getenv("FX_CACHE_PATH", "data/fx_rates_usd.json")
-FX_API_URL = os.getenv("FX_API_URL", "https://api.frankfurter.dev/v2/rates?base=USD")
\ No newline at end of file
+FX_API_URL = os.getenv("FX_API_URL", "https://api.frankfurter.dev/v2/rates?base=USD")
+
+API_MAX_CONCURRENCY = int(os.getenv("API_MAX_CONCURRENCY", "32"))
+API_QUEUE_TIMEOUT_SECONDS = float(os.getenv("API_QUEUE_TIMEOUT_SECONDS", "5"))
+API_SHUTDOWN_GRACE_SECONDS = float(os.getenv("API_SHUTDOWN_GRACE_SECONDS", "30"))
+API_SESSION_TTL_SECONDS = int(os.getenv("API_SESSION_TTL_SECONDS", "3600"))
+API_MAX_SESSIONS = int(os.getenv("API_MAX_SESSIONS", "10000"))
+
+# Logging (app/services/logs.py): level, "text" | "json", share of DEBUG records kept
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "1.0"))
+
+# Attach the per-stage timing breakdown (app/services/tracing.py) to responses
+DEBUG_TIMINGS = os.getenv("DEBUG_TIMINGS", "0") == "1"
+
+# LLM cost accounting (app/services/llm_usage.py): JSON {"model-prefix": [usd_in, usd_out] per 1M tokens}
+LLM_PRICES_JSON = os.getenv("LLM_PRICES_JSON", "")
+
+# External call transport: live | record | replay | stub (see app/services/cassette.py)
+CASSETTE_MODE = os.getenv("LLM_CASSETTE_MODE", "live")
+CASSETTE_PATH = os.getenv("LLM_CASSETTE_PATH", "data/cassettes/default.jsonl")
+CASSETTE_LATENCY_MS = float(os.getenv("LLM_CASSETTE_LATENCY_MS", "0"))
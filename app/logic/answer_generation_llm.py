@@ -1,37 +1,37 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
-from typing import Any
+from typing import Any, AsyncIterator
 import re
 from app.logic.answer_generation import build_user_answer
+from app.services.cassette import get_cassette
+from app.services.llm_usage import llm_call, record_usage_metadata
+from app.services.serialization import dumps
 
 import re
 
 
-def _cleanup_llm_answer(text: str) -> str:
-    text = (text or "").strip()
-
-    text = text.replace(
+def _cleanup_llm_line(line: str) -> str:
+    """Line-local part of the cleanup, safe to apply to streamed lines."""
+    line = line.replace(
         "Both GOOGLE_API_KEY and GEMINI_API_KEY are set. Using GOOGLE_API_KEY.",
         ""
-    ).strip()
+    )
 
-    text = re.sub(
+    line = re.sub(
         r"\[(https?://[^\]]+)\]\((https?://[^)]+)\)",
         r"[View listing](\2)",
-        text,
+        line,
     )
 
-    text = re.sub(
+    line = re.sub(
         r"(^\s*[-*]\s+)(https?://\S+)$",
         r"\1[View listing](\2)",
-        text,
-        flags=re.MULTILINE,
+        line,
     )
 
-    text = text.replace("**", "")
+    line = line.replace("**", "")
 
     unsafe_patterns = [
         (r"\bmight not allow pets\b", "pet policy is not confirmed"),
@@ -39,12 +39,16 @@ def _cleanup_llm_answer(text: str) -> str:
         (r"\blikely does not allow pets\b", "pet policy is not confirmed"),
     ]
     for pattern, repl in unsafe_patterns:
-        text = re.sub(pattern, repl, text, flags=re.IGNORECASE)
+        line = re.sub(pattern, repl, line, flags=re.IGNORECASE)
+
+    line = re.sub(r"[ \t]{2,}", " ", line)
+    return line.rstrip()
 
-    text = re.sub(r"[ \t]{2,}", " ", text)
-    text = "\n".join(line.rstrip() for line in text.splitlines() if line.strip())
 
-    return text
+def _cleanup_llm_answer(text: str) -> str:
+    text = (text or "").strip()
+    lines = (_cleanup_llm_line(line) for line in text.splitlines())
+    return "\n".join(line for line in lines if line.strip()).strip()
 
 def _gemini_client():
     try:
@@ -178,12 +182,46 @@ STYLE:
 - no JSON
 """.strip()
 
+
+def _build_answer_user_prompt(payload: dict[str, Any]) -> str:
+    return (
+        "Write a natural, user-friendly answer based on this payload. "
+        "Start with a short summary of what was found, then explain the key differences between the options. "
+        "Clearly explain why the top option stands out, but avoid sounding mechanical or repetitive. "
+        "Help the user make a decision.\n\n"
+        + dumps(payload)
+    )
+
+
+def _build_answer_request(user_prompt: str) -> tuple[list[Any], Any]:
+    genai_types = _genai_types()
+
+    contents = [
+        genai_types.Content(
+            role="user",
+            parts=[genai_types.Part(text=user_prompt)],
+        )
+    ]
+    config = genai_types.GenerateContentConfig(
+        system_instruction=_build_answer_system_prompt(),
+        temperature=0.3,
+    )
+    return contents, config
+
+def _answer_cassette_request(model: str, user_prompt: str) -> dict[str, Any]:
+    return {
+        "model": model,
+        "system": _build_answer_system_prompt(),
+        "contents": user_prompt,
+        "temperature": 0.3,
+    }
+
 from app.config.llm import get_gemini_model
 
 async def generate_user_answer_with_llm(
     payload: dict[str, Any],
     *,
-    model: str = get_gemini_model(),
+    model: str | None = None,
     use_fallback_on_error: bool = True,
 ) -> str:
     """
@@ -191,33 +229,28 @@ async def generate_user_answer_with_llm(
 
     Falls back to deterministic formatter if the model call fails.
     """
-    system = _build_answer_system_prompt()
-    user_prompt = (
-        "Write a natural, user-friendly answer based on this payload. "
-        "Start with a short summary of what was found, then explain the key differences between the options. "
-        "Clearly explain why the top option stands out, but avoid sounding mechanical or repetitive. "
-        "Help the user make a decision.\n\n"
-        + json.dumps(payload, ensure_ascii=False, indent=2)
-    )
+    model = model or get_gemini_model()
+    user_prompt = _build_answer_user_prompt(payload)
 
-    def _call_sync() -> str:
+    def _generate() -> str:
         client = _gemini_client()
-        genai_types = _genai_types()
+        contents, config = _build_answer_request(user_prompt)
 
         resp = client.models.generate_content(
             model=model,
-            contents=[
-                genai_types.Content(
-                    role="user",
-                    parts=[genai_types.Part(text=user_prompt)],
-                )
-            ],
-            config=genai_types.GenerateContentConfig(
-                system_instruction=system,
-                temperature=0.3,
-            ),
+            contents=contents,
+            config=config,
+        )
+        record_usage_metadata(getattr(resp, "usage_metadata", None))
+        return resp.text or ""
+
+    def _call_sync() -> str:
+        text = get_cassette().call(
+            "gemini.answer",
+            _answer_cassette_request(model, user_prompt),
+            _generate,
         )
-        return (resp.text or "").strip()
+        return text.strip()
 
     try:
         text = await asyncio.to_thread(_call_sync)
@@ -230,4 +263,89 @@ async def generate_user_answer_with_llm(
     except Exception:
         if use_fallback_on_error:
             return build_user_answer(payload)
-        raise
\ No newline at end of file
+        raise
+
+
+async def stream_user_answer_with_llm(
+    payload: dict[str, Any],
+    *,
+    model: str | None = None,
+    use_fallback_on_error: bool = True,
+) -> AsyncIterator[str]:
+    """
+    Streaming variant of generate_user_answer_with_llm.
+
+    Yields cleaned text as soon as each line of the model output is complete
+    (the cleanup is line-local, so it is applied per line). Concatenated
+    chunks equal the non-streaming answer.
+
+    On error before anything was sent, yields the deterministic answer
+    instead. On error mid-stream, the deterministic answer follows the
+    partial text after a blank line.
+    """
+    model = model or get_gemini_model()
+    user_prompt = _build_answer_user_prompt(payload)
+    emitted = False
+    pending = ""
+
+    async def _live_chunks() -> AsyncIterator[str]:
+        client = _gemini_client()
+        contents, config = _build_answer_request(user_prompt)
+
+        stream = await client.aio.models.generate_content_stream(
+            model=model,
+            contents=contents,
+            config=config,
+        )
+        async for chunk in stream:
+            record_usage_metadata(getattr(chunk, "usage_metadata", None))
+            yield chunk.text or ""
+
+    async def _chunks() -> AsyncIterator[str]:
+        cassette = get_cassette()
+        if cassette.mode == "live":
+            with llm_call("gemini.answer_stream", model=model):
+                async for text in _live_chunks():
+                    yield text
+            return
+
+        async def _collect() -> list[str]:
+            return [text async for text in _live_chunks()]
+
+        for text in await cassette.acall(
+            "gemini.answer_stream",
+            _answer_cassette_request(model, user_prompt),
+            _collect,
+        ):
+            yield text
+
+    def _take_line(line: str) -> str | None:
+        nonlocal emitted
+        cleaned = _cleanup_llm_line(line)
+        if not cleaned.strip():
+            return None
+        if not emitted:
+            emitted = True
+            return cleaned.lstrip()
+        return "\n" + cleaned
+
+    try:
+        async for piece in _chunks():
+            pending += piece
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                text = _take_line(line)
+                if text is not None:
+                    yield text
+
+        text = _take_line(pending)
+        if text is not None:
+            yield text
+
+        if not emitted and use_fallback_on_error:
+            yield build_user_answer(payload)
+    except Exception:
+        if not use_fallback_on_error:
+            raise
+        yield ("\n\n" if emitted else "") + build_user_answer(payload)
+
@@ -134,7 +134,9 @@ def _dedupe_constraints(constraints: list[UserConstraint]) -> list[UserConstrain
 
 
 def apply_intent_patch(state: SearchRequest, patch: SearchIntentPatch) -> SearchRequest:
-    data = state.model_copy(deep=True)
+    # Shallow copy: list fields are rebuilt below and filters are copied by
+    # _merge_filters, so nothing shared with `state` is mutated.
+    data = state.model_copy()
 
 
     # clear first
@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 from app.schemas.fallback_policy import FallbackPolicy
 
 from app.logic.listing_signals import collect_listing_signals
+from app.logic.result_ids import build_result_id
 from app.schemas.constraints import (
     ConstraintMappingStatus,
     ConstraintPriority,
@@ -18,6 +19,13 @@ from app.schemas.constraints import (
 from app.schemas.fields import Field as CanonicalField
 from app.schemas.listing import ListingRaw
 from app.schemas.match import Ternary
+from app.services.cassette import get_cassette
+from app.services.llm_usage import record_usage_metadata
+from app.services.logs import get_logger
+from app.services.serialization import dumps
+from app.services.tracing import incr
+
+log = get_logger(__name__)
 
 ResolverType = Literal["textual", "geo", "hybrid"]
 DecisionType = Literal["YES", "NO", "UNCERTAIN"]
@@ -346,8 +354,9 @@ from app.config.llm import get_gemini_model
 async def resolve_constraint_via_textual_evidence(
     req: ConstraintResolutionRequest,
     *,
-    model: str = get_gemini_model(),
+    model: str | None = None,
 ) -> ConstraintResolutionResult:
+    model = model or get_gemini_model()
     payload = {
         "constraint": {
             "raw_text": req.raw_text,
@@ -363,11 +372,17 @@ async def resolve_constraint_via_textual_evidence(
     }
 
     system = _build_system_prompt()
-    user_prompt = json.dumps(payload, ensure_ascii=False)
-    print("SYSTEM PROMPT USED:")
-    print(system)
+    user_prompt = dumps(payload)
+    log.debug(
+        "constraint_resolution.prompt",
+        listing_id=req.listing_id,
+        constraint=req.normalized_text,
+        system_chars=len(system),
+        prompt_chars=len(user_prompt),
+        system=lambda: system,
+    )
 
-    def _call_sync() -> ConstraintResolutionResult:
+    def _generate() -> str:
         client = _gemini_client()
         genai_types = _genai_types()
 
@@ -384,8 +399,15 @@ async def resolve_constraint_via_textual_evidence(
                 temperature=0.1,
             ),
         )
+        record_usage_metadata(getattr(resp, "usage_metadata", None))
+        return resp.text or ""
 
-        raw_text = resp.text or ""
+    def _call_sync() -> ConstraintResolutionResult:
+        raw_text = get_cassette().call(
+            "gemini.constraint_resolution",
+            {"model": model, "system": system, "contents": user_prompt, "temperature": 0.1},
+            _generate,
+        )
         raw_json = _extract_json(raw_text)
 
         try:
@@ -410,13 +432,35 @@ async def resolve_constraint_via_textual_evidence(
     return await asyncio.to_thread(_call_sync)
 
 
+def _resolution_cache_key(
+    *,
+    listing: ListingRaw,
+    constraint: UserConstraint,
+    structured_value: Ternary | None,
+    model: str,
+) -> tuple:
+    return (
+        build_result_id(listing),
+        constraint.id,
+        constraint.normalized_text.strip().casefold(),
+        constraint.priority.value,
+        structured_value.value if structured_value is not None else None,
+        model,
+    )
+
+
 async def resolve_listing_constraints_with_fallback(
     *,
     listing: ListingRaw,
     constraints: list[UserConstraint],
     structured_matches_by_field: dict[CanonicalField, Any],
     policy: FallbackPolicy,
+    resolution_cache: dict[tuple, ConstraintResolutionResult] | None = None,
 ) -> list[ConstraintResolutionResult]:
+    """
+    resolution_cache (optional, owned by the session result context) lets
+    unchanged constraints reuse the previous LLM resolution for the same listing.
+    """
     if not policy.enabled:
         return []
 
@@ -441,6 +485,19 @@ async def resolve_listing_constraints_with_fallback(
         ):
             continue
 
+        cache_key = _resolution_cache_key(
+            listing=listing,
+            constraint=constraint,
+            structured_value=structured_value,
+            model=policy.model,
+        )
+        if resolution_cache is not None and cache_key in resolution_cache:
+            incr("resolution_cache_hits")
+            results.append(resolution_cache[cache_key])
+            continue
+
+        incr("llm_resolutions")
+
         req = build_resolution_request(
             listing=listing,
             constraint=constraint,
@@ -450,6 +507,8 @@ async def resolve_listing_constraints_with_fallback(
             req,
             model=policy.model,
         )
+        if resolution_cache is not None:
+            resolution_cache[cache_key] = result
         results.append(result)
 
     return results
\ No newline at end of file
@@ -1,27 +1,40 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
 
 from app.logic.intent_router import build_search_request_adk_async
 from app.logic.intent_update import update_search_state_async
 from app.logic.request_resolution import resolve_required_search_context
 from app.logic.conversation_router import route_conversation_async
 from app.logic.listing_signals import collect_listing_signals
+from app.logic.search_context import SearchResultContext
 from app.schemas.query import SearchRequest
-from app.tools.orchestrate_search_tool import orchestrate_search
+from app.tools.orchestrate_search_tool import (
+    orchestrate_search,
+    orchestrate_search_events,
+    show_more_results,
+)
 from app.logic.constraint_evidence_resolution import (
     ConstraintResolutionRequest,
     resolve_constraint_via_textual_evidence,
 )
 from app.schemas.fallback_policy import FallbackPolicy
-from app.config.settings import MAX_ITEMS_HARD_CAP
+from app.config.settings import DEBUG_TIMINGS, MAX_ITEMS_HARD_CAP
+from app.services.llm_usage import LLMUsage, attach_llm_usage, usage_from_trace
+from app.services.metrics import observe_trace
+from app.services.serialization import dump_model
+from app.services.logs import get_logger
+from app.services.tracing import Span, attach_timings, iterate_in_span, span, start_span
+
+log = get_logger(__name__)
 
 
 
 def _build_state_payload(state: SearchRequest | None) -> dict[str, Any] | None:
     if state is None:
         return None
-    return state.model_dump(mode="json", exclude_none=True)
+    return dump_model(state)
 
 
 async def _answer_listing_question(
@@ -72,22 +85,52 @@ async def _answer_listing_question(
     )
 
     result = await resolve_constraint_via_textual_evidence(request)
+    result_json = result.model_dump(mode="json")
 
     return {
         "need_clarification": False,
         "response_type": "listing_question",
         "answer": result.reason,
-        "listing_question_result": result.model_dump(mode="json"),
+        "listing_question_result": result_json,
         "state": previous_state_json,
         "parsed_intent": {
             "router": route_debug,
             "user_message": user_message,
-            "listing_question_result": result.model_dump(mode="json"),
+            "listing_question_result": result_json,
         },
         "search_request": previous_state_json,
     }
 
 
+async def _show_more(
+    *,
+    user_message: str,
+    previous_state: SearchRequest | None,
+    result_context: SearchResultContext | None,
+    page_size: int,
+    route_debug: dict[str, Any] | None = None,
+) -> Dict[str, Any]:
+    previous_state_json = _build_state_payload(previous_state)
+
+    if result_context is None:
+        result: Dict[str, Any] = {
+            "need_clarification": True,
+            "questions": ["There are no more results for the current search."],
+        }
+    else:
+        result = await show_more_results(result_context, page_size=page_size)
+
+    result["response_type"] = "show_more"
+    result["state"] = previous_state_json
+    result["parsed_intent"] = {
+        "router": route_debug,
+        "user_message": user_message,
+        "previous_state": previous_state_json,
+    }
+    result["search_request"] = previous_state_json
+    return result
+
+
 def _build_orchestrate_intent_payload(state: SearchRequest) -> dict[str, Any]:
     """
     Serialize the canonical constraint-centric search state for orchestrate_search.
@@ -97,17 +140,31 @@ def _build_orchestrate_intent_payload(state: SearchRequest) -> dict[str, Any]:
     return payload
 
 
-async def handle_user_message(
+@dataclass
+class _TurnPlan:
+    """Routing outcome: either a finished result, or a state to search with."""
+    result: Dict[str, Any] | None = None
+    state: SearchRequest | None = None
+    state_json: dict[str, Any] | None = None
+    parsed_intent: dict[str, Any] | None = None
+
+
+def _attach_turn_state(result: Dict[str, Any], plan: _TurnPlan) -> Dict[str, Any]:
+    result["state"] = plan.state_json
+    result["parsed_intent"] = plan.parsed_intent
+    result["search_request"] = plan.state_json
+    return result
+
+
+async def _plan_turn(
     user_message: str,
     previous_state: Optional[SearchRequest] = None,
     *,
-    source: str = "fixtures",
     top_n: int = 5,
-    fallback_policy: FallbackPolicy | None = None,
-    max_items: int = MAX_ITEMS_HARD_CAP,
     shown_listing: dict[str, Any] | None = None,
     latest_result_context: dict[str, Any] | None = None,
-) -> Dict[str, Any]:
+    result_context: SearchResultContext | None = None,
+) -> _TurnPlan:
     route_debug: dict[str, Any] | None = None
     previous_state_json: dict[str, Any] | None = _build_state_payload(previous_state)
 
@@ -137,23 +194,31 @@ async def handle_user_message(
 
         route_debug = route.model_dump(exclude_none=True)
 
-        print("\n=== CONVERSATION ROUTE ===")
-        print(route_debug)
+        log.debug("conversation.route", route=route_debug)
 
         if route.route == "listing_question":
-            return await _answer_listing_question(
+            return _TurnPlan(result=await _answer_listing_question(
                 user_message=user_message,
                 shown_listing=shown_listing,
                 previous_state=previous_state,
                 route_debug=route_debug,
-            )
+            ))
+
+        if route.route == "show_more":
+            return _TurnPlan(result=await _show_more(
+                user_message=user_message,
+                previous_state=previous_state,
+                result_context=result_context,
+                page_size=top_n,
+                route_debug=route_debug,
+            ))
 
         if route.route == "new_search":
             state = await build_search_request_adk_async(user_message)
         elif route.route == "search_update":
             state = await update_search_state_async(previous_state, user_message)
         else:
-            return {
+            return _TurnPlan(result={
                 "need_clarification": False,
                 "response_type": "other",
                 "answer": "I can help with a new search, updating the current search, or answering questions about a shown listing.",
@@ -164,7 +229,7 @@ async def handle_user_message(
                     "previous_state": previous_state_json,
                 },
                 "search_request": previous_state_json,
-            }
+            })
 
         parsed_intent_debug = {
             "router": route_debug,
@@ -183,31 +248,183 @@ async def handle_user_message(
 
     state_json = _build_orchestrate_intent_payload(state)
 
-    print("\n=== UPDATED STATE ===")
-    print(state_json)
+    log.debug("conversation.updated_state", state=state_json)
 
     resolved = resolve_required_search_context(state)
 
     if resolved.need_clarification:
-        return {
+        return _TurnPlan(result={
             "need_clarification": True,
             "questions": resolved.questions,
             "state": state_json,
             "parsed_intent": parsed_intent_debug,
             "search_request": state_json,
-        }
+        })
 
-    result = await orchestrate_search(
-        user_text=user_message,
-        intent=state_json,
+    return _TurnPlan(state=state, state_json=state_json, parsed_intent=parsed_intent_debug)
+
+
+async def handle_user_message(
+    user_message: str,
+    previous_state: Optional[SearchRequest] = None,
+    *,
+    source: str = "fixtures",
+    top_n: int = 5,
+    fallback_policy: FallbackPolicy | None = None,
+    max_items: int = MAX_ITEMS_HARD_CAP,
+    shown_listing: dict[str, Any] | None = None,
+    latest_result_context: dict[str, Any] | None = None,
+    result_context: SearchResultContext | None = None,
+    debug_timings: bool = DEBUG_TIMINGS,
+    llm_usage: LLMUsage | None = None,
+) -> Dict[str, Any]:
+    """
+    One conversational turn: route it, then search / page / answer.
+
+    llm_usage (optional, one per session) accumulates the turn's LLM calls;
+    with debug_timings, result["debug"] gets the timing breakdown and the
+    turn's LLM usage.
+
+    Runs handle_user_message_events with progress=False and returns the
+    "final" event's data.
+    """
+    result: Dict[str, Any] = {}
+
+    async for event in handle_user_message_events(
+        user_message,
+        previous_state,
+        source=source,
         top_n=top_n,
         fallback_policy=fallback_policy,
         max_items=max_items,
-        source=source,
-    )
+        shown_listing=shown_listing,
+        latest_result_context=latest_result_context,
+        result_context=result_context,
+        debug_timings=debug_timings,
+        llm_usage=llm_usage,
+        progress=False,
+    ):
+        if event["event"] == "final":
+            result = event["data"]
 
-    result["state"] = state_json
-    result["parsed_intent"] = parsed_intent_debug
-    result["search_request"] = state_json
+    return result
+
+
+def _finish_turn(
+    result: Dict[str, Any],
+    root: Span,
+    *,
+    debug_timings: bool,
+    llm_usage: LLMUsage | None,
+) -> None:
+    observe_trace(root)
+    if llm_usage is not None:
+        llm_usage.merge(usage_from_trace(root))
+    if debug_timings and root.is_root:
+        attach_timings(result, root)
+        attach_llm_usage(result, root)
 
-    return result
\ No newline at end of file
+
+async def handle_user_message_events(
+    user_message: str,
+    previous_state: Optional[SearchRequest] = None,
+    *,
+    source: str = "fixtures",
+    top_n: int = 5,
+    fallback_policy: FallbackPolicy | None = None,
+    max_items: int = MAX_ITEMS_HARD_CAP,
+    shown_listing: dict[str, Any] | None = None,
+    latest_result_context: dict[str, Any] | None = None,
+    result_context: SearchResultContext | None = None,
+    debug_timings: bool = DEBUG_TIMINGS,
+    llm_usage: LLMUsage | None = None,
+    progress: bool = True,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Progressive variant of handle_user_message.
+
+    Yields {"event": ..., "data": ...} dicts: "parsed_intent" once the turn
+    is routed, then the orchestrate_search_events stages, and always ends
+    with "final" carrying the same result handle_user_message returns.
+
+    With progress=False only the "final" event is produced.
+    """
+    root = start_span("turn")
+
+    async for event in iterate_in_span(
+        _turn_events(
+            user_message,
+            previous_state,
+            source=source,
+            top_n=top_n,
+            fallback_policy=fallback_policy,
+            max_items=max_items,
+            shown_listing=shown_listing,
+            latest_result_context=latest_result_context,
+            result_context=result_context,
+            progress=progress,
+        ),
+        root,
+    ):
+        if event["event"] == "final":
+            root.finish()
+            _finish_turn(event["data"], root, debug_timings=debug_timings, llm_usage=llm_usage)
+        yield event
+
+
+async def _turn_events(
+    user_message: str,
+    previous_state: Optional[SearchRequest],
+    *,
+    source: str,
+    top_n: int,
+    fallback_policy: FallbackPolicy | None,
+    max_items: int,
+    shown_listing: dict[str, Any] | None,
+    latest_result_context: dict[str, Any] | None,
+    result_context: SearchResultContext | None,
+    progress: bool,
+) -> AsyncIterator[Dict[str, Any]]:
+    with span("route_turn"):
+        plan = await _plan_turn(
+            user_message,
+            previous_state,
+            top_n=top_n,
+            shown_listing=shown_listing,
+            latest_result_context=latest_result_context,
+            result_context=result_context,
+        )
+    if plan.result is not None:
+        yield {"event": "final", "data": plan.result}
+        return
+
+    if not progress:
+        result = await orchestrate_search(
+            user_text=user_message,
+            intent=plan.state,
+            top_n=top_n,
+            fallback_policy=fallback_policy,
+            max_items=max_items,
+            source=source,
+            result_context=result_context,
+        )
+        yield {"event": "final", "data": _attach_turn_state(result, plan)}
+        return
+
+    yield {
+        "event": "parsed_intent",
+        "data": {"state": plan.state_json, "parsed_intent": plan.parsed_intent},
+    }
+
+    async for event in orchestrate_search_events(
+        user_text=user_message,
+        intent=plan.state,
+        top_n=top_n,
+        fallback_policy=fallback_policy,
+        max_items=max_items,
+        source=source,
+        result_context=result_context,
+    ):
+        if event["event"] == "final":
+            event = {"event": "final", "data": _attach_turn_state(event["data"], plan)}
+        yield event
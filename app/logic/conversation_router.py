@@ -1,21 +1,13 @@
 from __future__ import annotations
 
-import json
 import os
-import uuid
-from typing import Any, Optional
+from typing import Any
 
-from google.adk.agents.run_config import RunConfig
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai.types import Content, Part
-
-from app.agents.conversation_router_agent import build_conversation_router_agent
+from app.agents.conversation_router_agent import conversation_router_instruction, get_conversation_router_agent
+from app.agents.runner import run_agent_text
 from app.schemas.conversation_route import ConversationRouteDecision
 from app.schemas.query import SearchRequest
-
-APP_NAME = "booking-ai-agent"
-USER_ID = "local-user"
+from app.services.serialization import dump_model_json, dumps
 
 
 def _ensure_gemini_key() -> None:
@@ -38,13 +30,9 @@ def _build_router_prompt(
     previous_state: SearchRequest | None,
     latest_result_context: dict[str, Any] | None = None,
 ) -> str:
-    state_json = (
-        json.dumps(previous_state.model_dump(mode="json", exclude_none=True), ensure_ascii=False, indent=2)
-        if previous_state is not None
-        else "null"
-    )
+    state_json = dump_model_json(previous_state) if previous_state is not None else "null"
 
-    result_json = json.dumps(latest_result_context or {}, ensure_ascii=False, indent=2)
+    result_json = dumps(latest_result_context or {})
 
     return f"""
 Current search state:
@@ -66,39 +54,18 @@ async def route_conversation_async(
 ) -> ConversationRouteDecision:
     _ensure_gemini_key()
 
-    agent = build_conversation_router_agent()
-    session_service = InMemorySessionService()
-    runner = Runner(agent=agent, app_name=APP_NAME, session_service=session_service)
-
-    session_id = f"conversation-router-{uuid.uuid4().hex[:8]}"
-    await session_service.create_session(
-        app_name=APP_NAME,
-        user_id=USER_ID,
-        session_id=session_id,
-    )
-
     prompt = _build_router_prompt(
         user_message=user_message,
         previous_state=previous_state,
         latest_result_context=latest_result_context,
     )
 
-    msg = Content(role="user", parts=[Part.from_text(text=prompt)])
-    cfg = RunConfig(response_modalities=["TEXT"])
-
-    final_text: Optional[str] = None
-    async for ev in runner.run_async(
-        user_id=USER_ID,
-        session_id=session_id,
-        new_message=msg,
-        run_config=cfg,
-    ):
-        content = getattr(ev, "content", None)
-        if content and getattr(content, "parts", None):
-            for p in content.parts:
-                t = getattr(p, "text", None)
-                if t:
-                    final_text = (final_text or "") + t
+    final_text = await run_agent_text(
+        get_conversation_router_agent,
+        name="conversation_router",
+        instruction=conversation_router_instruction(),
+        prompt=prompt,
+    )
 
     if not final_text:
         return ConversationRouteDecision(
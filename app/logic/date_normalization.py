@@ -46,10 +46,14 @@ def normalize_intent_dates(intent, user_text: str, *, today: date | None = None)
     if check_in and check_out is None and nights is None:
         check_out = check_in + timedelta(days=1)
 
-    data = intent.model_dump()
-    data["check_in"] = check_in.isoformat() if check_in else None
-    data["check_out"] = check_out.isoformat() if check_out else None
-    return intent.__class__(**data)
+    # The intent is already validated: copy it with the new dates instead of
+    # dumping and re-validating every constraint.
+    return intent.model_copy(
+        update={
+            "check_in": check_in.isoformat() if check_in else None,
+            "check_out": check_out.isoformat() if check_out else None,
+        }
+    )
 
 
 def normalize_patch_dates(
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Tuple
+
+from app.schemas.match import Ternary
+
+
+# Ranking records *why* a listing scored the way it did as small tuples
+# (code, *args) holding references to the match objects; the text is only
+# rendered (render_why) for the results that are actually returned.
+#
+#   (MUST_FIELD, field, FieldMatch | None)      canonical must field
+#   (NICE_FIELD, field, FieldMatch)             nice field that matched
+#   (RESULT, result)                            numeric / property / occupancy
+#                                               result, rendered as result.why
+#   (CONSTRAINT, priority, decision, label)     constraint fallback resolution
+MUST_FIELD = "must_field"
+NICE_FIELD = "nice_field"
+RESULT = "result"
+CONSTRAINT = "constraint"
+
+WhyCode = Tuple[Any, ...]
+
+
+def _snippet(fm: Any) -> str | None:
+    if fm.evidence and fm.evidence[0].snippet:
+        return fm.evidence[0].snippet
+    return None
+
+
+def _render_must_field(field: Any, fm: Any) -> str:
+    if fm is None:
+        return f"{field.name}: missing match"
+
+    if fm.value == Ternary.YES:
+        return f"{field.name}: {_snippet(fm) or 'matched'}"
+
+    if fm.value == Ternary.UNCERTAIN:
+        return f"{field.name}: maybe (needs check)"
+
+    return f"{field.name}: not found"
+
+
+def _render_constraint(priority: str, decision: str, label: str) -> str:
+    if priority == "must":
+        if decision == "YES":
+            return f"CONSTRAINT_MATCH: {label} confirmed by listing text"
+        if decision == "NO":
+            return f"CONSTRAINT_FAIL: must constraint '{label}' not satisfied"
+        return f"CONSTRAINT_UNCERTAIN: must constraint '{label}' not confirmed"
+
+    if priority in {"nice", "nice_to_have"}:
+        if decision == "YES":
+            return f"CONSTRAINT_MATCH: nice-to-have '{label}' confirmed by listing text"
+        if decision == "NO":
+            return f"CONSTRAINT_NO_MATCH: nice-to-have '{label}' not satisfied"
+        return f"CONSTRAINT_UNCERTAIN: nice-to-have '{label}' not confirmed"
+
+    if priority == "forbidden":
+        if decision == "YES":
+            return f"CONSTRAINT_FAIL: forbidden constraint '{label}' detected"
+        if decision == "NO":
+            return f"CONSTRAINT_MATCH: forbidden constraint '{label}' not detected"
+        return f"CONSTRAINT_UNCERTAIN: forbidden constraint '{label}' unclear"
+
+    if decision == "YES":
+        return f"CONSTRAINT_MATCH: {label} confirmed, but priority is unknown"
+    if decision == "NO":
+        return f"CONSTRAINT_NO_MATCH: {label} not satisfied, but priority is unknown"
+    return f"CONSTRAINT_UNCERTAIN: {label} not confirmed"
+
+
+def render_why_code(code: WhyCode) -> str:
+    kind = code[0]
+    if kind == MUST_FIELD:
+        return _render_must_field(code[1], code[2])
+    if kind == NICE_FIELD:
+        return f"+ {code[1].name}: {_snippet(code[2]) or 'matched'}"
+    if kind == RESULT:
+        return code[1].why
+    if kind == CONSTRAINT:
+        return _render_constraint(code[1], code[2], code[3])
+    raise ValueError(f"unknown explanation code: {kind!r}")
+
+
+def render_why(codes: Iterable[WhyCode]) -> List[str]:
+    """Human-readable `why` lines, in the order the codes were recorded."""
+    return [render_why_code(code) for code in codes]
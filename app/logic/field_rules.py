@@ -1,5 +1,7 @@
 from __future__ import annotations
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 from app.schemas.fields import Field
@@ -155,4 +157,47 @@ FIELD_RULES: Dict[Field, FieldRule] = {
             "parking not available",
         ),
     ),
-}
\ No newline at end of file
+}
+
+
+@dataclass(frozen=True)
+class CompiledFieldRule:
+    """
+    FieldRule plus one precompiled pattern per alias list.
+
+    The patterns are a cheap prefilter: only signals that contain at least
+    one alias are passed on to find_best_signal_match.
+    """
+    rule: FieldRule
+    positive_pattern: re.Pattern[str] | None
+    negative_pattern: re.Pattern[str] | None
+
+
+def _alias_pattern(aliases: Tuple[str, ...]) -> re.Pattern[str] | None:
+    if not aliases:
+        return None
+    return re.compile("|".join(re.escape(a) for a in aliases))
+
+
+@lru_cache(maxsize=None)
+def get_compiled_field_rule(field: Field) -> CompiledFieldRule | None:
+    rule = FIELD_RULES.get(field)
+    if rule is None:
+        return None
+
+    return CompiledFieldRule(
+        rule=rule,
+        positive_pattern=_alias_pattern(rule.aliases),
+        negative_pattern=_alias_pattern(rule.negative_aliases),
+    )
+
+
+def compile_field_rules() -> Dict[Field, CompiledFieldRule]:
+    """Compile every rule up front (used by the startup warm-up)."""
+    compiled: Dict[Field, CompiledFieldRule] = {}
+    for field in FIELD_RULES:
+        rule = get_compiled_field_rule(field)
+        if rule is not None:
+            compiled[field] = rule
+    return compiled
+
@@ -1,37 +1,29 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
-import uuid
 from datetime import date
-from typing import Optional
 
-from google.adk.agents.run_config import RunConfig
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai.types import Content, Part
-
-from app.agents.intent_router_agent import IntentRoute, build_intent_router_agent
+from app.agents.intent_router_agent import IntentRoute, get_intent_router_agent, intent_router_instruction
+from app.agents.runner import run_agent_text
 from app.logic.date_normalization import normalize_intent_dates
 from app.logic.request_resolution import resolve_required_search_context
+from app.schemas.filters import SearchFilters
 from app.schemas.query import SearchRequest
-
-import asyncio
-from google.genai.errors import ClientError
+from app.services.llm_usage import llm_attempt
+from app.services.logs import get_logger
 
 
-APP_NAME = "booking-ai-agent"
-USER_ID = "local-user"
+log = get_logger(__name__)
 
 
-def _clean_filters(filters):
+def _clean_filters(filters: SearchFilters | None) -> SearchFilters | None:
     if not filters:
         return None
 
-    data = filters.model_dump()
-    cleaned = {k: v for k, v in data.items() if v is not None}
-    return cleaned or None
+    if all(getattr(filters, name) is None for name in SearchFilters.model_fields):
+        return None
+    return filters
 
 
 def _ensure_gemini_key() -> None:
@@ -57,53 +49,23 @@ async def _route_intent_via_adk(user_text: str) -> IntentRoute:
 
     for attempt in range(max_retries):
         try:
-            agent = build_intent_router_agent()
-            session_service = InMemorySessionService()
-            runner = Runner(agent=agent, app_name=APP_NAME, session_service=session_service)
-
-            session_id = f"intent-{uuid.uuid4().hex[:8]}"
-            await session_service.create_session(
-                app_name=APP_NAME,
-                user_id=USER_ID,
-                session_id=session_id,
-            )
-
-            msg = Content(role="user", parts=[Part.from_text(text=user_text)])
-            cfg = RunConfig(response_modalities=["TEXT"])
-
-            final_text: Optional[str] = None
-            async for ev in runner.run_async(
-                user_id=USER_ID,
-                session_id=session_id,
-                new_message=msg,
-                run_config=cfg,
-            ):
-                content = getattr(ev, "content", None)
-                if content and getattr(content, "parts", None):
-                    for p in content.parts:
-                        t = getattr(p, "text", None)
-                        if t:
-                            final_text = (final_text or "") + t
+            with llm_attempt(attempt):
+                final_text = await run_agent_text(
+                    get_intent_router_agent,
+                    name="intent_router",
+                    instruction=intent_router_instruction(),
+                    prompt=user_text,
+                )
 
             if not final_text:
                 raise ValueError("ADK returned empty response text")
 
             clean = _strip_json_fence(final_text)
-            payload = json.loads(clean)
-
-            if payload.get("filters") is None:
-                payload["filters"] = {}
-
-            if payload.get("constraints") is None:
-                payload["constraints"] = []
-
-            if payload.get("property_types") is None:
-                payload["property_types"] = []
-
-            if payload.get("occupancy_types") is None:
-                payload["occupancy_types"] = []
 
-            return IntentRoute.model_validate(payload)
+            # The one validation of the router output: IntentRoute turns
+            # null filters / lists into their defaults itself, everything
+            # downstream works on the typed intent.
+            return IntentRoute.model_validate_json(clean)
 
         except Exception as e:
             error_text = str(e)
@@ -122,7 +84,7 @@ async def _route_intent_via_adk(user_text: str) -> IntentRoute:
 
 
 async def route_intent_adk_async(user_text: str) -> IntentRoute:
-    print("ROUTE_INTENT_CALLED", user_text)
+    log.debug("intent_router.called", user_text=user_text)
     return await _route_intent_via_adk(user_text)
 
 
@@ -134,26 +96,24 @@ async def build_search_request_adk_async(user_text: str) -> SearchRequest:
     intent = await route_intent_adk_async(user_text)
     intent = normalize_intent_dates(intent, user_text)
 
-    print("\n=== PARSED INTENT ===")
-    print(intent.model_dump())
+    log.debug("intent_router.parsed_intent", intent=lambda: intent.model_dump(mode="json"))
 
     resolved = resolve_required_search_context(intent)
     clean_filters = _clean_filters(intent.filters)
 
-    req = SearchRequest(
-    city=resolved.city,
-    check_in=resolved.check_in,
-    check_out=resolved.check_out,
-    adults=intent.adults or 2,
-    children=intent.children or 0,
-    rooms=intent.rooms or 1,
-    filters=clean_filters,
-    property_types=intent.property_types or None,
-    occupancy_types=intent.occupancy_types or None,
-    constraints=intent.constraints,
-)
-    print("\n=== SEARCH REQUEST ===")
-    print(req.model_dump(mode="json", exclude_none=True))
+    req = SearchRequest.from_trusted(
+        city=resolved.city,
+        check_in=resolved.check_in,
+        check_out=resolved.check_out,
+        adults=intent.adults or 2,
+        children=intent.children or 0,
+        rooms=intent.rooms or 1,
+        filters=clean_filters,
+        property_types=intent.property_types or None,
+        occupancy_types=intent.occupancy_types or None,
+        constraints=list(intent.constraints),
+    )
+    log.debug("intent_router.search_request", request=lambda: req.model_dump(mode="json", exclude_none=True))
     return req
 
 
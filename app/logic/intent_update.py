@@ -2,17 +2,10 @@ from __future__ import annotations
 
 
 
-import json
 import os
-import uuid
-from typing import Optional
 
-from google.adk.agents.run_config import RunConfig
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai.types import Content, Part
-
-from app.agents.intent_update_agent import build_intent_update_agent
+from app.agents.intent_update_agent import get_intent_update_agent, intent_update_instruction
+from app.agents.runner import run_agent_text
 from app.logic.apply_intent_patch import apply_intent_patch
 from app.logic.date_normalization import normalize_patch_dates
 from app.logic.request_resolution import parse_iso_date
@@ -25,9 +18,10 @@ from app.schemas.constraints import (
 )
 from app.schemas.intent_patch import SearchIntentPatch
 from app.schemas.query import SearchRequest
+from app.services.logs import get_logger
+from app.services.serialization import dump_model_json
 
-APP_NAME = "booking-ai-agent"
-USER_ID = "local-user"
+log = get_logger(__name__)
 
 
 def _ensure_gemini_key() -> None:
@@ -48,11 +42,7 @@ def _strip_json_fence(text: str) -> str:
 
 
 def _build_update_prompt(previous_state: SearchRequest, user_message: str) -> str:
-    state_json = json.dumps(
-        previous_state.model_dump(mode="json", exclude_none=True),
-        ensure_ascii=False,
-        indent=2,
-    )
+    state_json = dump_model_json(previous_state)
     return f"""
 Current structured search state (source of truth):
 {state_json}
@@ -110,34 +100,13 @@ async def route_intent_update_patch_async(
     _ensure_gemini_key()
     
 
-    agent = build_intent_update_agent()
-    session_service = InMemorySessionService()
-    runner = Runner(agent=agent, app_name=APP_NAME, session_service=session_service)
-
-    session_id = f"intent-update-{uuid.uuid4().hex[:8]}"
-    await session_service.create_session(
-        app_name=APP_NAME,
-        user_id=USER_ID,
-        session_id=session_id,
-    )
-
     prompt = _build_update_prompt(previous_state, user_message)
-    msg = Content(role="user", parts=[Part.from_text(text=prompt)])
-    cfg = RunConfig(response_modalities=["TEXT"])
-
-    final_text: Optional[str] = None
-    async for ev in runner.run_async(
-        user_id=USER_ID,
-        session_id=session_id,
-        new_message=msg,
-        run_config=cfg,
-    ):
-        content = getattr(ev, "content", None)
-        if content and getattr(content, "parts", None):
-            for p in content.parts:
-                t = getattr(p, "text", None)
-                if t:
-                    final_text = (final_text or "") + t
+    final_text = await run_agent_text(
+        get_intent_update_agent,
+        name="intent_update",
+        instruction=intent_update_instruction(),
+        prompt=prompt,
+    )
 
     if not final_text:
         raise ValueError("Intent update agent returned empty response")
@@ -173,8 +142,7 @@ async def update_search_state_async(
 ) -> SearchRequest:
     patch = await route_intent_update_patch_async(previous_state, user_message)
 
-    print("\n=== INTENT UPDATE PATCH ===")
-    print(patch.model_dump(exclude_none=True))
+    log.debug("intent_update.patch", patch=lambda: patch.model_dump(mode="json", exclude_none=True))
 
     normalized_check_in, normalized_check_out = normalize_patch_dates(
         set_check_in=patch.set_check_in,
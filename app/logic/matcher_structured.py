@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Any, List, Tuple
+from typing import Any, Dict, List, Tuple
 
 from app.schemas.fields import Field
 from app.schemas.listing import ListingRaw
 from app.schemas.match import Evidence, EvidenceSource, FieldMatch, MatchReport, Ternary
 from app.schemas.query import SearchRequest
 
-from app.logic.field_rules import FIELD_RULES
+from app.logic.field_rules import get_compiled_field_rule
 from app.logic.listing_signals import collect_listing_signals, find_best_signal_match
 
 
@@ -152,7 +153,17 @@ def match_field_in_facilities(
     return FieldMatch(value=Ternary.NO, confidence=0.7, evidence=[])
 
 
-def match_listing_structured(listing: ListingRaw, request: SearchRequest) -> MatchReport:
+def match_listing_structured(
+    listing: ListingRaw,
+    request: SearchRequest,
+    *,
+    signals: List[ListingSignal] | None = None,
+    field_match_cache: Dict[Field, FieldMatch] | None = None,
+) -> MatchReport:
+    """
+    signals / field_match_cache let a session context reuse per-listing
+    work across search updates; only fields missing from the cache are matched.
+    """
     must_constraints, nice_constraints, _ = _constraints_by_priority(request)
 
     must_fields = _known_mapped_fields(must_constraints)
@@ -160,10 +171,16 @@ def match_listing_structured(listing: ListingRaw, request: SearchRequest) -> Mat
 
     requested_fields = list({*must_fields, *nice_fields})
 
-    field_matches = {
-        f: _match_field_via_rules(listing, f)
-        for f in requested_fields
-    }
+    field_matches: Dict[Field, FieldMatch] = {}
+    for f in requested_fields:
+        fm = field_match_cache.get(f) if field_match_cache is not None else None
+        if fm is None:
+            if signals is None:
+                signals = collect_listing_signals(listing)
+            fm = _match_field_via_rules(listing, f, signals=signals)
+            if field_match_cache is not None:
+                field_match_cache[f] = fm
+        field_matches[f] = fm
 
     hard_fail = [
         f
@@ -178,20 +195,38 @@ def match_listing_structured(listing: ListingRaw, request: SearchRequest) -> Mat
     )
 
 from app.logic.listing_signals import (
+    ListingSignal,
     collect_listing_signals,
     find_best_negative_signal_match,
     find_best_signal_match,
 )
 
-def _match_field_via_rules(listing: ListingRaw, field: Field) -> FieldMatch:
-    signals = collect_listing_signals(listing)
-    rule = FIELD_RULES.get(field)
+def _prefilter_signals(
+    signals: List[ListingSignal],
+    pattern: re.Pattern[str] | None,
+) -> List[ListingSignal]:
+    # Order is preserved, so find_best_signal_match tie-breaking is unchanged.
+    if pattern is None:
+        return []
+    return [s for s in signals if pattern.search(s.text)]
 
-    if rule is None:
+
+def _match_field_via_rules(
+    listing: ListingRaw,
+    field: Field,
+    signals: List[ListingSignal] | None = None,
+) -> FieldMatch:
+    if signals is None:
+        signals = collect_listing_signals(listing)
+    compiled = get_compiled_field_rule(field)
+
+    if compiled is None:
         return FieldMatch(value=Ternary.UNCERTAIN, evidence=[])
 
+    rule = compiled.rule
+
     best_positive = find_best_signal_match(
-        signals=signals,
+        signals=_prefilter_signals(signals, compiled.positive_pattern),
         aliases=rule.aliases,
         preferred_path_prefixes=rule.preferred_path_prefixes,
     )
@@ -209,7 +244,7 @@ def _match_field_via_rules(listing: ListingRaw, field: Field) -> FieldMatch:
         )
 
     best_negative = find_best_negative_signal_match(
-        signals=signals,
+        signals=_prefilter_signals(signals, compiled.negative_pattern),
         negative_aliases=rule.negative_aliases,
         preferred_path_prefixes=rule.preferred_path_prefixes,
     )
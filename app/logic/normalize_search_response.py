@@ -320,15 +320,58 @@ def _split_requested_vs_derived(
     return requested, derived
 
 
+class _ConstraintMetaResolver:
+    """
+    Request-level constraint lookup, built once per response.
+
+    Results only ever resolve by a field / attribute name, and the same few
+    names repeat on every item, so resolutions are memoized by name.
+    """
+
+    __slots__ = ("_lookup", "_resolved")
+
+    def __init__(self, req: SearchRequest) -> None:
+        self._lookup = _build_constraint_lookup(req)
+        self._resolved: dict[str, tuple[dict[str, Any] | None, str]] = {}
+
+    def resolve(self, name: str) -> tuple[dict[str, Any] | None, str]:
+        """(constraint meta or None, display name) for a field / attribute name."""
+        hit = self._resolved.get(name)
+        if hit is None:
+            constraint_meta = _resolve_constraint_meta(
+                lookup=self._lookup,
+                name=name,
+                mapped_fields=[name],
+            )
+            display_name = (
+                constraint_meta.get("normalized_text")
+                if constraint_meta and constraint_meta.get("normalized_text")
+                else name
+            )
+            hit = self._resolved[name] = (constraint_meta, display_name)
+        return hit
+
+
+_TERNARY_STATUS = {
+    Ternary.YES: "matched",
+    Ternary.UNCERTAIN: "uncertain",
+}
+
+
 def _collect_constraint_statuses(
     item: dict[str, Any],
-    req: SearchRequest,
+    resolver: _ConstraintMetaResolver,
 ) -> tuple[list[ConstraintStatus], list[ConstraintStatus], list[ConstraintStatus]]:
-    matched: list[ConstraintStatus] = []
-    uncertain: list[ConstraintStatus] = []
-    failed: list[ConstraintStatus] = []
+    buckets: dict[str, list[ConstraintStatus]] = {
+        "matched": [],
+        "uncertain": [],
+        "failed": [],
+    }
 
-    constraint_lookup = _build_constraint_lookup(req)
+    def _add(name: str, value: Any, reason: str | None) -> None:
+        constraint_meta, display_name = resolver.resolve(name)
+        status = _TERNARY_STATUS.get(value, "failed")
+        buckets[status].append(_status_bucket(display_name, status, reason, constraint_meta=constraint_meta))
 
     matches = item.get("matches") or {}
     for field, fm in matches.items():
@@ -336,98 +379,99 @@ def _collect_constraint_statuses(
             continue
 
         field_name = field.value if hasattr(field, "value") else str(field)
-        constraint_meta = _resolve_constraint_meta(
-            lookup=constraint_lookup,
-            name=field_name,
-            mapped_fields=[field_name],
-        )
-
-        display_name = (
-            constraint_meta.get("normalized_text")
-            if constraint_meta and constraint_meta.get("normalized_text")
-            else field_name
-        )
 
-        reason = None
         if getattr(fm, "evidence", None):
             ev = fm.evidence[0]
             reason = getattr(ev, "snippet", None) or getattr(fm, "why", None)
         else:
             reason = getattr(fm, "why", None)
 
-        if fm.value == Ternary.YES:
-            matched.append(_status_bucket(display_name, "matched", reason, constraint_meta=constraint_meta))
-        elif fm.value == Ternary.UNCERTAIN:
-            uncertain.append(_status_bucket(display_name, "uncertain", reason, constraint_meta=constraint_meta))
-        else:
-            failed.append(_status_bucket(display_name, "failed", reason, constraint_meta=constraint_meta))
+        _add(field_name, fm.value, reason)
 
     for nr in (item.get("numeric_results") or []):
-        attr_name = getattr(nr, "attribute", "numeric_constraint")
-        constraint_meta = _resolve_constraint_meta(
-            lookup=constraint_lookup,
-            name=attr_name,
-            mapped_fields=[attr_name],
-        )
-
-        display_name = (
-            constraint_meta.get("normalized_text")
-            if constraint_meta and constraint_meta.get("normalized_text")
-            else attr_name
-        )
-
-        reason = getattr(nr, "why", None)
-
-        if nr.value == Ternary.YES:
-            matched.append(_status_bucket(display_name, "matched", reason, constraint_meta=constraint_meta))
-        elif nr.value == Ternary.UNCERTAIN:
-            uncertain.append(_status_bucket(display_name, "uncertain", reason, constraint_meta=constraint_meta))
-        else:
-            failed.append(_status_bucket(display_name, "failed", reason, constraint_meta=constraint_meta))
+        _add(getattr(nr, "attribute", "numeric_constraint"), nr.value, getattr(nr, "why", None))
 
     property_result = item.get("property_result")
     if property_result is not None:
-        constraint_meta = _resolve_constraint_meta(
-            lookup=constraint_lookup,
-            name="property_type",
-            mapped_fields=["property_type"],
-        )
-        display_name = (
-            constraint_meta.get("normalized_text")
-            if constraint_meta and constraint_meta.get("normalized_text")
-            else "property_type"
-        )
-
-        if property_result.value == Ternary.YES:
-            matched.append(_status_bucket(display_name, "matched", property_result.why, constraint_meta=constraint_meta))
-        elif property_result.value == Ternary.UNCERTAIN:
-            uncertain.append(_status_bucket(display_name, "uncertain", property_result.why, constraint_meta=constraint_meta))
-        else:
-            failed.append(_status_bucket(display_name, "failed", property_result.why, constraint_meta=constraint_meta))
+        _add("property_type", property_result.value, property_result.why)
 
     occupancy_result = item.get("occupancy_result")
     if occupancy_result is not None:
-        constraint_meta = _resolve_constraint_meta(
-            lookup=constraint_lookup,
-            name="occupancy_type",
-            mapped_fields=["occupancy_type"],
-        )
-        display_name = (
-            constraint_meta.get("normalized_text")
-            if constraint_meta and constraint_meta.get("normalized_text")
-            else "occupancy_type"
-        )
+        _add("occupancy_type", occupancy_result.value, occupancy_result.why)
+
+    return _merge_constraint_resolution_statuses(
+        item,
+        buckets["matched"],
+        buckets["uncertain"],
+        buckets["failed"],
+    )
 
-        if occupancy_result.value == Ternary.YES:
-            matched.append(_status_bucket(display_name, "matched", occupancy_result.why, constraint_meta=constraint_meta))
-        elif occupancy_result.value == Ternary.UNCERTAIN:
-            uncertain.append(_status_bucket(display_name, "uncertain", occupancy_result.why, constraint_meta=constraint_meta))
-        else:
-            failed.append(_status_bucket(display_name, "failed", occupancy_result.why, constraint_meta=constraint_meta))
 
-    return _merge_constraint_resolution_statuses(item, matched, uncertain, failed)
+class _RequestFacts:
+    """Facts that depend only on the request, computed once per response."""
 
-def _collect_facts(item: dict[str, Any], req: SearchRequest) -> list[ResultFact]:
+    __slots__ = ("night_count", "night_count_fact", "budget_facts")
+
+    def __init__(self, req: SearchRequest) -> None:
+        self.night_count: int | None = None
+        self.night_count_fact: ResultFact | None = None
+        self.budget_facts: list[ResultFact] = []
+
+        if req.check_in and req.check_out:
+            night_count = (req.check_out - req.check_in).days
+            if night_count > 0:
+                self.night_count = night_count
+                self.night_count_fact = ResultFact(
+                    key="night_count",
+                    value=night_count,
+                    source="request",
+                )
+
+        if req.filters and req.filters.price:
+            pf = req.filters.price
+            if pf.max_amount is not None:
+                if pf.scope == "per_night" and self.night_count is not None:
+                    self.budget_facts.append(
+                        ResultFact(
+                            key="budget_total_derived",
+                            value=round(float(pf.max_amount) * self.night_count, 2),
+                            source="derived",
+                        )
+                    )
+                elif pf.scope == "total_stay":
+                    self.budget_facts.append(
+                        ResultFact(
+                            key="budget_total_derived",
+                            value=float(pf.max_amount),
+                            source="derived",
+                        )
+                    )
+
+            if pf.currency is not None:
+                self.budget_facts.append(
+                    ResultFact(
+                        key="budget_currency",
+                        value=pf.currency,
+                        source="request",
+                    )
+                )
+
+            if pf.scope is not None:
+                self.budget_facts.append(
+                    ResultFact(
+                        key="budget_scope",
+                        value=pf.scope,
+                        source="request",
+                    )
+                )
+
+
+def _collect_facts(item: dict[str, Any], request_facts: _RequestFacts) -> list[ResultFact]:
+    """
+    Per-result facts. Listing-level values come from what ranking already
+    evaluated (property / occupancy / numeric results); request-level facts
+    are shared across results.
+    """
     listing = item.get("listing")
     facts: list[ResultFact] = []
 
@@ -463,16 +507,8 @@ def _collect_facts(item: dict[str, Any], req: SearchRequest) -> list[ResultFact]
                 )
             )
 
-    if req.check_in and req.check_out:
-        night_count = (req.check_out - req.check_in).days
-        if night_count > 0:
-            facts.append(
-                ResultFact(
-                    key="night_count",
-                    value=night_count,
-                    source="request",
-                )
-            )
+    if request_facts.night_count_fact is not None:
+        facts.append(request_facts.night_count_fact)
 
     if listing is not None:
         price = getattr(listing, "price", None)
@@ -483,57 +519,16 @@ def _collect_facts(item: dict[str, Any], req: SearchRequest) -> list[ResultFact]
         if currency is not None:
             facts.append(ResultFact(key="listing_currency", value=currency, source="listing"))
 
-        if price is not None and req.check_in and req.check_out:
-            night_count = (req.check_out - req.check_in).days
-            if night_count > 0:
-                facts.append(
-                    ResultFact(
-                        key="listing_price_per_night_derived",
-                        value=round(float(price) / night_count, 2),
-                        source="derived",
-                    )
-                )
-
-    if req.filters and req.filters.price:
-        pf = req.filters.price
-        if pf.max_amount is not None:
-            if pf.scope == "per_night" and req.check_in and req.check_out:
-                night_count = (req.check_out - req.check_in).days
-                if night_count > 0:
-                    facts.append(
-                        ResultFact(
-                            key="budget_total_derived",
-                            value=round(float(pf.max_amount) * night_count, 2),
-                            source="derived",
-                        )
-                    )
-            elif pf.scope == "total_stay":
-                facts.append(
-                    ResultFact(
-                        key="budget_total_derived",
-                        value=float(pf.max_amount),
-                        source="derived",
-                    )
-                )
-
-        if pf.currency is not None:
-            facts.append(
-                ResultFact(
-                    key="budget_currency",
-                    value=pf.currency,
-                    source="request",
-                )
-            )
-
-        if pf.scope is not None:
+        if price is not None and request_facts.night_count is not None:
             facts.append(
                 ResultFact(
-                    key="budget_scope",
-                    value=pf.scope,
-                    source="request",
+                    key="listing_price_per_night_derived",
+                    value=round(float(price) / request_facts.night_count, 2),
+                    source="derived",
                 )
             )
 
+    facts.extend(request_facts.budget_facts)
     return facts
 
 
@@ -548,10 +543,14 @@ def normalize_search_response(
     request_summary = _request_summary(req, dropped_requests)
     results: list[NormalizedSearchResult] = []
 
+    # Request-level work happens once, not per result.
+    resolver = _ConstraintMetaResolver(req)
+    request_facts = _RequestFacts(req)
+
     for item in ranked[: max(0, top_n)]:
         listing = item.get("listing")
-        matched, uncertain, failed = _collect_constraint_statuses(item, req)
-        facts = _collect_facts(item, req)
+        matched, uncertain, failed = _collect_constraint_statuses(item, resolver)
+        facts = _collect_facts(item, request_facts)
 
         matched_requested_constraints, matched_derived_matches = _split_requested_vs_derived(matched)
         uncertain_requested_constraints, uncertain_derived_matches = _split_requested_vs_derived(uncertain)
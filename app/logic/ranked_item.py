@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional
+
+from app.logic.explanations import WhyCode, render_why
+from app.schemas.fields import Field
+from app.schemas.listing import ListingRaw
+from app.schemas.match import FieldMatch, MatchReport
+
+
+_MISSING = object()
+
+
+class RankedItem:
+    """
+    One candidate produced by structured ranking.
+
+    Holds references (listing, match report, per-filter results), never
+    copies. Fallback and selection fill the remaining slots in place:
+    constraint_resolution_results / fallback_resolved, then the
+    classification fields set by classify_ranked_item(). A slot that was
+    never assigned behaves like a missing dict key.
+
+    Scoring records explanations as codes (app.logic.explanations) in
+    why_codes; `why` renders them to text on access, so only the results
+    that are actually shown pay for the formatting.
+
+    The mapping-style accessors (item["score"], item.get(...), "x" in item,
+    item["why"] = ...) keep code written against the old per-listing dicts
+    working.
+    """
+
+    __slots__ = (
+        "listing",
+        "report",
+        "numeric_results",
+        "property_result",
+        "occupancy_result",
+        "score",
+        "matched_must_count",
+        "matched_must_total",
+        "constraint_resolution_results",
+        "fallback_resolved",
+        "selection_signals",
+        "eligibility_status",
+        "match_tier",
+        "selection_reasons",
+        "blocking_reasons",
+        "why_codes",
+        "_why",
+    )
+
+    _KEYS = frozenset(
+        (
+            "listing_name",
+            "listing_id",
+            "matches",
+            "why",
+            *(name for name in __slots__ if not name.startswith("_")),
+        )
+    )
+
+    def __init__(
+        self,
+        listing: ListingRaw,
+        report: MatchReport,
+        *,
+        numeric_results: List[Any],
+        property_result: Any = None,
+        occupancy_result: Any = None,
+        score: float = 0.0,
+        matched_must_count: int = 0,
+        matched_must_total: int = 0,
+        why_codes: Optional[List[WhyCode]] = None,
+    ) -> None:
+        self.listing = listing
+        self.report = report
+        self.numeric_results = numeric_results
+        self.property_result = property_result
+        self.occupancy_result = occupancy_result
+        self.score = score
+        self.matched_must_count = matched_must_count
+        self.matched_must_total = matched_must_total
+        self.why_codes: List[WhyCode] = why_codes if why_codes is not None else []
+        self._why: Optional[List[str]] = None
+
+    @property
+    def listing_name(self) -> str:
+        return self.listing.name
+
+    @property
+    def listing_id(self) -> Optional[str]:
+        return getattr(self.listing, "id", None)
+
+    @property
+    def matches(self) -> dict[Field, FieldMatch]:
+        return self.report.matches
+
+    @property
+    def why(self) -> List[str]:
+        if self._why is not None:
+            return self._why
+        return render_why(self.why_codes)
+
+    @why.setter
+    def why(self, value: List[str]) -> None:
+        # Explicit text (dict-style callers) replaces the rendered codes.
+        self._why = list(value)
+
+    def copy(self) -> RankedItem:
+        """Shallow copy: same listing / report / results, separate slots."""
+        clone = RankedItem.__new__(RankedItem)
+        for name in self.__slots__:
+            value = getattr(self, name, _MISSING)
+            if value is not _MISSING:
+                setattr(clone, name, value)
+        clone.why_codes = list(self.why_codes)
+        return clone
+
+    # --- dict compatibility ---
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING  # type: ignore[arg-type]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._KEYS:
+            return default
+        return getattr(self, key, default)
+
+    def __repr__(self) -> str:
+        return f"RankedItem({self.listing_name!r}, score={self.score})"
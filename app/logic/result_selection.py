@@ -1,18 +1,39 @@
 from __future__ import annotations
 
-from typing import Any
+from functools import partial
+from typing import Any, Callable, Union
 
+from app.logic.ranked_item import RankedItem
 
-def summarize_selection_signals(item: dict[str, Any]) -> dict[str, int]:
-    matched_constraints = item.get("matched_constraints") or []
-    uncertain_constraints = item.get("uncertain_constraints") or []
-    failed_constraints = item.get("failed_constraints") or []
 
-    if not matched_constraints and not uncertain_constraints and not failed_constraints:
-        matched_constraints, uncertain_constraints, failed_constraints = _derive_constraint_buckets(item)
+RankedLike = Union[RankedItem, dict[str, Any]]
 
-    must_total = int(item.get("matched_must_total", 0))
-    must_matched = int(item.get("matched_must_count", 0))
+
+def _field_getter(item: RankedLike) -> Callable[[str, Any], Any]:
+    """item.get for dicts; plain getattr for RankedItem (no mapping shim in the hot loop)."""
+    if isinstance(item, RankedItem):
+        return partial(getattr, item)
+    return item.get
+
+
+def summarize_selection_signals(item: RankedLike) -> dict[str, int]:
+    return _summarize_selection_signals(item, _field_getter(item))
+
+
+def _summarize_selection_signals(item: RankedLike, get: Callable[[str, Any], Any]) -> dict[str, int]:
+    if isinstance(item, RankedItem):
+        # Ranked items never carry precomputed buckets.
+        matched_constraints, uncertain_constraints, failed_constraints = _derive_constraint_buckets(item, get)
+    else:
+        matched_constraints = item.get("matched_constraints") or []
+        uncertain_constraints = item.get("uncertain_constraints") or []
+        failed_constraints = item.get("failed_constraints") or []
+
+        if not matched_constraints and not uncertain_constraints and not failed_constraints:
+            matched_constraints, uncertain_constraints, failed_constraints = _derive_constraint_buckets(item, get)
+
+    must_total = int(get("matched_must_total", 0))
+    must_matched = int(get("matched_must_count", 0))
     must_failed = 0
     must_uncertain = 0
 
@@ -33,7 +54,7 @@ def summarize_selection_signals(item: dict[str, Any]) -> dict[str, int]:
     unknown_uncertain_count = 0
     explicit_negative_count = 0
 
-    for result in item.get("constraint_resolution_results", []) or []:
+    for result in get("constraint_resolution_results", []) or []:
         resolution_status = str(result.get("resolution_status", "")).strip().lower()
         explicit_negative = bool(result.get("explicit_negative", False))
 
@@ -67,8 +88,9 @@ def summarize_selection_signals(item: dict[str, Any]) -> dict[str, int]:
     }
 
 
-def classify_ranked_item(item: dict[str, Any]) -> dict[str, Any]:
-    signals = summarize_selection_signals(item)
+def classify_ranked_item(item: RankedLike) -> RankedLike:
+    get = _field_getter(item)
+    signals = _summarize_selection_signals(item, get)
 
     must_total = signals["must_total"]
     must_matched = signals["must_matched"]
@@ -77,8 +99,8 @@ def classify_ranked_item(item: dict[str, Any]) -> dict[str, Any]:
     unknown_uncertain_count = signals["unknown_uncertain_count"]
     explicit_negative_count = signals["explicit_negative_count"]
 
-    property_result = item.get("property_result")
-    occupancy_result = item.get("occupancy_result")
+    property_result = get("property_result", None)
+    occupancy_result = get("occupancy_result", None)
 
     property_value = getattr(property_result, "value", None)
     occupancy_value = getattr(occupancy_result, "value", None)
@@ -98,7 +120,7 @@ def classify_ranked_item(item: dict[str, Any]) -> dict[str, Any]:
     selection_reasons: list[str] = []
     blocking_reasons: list[str] = []
 
-    resolution_results = item.get("constraint_resolution_results") or []
+    resolution_results = get("constraint_resolution_results", None) or []
 
     has_negative_resolution = any(
         str(getattr(result.get("status") if isinstance(result, dict) else result, "value", result.get("status") if isinstance(result, dict) else result)).upper()
@@ -188,6 +210,15 @@ def classify_ranked_item(item: dict[str, Any]) -> dict[str, Any]:
         else:
             match_tier = "weak"
 
+    if isinstance(item, RankedItem):
+        # Classified in place: the ranking owns its items.
+        item.selection_signals = signals
+        item.eligibility_status = eligibility_status
+        item.match_tier = match_tier
+        item.selection_reasons = selection_reasons
+        item.blocking_reasons = blocking_reasons
+        return item
+
     classified = dict(item)
     classified["selection_signals"] = signals
     classified["eligibility_status"] = eligibility_status
@@ -198,29 +229,37 @@ def classify_ranked_item(item: dict[str, Any]) -> dict[str, Any]:
     return classified
 
 
-def select_ranked_items(items: list[dict[str, Any]], top_n: int) -> list[dict[str, Any]]:
-    classified = [classify_ranked_item(item) for item in items]
+def _selection_view(item: RankedLike) -> tuple[Any, Any, Any, float]:
+    """(eligibility_status, match_tier, blocking_reasons, score) of a classified item."""
+    if isinstance(item, RankedItem):
+        return item.eligibility_status, item.match_tier, item.blocking_reasons, float(item.score)
+    return (
+        item.get("eligibility_status"),
+        item.get("match_tier"),
+        item.get("blocking_reasons"),
+        float(item.get("score", 0.0)),
+    )
 
-    def is_eligible(x):
-        return x.get("eligibility_status") == "eligible"
 
-    strong = [x for x in classified if is_eligible(x) and x.get("match_tier") == "strong"]
-    partial = [x for x in classified if is_eligible(x) and x.get("match_tier") == "partial"]
+def select_ranked_items(items: list[RankedLike], top_n: int) -> list[RankedLike]:
+    buckets: dict[str, list[tuple[float, RankedLike]]] = {"strong": [], "partial": [], "weak": []}
 
-    # 🔥 ВАЖНО: weak только безопасные
-    weak = [
-        x for x in classified
-        if is_eligible(x)
-        and x.get("match_tier") == "weak"
-        and not x.get("blocking_reasons")  # ← ключевой фикс
-    ]
+    for item in items:
+        classified = classify_ranked_item(item)
+        eligibility_status, match_tier, blocking_reasons, score = _selection_view(classified)
+        if eligibility_status != "eligible" or match_tier not in buckets:
+            continue
+        # 🔥 ВАЖНО: weak только безопасные
+        if match_tier == "weak" and blocking_reasons:  # ← ключевой фикс
+            continue
+        buckets[match_tier].append((score, classified))
 
     def sort_by_score(items):
-        return sorted(items, key=lambda x: float(x.get("score", 0.0)), reverse=True)
+        return [x for _, x in sorted(items, key=lambda pair: pair[0], reverse=True)]
 
-    strong = sort_by_score(strong)
-    partial = sort_by_score(partial)
-    weak = sort_by_score(weak)
+    strong = sort_by_score(buckets["strong"])
+    partial = sort_by_score(buckets["partial"])
+    weak = sort_by_score(buckets["weak"])
 
     selected = []
 
@@ -234,13 +273,14 @@ def select_ranked_items(items: list[dict[str, Any]], top_n: int) -> list[dict[st
 
 
 def _derive_constraint_buckets(
-    item: dict[str, Any],
+    item: RankedLike,
+    get: Callable[[str, Any], Any],
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
     matched: list[dict[str, Any]] = []
     uncertain: list[dict[str, Any]] = []
     failed: list[dict[str, Any]] = []
 
-    matches = item.get("matches") or {}
+    matches = get("matches", None) or {}
     for field, fm in matches.items():
         if fm is None:
             continue
@@ -257,7 +297,7 @@ def _derive_constraint_buckets(
         elif ternary_value == "no":
             failed.append(status_item)
 
-    for result in item.get("numeric_results", []) or []:
+    for result in get("numeric_results", []) or []:
         name = str(getattr(result, "attribute", "")).strip()
         ternary_value = getattr(getattr(result, "value", None), "value", None) or str(getattr(result, "value", "")).lower()
         if not name:
@@ -273,7 +313,7 @@ def _derive_constraint_buckets(
             failed.append(status_item)
 
     for attr_name in ("property_result", "occupancy_result"):
-        result = item.get(attr_name)
+        result = get(attr_name, None)
         if result is None:
             continue
 
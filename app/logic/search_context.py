@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.logic.listing_signals import ListingSignal, collect_listing_signals
+from app.logic.ranked_item import RankedItem
+from app.logic.result_ids import build_result_id
+from app.schemas.fallback_policy import FallbackPolicy
+from app.schemas.fields import Field
+from app.schemas.listing import ListingRaw
+from app.schemas.match import FieldMatch
+from app.schemas.query import SearchRequest
+
+
+RetrievalKey = tuple[Any, ...]
+
+
+def build_retrieval_key(
+    req: SearchRequest,
+    *,
+    source: str,
+    max_items: int,
+) -> RetrievalKey:
+    """
+    Everything that changes the retrieved candidate set.
+
+    Constraints and numeric filters are NOT part of the key: they only
+    affect ranking, so a patch touching them can reuse the candidates.
+    Property types are included because Apify search query uses them.
+    """
+    property_types = tuple(
+        sorted(getattr(pt, "value", str(pt)) for pt in (req.property_types or []))
+    )
+
+    return (
+        source,
+        int(max_items),
+        (req.city or "").strip().casefold(),
+        req.check_in.isoformat() if req.check_in else None,
+        req.check_out.isoformat() if req.check_out else None,
+        int(req.adults or 0),
+        int(req.children or 0),
+        int(req.rooms or 1),
+        property_types,
+    )
+
+
+@dataclass
+class SearchResultContext:
+    """
+    Per-session cache of the latest search.
+
+    Keeps the candidate set (after city/date/occupancy filters) together
+    with per-listing derived data, so a search update that keeps
+    city/dates/guests is re-ranked without a new retrieval:
+    - signals_by_listing: collect_listing_signals output per listing
+    - field_matches_by_listing: structured FieldMatch per listing/field
+    - resolutions: LLM fallback results keyed by listing + constraint
+
+    It also keeps the full selection order of the latest ranking plus a
+    cursor over it, so "show me more" is served without a new search.
+    """
+    retrieval_key: RetrievalKey | None = None
+    listings: list[ListingRaw] = field(default_factory=list)
+
+    signals_by_listing: dict[str, list[ListingSignal]] = field(default_factory=dict)
+    field_matches_by_listing: dict[str, dict[Field, FieldMatch]] = field(default_factory=dict)
+    resolutions: dict[tuple, Any] = field(default_factory=dict)
+
+    request: SearchRequest | None = None
+    dropped_requests: list[str] = field(default_factory=list)
+    fallback_policy: FallbackPolicy | None = None
+    ordered: list[RankedItem] = field(default_factory=list)
+    cursor: int = 0
+
+    def can_reuse(self, key: RetrievalKey) -> bool:
+        return self.retrieval_key is not None and self.retrieval_key == key
+
+    def reset(self, key: RetrievalKey, listings: list[ListingRaw]) -> None:
+        self.retrieval_key = key
+        self.listings = list(listings)
+        self.signals_by_listing = {}
+        self.field_matches_by_listing = {}
+        self.resolutions = {}
+        self.clear_ranking()
+
+    def remember_ranking(
+        self,
+        req: SearchRequest,
+        ordered: list[RankedItem],
+        *,
+        shown: int,
+        dropped_requests: list[str],
+        fallback_policy: FallbackPolicy,
+    ) -> None:
+        self.request = req
+        self.ordered = ordered
+        self.cursor = min(max(0, shown), len(ordered))
+        self.dropped_requests = list(dropped_requests or [])
+        self.fallback_policy = fallback_policy
+
+    def clear_ranking(self) -> None:
+        self.request = None
+        self.ordered = []
+        self.cursor = 0
+        self.dropped_requests = []
+        self.fallback_policy = None
+
+    def has_more(self) -> bool:
+        return self.request is not None and self.cursor < len(self.ordered)
+
+    def signals_for(self, listing: ListingRaw) -> list[ListingSignal]:
+        key = build_result_id(listing)
+        signals = self.signals_by_listing.get(key)
+        if signals is None:
+            signals = collect_listing_signals(listing)
+            self.signals_by_listing[key] = signals
+        return signals
+
+    def field_matches_for(self, listing: ListingRaw) -> dict[Field, FieldMatch]:
+        return self.field_matches_by_listing.setdefault(build_result_id(listing), {})
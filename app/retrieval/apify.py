@@ -10,6 +10,10 @@ from urllib.error import HTTPError, URLError
 
 from app.schemas.listing import ListingRaw
 from app.schemas.query import SearchRequest
+from app.services.cassette import get_cassette
+from app.services.logs import get_logger
+
+log = get_logger(__name__)
 
 
 def _iso(d: Any) -> str:
@@ -50,8 +54,10 @@ def _post_json_sync(url: str, payload: Dict[str, Any], timeout: int = 180) -> An
 
 class ApifyRetriever:
     async def get_candidates(self, req: SearchRequest, max_items: int) -> List[ListingRaw]:
+        cassette = get_cassette()
+
         token = os.getenv("APIFY_TOKEN")
-        if not token:
+        if not token and not cassette.offline:
             raise ValueError("Missing APIFY_TOKEN in environment")
 
         actor = os.getenv("APIFY_BOOKING_ACTOR", "voyager~booking-scraper")
@@ -95,7 +101,11 @@ class ApifyRetriever:
         )
 
         try:
-            items = await asyncio.to_thread(_post_json_sync, url, actor_input, 180)
+            items = await cassette.acall(
+                "apify.run_sync_get_dataset_items",
+                {"actor": actor, "input": actor_input},
+                lambda: asyncio.to_thread(_post_json_sync, url, actor_input, 180),
+            )
         except HTTPError as e:
             body = ""
             try:
@@ -104,11 +114,11 @@ class ApifyRetriever:
                 pass
 
             # ✅ Debug what we sent (so 1 paid run gives full diagnosis)
-            print("APIFY ACTOR INPUT:", json.dumps(actor_input, ensure_ascii=False, indent=2))
+            log.warning("apify.http_error", status=e.code, actor=actor, actor_input=actor_input)
 
             raise RuntimeError(f"Apify HTTPError {e.code}: {body}") from e
         except URLError as e:
-            print("APIFY ACTOR INPUT:", json.dumps(actor_input, ensure_ascii=False, indent=2))
+            log.warning("apify.url_error", error=str(e), actor=actor, actor_input=actor_input)
             raise RuntimeError(f"Apify URLError: {e}") from e
 
         if not isinstance(items, list):
@@ -117,7 +127,7 @@ class ApifyRetriever:
         out: List[ListingRaw] = []
         for x in items[:max_items]:
             try:
-                out.append(ListingRaw.model_validate(x))
+                out.append(ListingRaw.from_provider(x))
             except Exception:
                 continue
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from app.schemas.listing import ListingRaw
 from app.schemas.query import SearchRequest
@@ -11,12 +12,26 @@ from app.schemas.query import SearchRequest
 FIXTURES_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "listings_sample.json"
 
 
+@lru_cache(maxsize=8)
+def _load_fixture_listings(path: str, mtime_ns: int) -> Tuple[ListingRaw, ...]:
+    # mtime_ns is part of the cache key so an edited fixtures file is re-read.
+    if path.endswith(".jsonl"):
+        with open(path, "r", encoding="utf-8") as f:
+            return tuple(ListingRaw.model_validate_json(line) for line in f if line.strip())
+
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return tuple(ListingRaw.model_validate(x) for x in data)
+
+
+def load_fixture_listings(path: Path = FIXTURES_PATH) -> Tuple[ListingRaw, ...]:
+    """Parsed fixtures, cached per process (listings are treated as read-only)."""
+    return _load_fixture_listings(str(path), path.stat().st_mtime_ns)
+
 
 class FixturesRetriever:
     def __init__(self, path: Path = FIXTURES_PATH):
         self.path = path
 
     async def get_candidates(self, req: SearchRequest, max_items: int) -> List[ListingRaw]:
-        data = json.loads(self.path.read_text(encoding="utf-8"))
-        listings = [ListingRaw.model_validate(x) for x in data]
-        return listings[:max_items]
+        listings = load_fixture_listings(self.path)
+        return list(listings[:max_items])
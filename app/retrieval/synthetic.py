@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from app.logic.field_rules import FIELD_RULES
+from app.schemas.property_semantics import PropertyType
+
+
+# Synthetic corpus for scale benchmarks. Shapes follow the Booking actor
+# output (rooms/options/facilities/policies/highlights) and the fixtures, so
+# every pipeline stage (signals, field rules, numeric filters, occupancy,
+# FX conversion) has real work to do.
+
+CITIES: tuple[str, ...] = (
+    "Baku", "Tbilisi", "Istanbul", "Tokyo", "Kyoto", "Paris", "Lisbon",
+    "Barcelona", "Berlin", "Rome", "Prague", "Vienna", "Dubai", "Bangkok",
+)
+
+# (currency, approx units per USD)
+CURRENCIES: tuple[tuple[str, float], ...] = (
+    ("USD", 1.0),
+    ("EUR", 0.92),
+    ("GBP", 0.79),
+    ("AZN", 1.7),
+    ("GEL", 2.7),
+    ("TRY", 32.0),
+    ("JPY", 150.0),
+)
+
+PROPERTY_TYPES: tuple[str, ...] = tuple(pt.value for pt in PropertyType)
+
+_NUMBER_WORDS = {1: "one", 2: "two", 3: "three", 4: "four", 5: "five"}
+
+_LOCATION_PHRASES = (
+    "Quiet street but still central.",
+    "A few steps from the metro.",
+    "Located near the old town.",
+    "Close to shopping area and restaurants.",
+    "In a residential area, about 20 minutes from the center.",
+    "Sea view from the upper floors.",
+    "Next to a busy avenue, can be noisy at night.",
+)
+
+_POLICIES = (
+    ("Pets", ("Pets are allowed on request.", "Pets are not allowed.", "Pets are allowed. Charges may apply.")),
+    ("Smoking", ("Smoking is not allowed.", "Smoking allowed in designated areas.")),
+    ("Check-in", ("From 14:00 to 23:00.", "From 15:00. Late check-in on request.")),
+    ("Children", ("Children of all ages are welcome.", "Children aged 12 and above are welcome.")),
+    ("Parties", ("Parties/events are not allowed.", "Parties/events are allowed.")),
+)
+
+_HIGHLIGHTS = (
+    ("Great location", ("Guests loved walking around the area.",)),
+    ("Breakfast info", ("Continental, Buffet",)),
+    ("Free parking", ("Free private parking available on site.",)),
+    ("Top rated", ("Guests rated the cleanliness 9.2.",)),
+)
+
+_OPTION_CHOICES = (
+    "Free cancellation before check-in",
+    "Non-refundable",
+    "Breakfast included",
+    "No prepayment needed – pay at the property",
+    "Pay online",
+)
+
+_BED_TYPES = ("1 double bed", "2 single beds", "1 queen bed", "1 sofa bed", "1 king bed", "2 bunk beds")
+
+
+def _amenity_pool() -> List[tuple[str, ...]]:
+    # Positive aliases of the structured field rules, so matching has hits.
+    return [rule.aliases for rule in FIELD_RULES.values() if rule.aliases]
+
+
+_AMENITIES = _amenity_pool()
+
+
+def _bedroom_phrase(rng: random.Random, bedrooms: int) -> str:
+    if bedrooms == 0:
+        return rng.choice(("studio", "studio apartment"))
+    word = _NUMBER_WORDS.get(bedrooms, str(bedrooms))
+    return rng.choice(
+        (
+            f"{bedrooms}-bedroom",
+            f"{word} bedrooms" if bedrooms > 1 else "one bedroom",
+            f"{bedrooms} bedroom",
+        )
+    )
+
+
+def _area_phrase(rng: random.Random, area: int) -> str:
+    return rng.choice(
+        (
+            f"{area} sqm",
+            f"about {area} square meters",
+            f"{area} m²",
+            f"around {area} m2",
+        )
+    )
+
+
+def _bathroom_phrase(rng: random.Random, bathrooms: float) -> str:
+    if bathrooms == 1:
+        return rng.choice(("private bathroom", "1 bathroom", "one bathroom"))
+    if bathrooms == 1.5:
+        return "1.5 bathrooms"
+    return rng.choice((f"{int(bathrooms)} bathrooms", f"{_NUMBER_WORDS.get(int(bathrooms), int(bathrooms))} bathrooms"))
+
+
+def generate_listing(rng: random.Random, index: int, *, seed: int = 0) -> Dict[str, Any]:
+    """One Booking-like listing dict (valid ListingRaw input)."""
+    city = rng.choice(CITIES)
+    property_type = rng.choice(PROPERTY_TYPES)
+
+    bedrooms = rng.choices((0, 1, 2, 3, 4, 5), weights=(15, 35, 25, 15, 7, 3))[0]
+    area = int(max(12, rng.gauss(30 + bedrooms * 28, 12)))
+    bathrooms = rng.choices((1, 1.5, 2, 3), weights=(60, 10, 25, 5))[0]
+    persons = max(1, bedrooms * 2 + rng.choice((0, 0, 1, 2)))
+
+    currency, per_usd = rng.choice(CURRENCIES)
+    nightly_usd = max(15.0, rng.lognormvariate(4.3, 0.6))
+    nights = rng.randint(3, 10)
+    price = round(nightly_usd * nights * per_usd, 2)
+
+    start = date(2026, 1, 1) + timedelta(days=rng.randint(0, 300))
+    end = start + timedelta(days=rng.randint(7, 60))
+
+    amenities = [rng.choice(aliases) for aliases in rng.sample(_AMENITIES, k=rng.randint(3, min(10, len(_AMENITIES))))]
+    if rng.random() < 0.1:
+        amenities.append(rng.choice(("no balcony", "shared bathroom", "no air conditioning", "no kitchen")))
+
+    type_label = property_type.replace("_", " ")
+    sentences = [
+        f"{_bedroom_phrase(rng, bedrooms).capitalize()} {type_label} in {city} with {_area_phrase(rng, area)} of space.",
+        f"Has {_bathroom_phrase(rng, bathrooms)} and {', '.join(amenities[:3])}.",
+        rng.choice(_LOCATION_PHRASES),
+    ]
+    if rng.random() < 0.5:
+        sentences.append(f"Sleeps up to {persons} guests.")
+    if rng.random() < 0.3:
+        sentences.append(rng.choice(_LOCATION_PHRASES))
+
+    rooms: List[Dict[str, Any]] = []
+    for r in range(rng.choices((1, 2, 3), weights=(70, 20, 10))[0]):
+        room_persons = persons if r == 0 else max(1, persons - r)
+        room_name = f"{_bedroom_phrase(rng, bedrooms).title()} {type_label.title()}" if r == 0 else rng.choice(
+            ("Standard Room", "Deluxe Double Room", "Family Suite", "Superior Studio")
+        )
+        options = []
+        for _ in range(rng.randint(1, 3)):
+            options.append(
+                {
+                    "name": rng.choice(("Standard rate", "Flexible rate", "Non-refundable rate")),
+                    "price": round(price * rng.uniform(0.85, 1.2), 2),
+                    "currency": currency,
+                    "persons": room_persons,
+                    "yourChoices": rng.sample(_OPTION_CHOICES, k=rng.randint(1, 3)),
+                }
+            )
+        rooms.append(
+            {
+                "name": room_name,
+                "roomType": room_name,
+                "persons": room_persons,
+                "available": rng.random() > 0.05,
+                "bedTypes": rng.sample(_BED_TYPES, k=rng.randint(1, 2)),
+                "facilities": amenities[3:] + [_bathroom_phrase(rng, bathrooms)],
+                "options": options,
+            }
+        )
+
+    return {
+        "id": f"syn-{seed}-{index:07d}",
+        "name": f"{rng.choice(('Cozy', 'Modern', 'Sunny', 'Spacious', 'Central', 'Quiet', 'Family'))} {type_label.title()} {index}",
+        "city": city,
+        "url": f"https://example.com/synthetic/{seed}/{index}",
+        "price": price,
+        "currency": currency,
+        "rating": round(rng.uniform(6.0, 9.9), 1),
+        "stars": rng.choice((None, 2, 3, 4, 5)),
+        "property_type": property_type,
+        "available_dates": {"check_in": start.isoformat(), "check_out": end.isoformat()},
+        "description": " ".join(sentences),
+        "facilities": [{"name": a} for a in amenities],
+        "rooms": rooms,
+        "policies": [
+            {"title": title, "content": rng.choice(contents)}
+            for title, contents in rng.sample(_POLICIES, k=rng.randint(1, len(_POLICIES)))
+        ],
+        "highlights": [
+            {"title": title, "contents": list(contents)}
+            for title, contents in rng.sample(_HIGHLIGHTS, k=rng.randint(0, 2))
+        ],
+    }
+
+
+def iter_synthetic_listings(count: int, *, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Deterministic for a given (count, seed); listing i is independent of count."""
+    for i in range(count):
+        # Per-listing RNG: a prefix of a larger corpus equals the smaller corpus.
+        yield generate_listing(random.Random(f"{seed}:{i}"), i, seed=seed)
+
+
+def write_synthetic_corpus(path: Path, count: int, *, seed: int = 0) -> int:
+    """
+    Stream count listings to path without holding the corpus in memory.
+
+    .jsonl -> one listing per line; anything else -> a JSON array
+    (the fixtures format).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    as_jsonl = path.suffix == ".jsonl"
+
+    written = 0
+    with path.open("w", encoding="utf-8") as f:
+        if not as_jsonl:
+            f.write("[\n")
+        for item in iter_synthetic_listings(count, seed=seed):
+            line = json.dumps(item, ensure_ascii=False)
+            if as_jsonl:
+                f.write(line + "\n")
+            else:
+                f.write(("," if written else "") + line + "\n")
+            written += 1
+        if not as_jsonl:
+            f.write("]\n")
+
+    return written
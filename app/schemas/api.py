@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+from app.config.settings import DEBUG_TIMINGS, MAX_ITEMS_HARD_CAP, TOP_N_DEFAULT
+
+
+class MessageRequest(BaseModel):
+    """One conversational turn for POST /v1/messages."""
+    session_id: str | None = None
+    message: str = Field(min_length=1)
+
+    source: Literal["fixtures", "apify"] = "fixtures"
+    top_n: int = Field(default=TOP_N_DEFAULT, ge=1, le=50)
+    max_items: int = Field(default=MAX_ITEMS_HARD_CAP, ge=1, le=MAX_ITEMS_HARD_CAP)
+
+    shown_listing: dict[str, Any] | None = None
+    latest_result_context: dict[str, Any] | None = None
+
+    # Per-stage timing breakdown under result["debug"]["timings"].
+    debug_timings: bool = DEBUG_TIMINGS
+
+
+class SearchToolRequest(BaseModel):
+    """Direct orchestrate_search call for POST /v1/search."""
+    user_text: str = ""
+    intent: dict[str, Any]
+
+    source: Literal["fixtures", "apify"] = "fixtures"
+    top_n: int = Field(default=TOP_N_DEFAULT, ge=1, le=MAX_ITEMS_HARD_CAP)
+    max_items: int = Field(default=MAX_ITEMS_HARD_CAP, ge=1, le=MAX_ITEMS_HARD_CAP)
+    fallback_enabled: bool = True
+    fallback_top_k: int = Field(default=5, ge=0)
+
+    debug_timings: bool = DEBUG_TIMINGS
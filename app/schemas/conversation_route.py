@@ -9,6 +9,7 @@ ConversationRouteType = Literal[
     "search_update",
     "listing_question",
     "new_search",
+    "show_more",
     "other",
 ]
 
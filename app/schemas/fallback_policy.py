@@ -14,7 +14,7 @@ class FallbackPolicy(BaseModel):
 
     max_constraints_per_listing: int = 3
 
-    model: str = get_gemini_model()
+    model: str = Field(default_factory=get_gemini_model)
 
     def normalized_top_k(self) -> int:
         return max(0, self.top_k)
@@ -1,8 +1,10 @@
 # app/schemas/listing.py
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, List, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
 
 
 class RoomOption(BaseModel):
@@ -32,6 +34,90 @@ class Room(BaseModel):
     options: List[RoomOption] = Field(default_factory=list)
 
 
+class _RawView:
+    """
+    Read-only доступ по атрибутам к сырому dict провайдера: без валидации
+    и без копирования. Отсутствующий ключ -> AttributeError, как у extra
+    полей pydantic-модели, так что getattr(x, "field", default) работает
+    одинаково для модели и для view.
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data.get('name')!r})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        # Принимается только сам view; model_dump() / JSON отдают сырой dict
+        # провайдера (тот же, что пришёл на вход).
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda view: view._data),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        return {"type": "object"}
+
+
+class RoomOptionView(_RawView):
+    """RoomOption поверх сырого dict (см. ListingRaw.from_provider)."""
+    __slots__ = ()
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._data.get("name")
+
+    @property
+    def currency(self) -> Optional[str]:
+        return self._data.get("currency")
+
+    @property
+    def price(self) -> Optional[float]:
+        # та же коэрсия, что у RoomOption.price; мусор -> None
+        value = self._data.get("price")
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+
+class RoomView(_RawView):
+    """Room поверх сырого dict (см. ListingRaw.from_provider)."""
+    __slots__ = ("_options",)
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        super().__init__(data)
+        self._options: Optional[List[RoomOptionView]] = None
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._data.get("name")
+
+    @property
+    def facilities(self) -> List[Any]:
+        return self._data.get("facilities") or []
+
+    @property
+    def options(self) -> List[RoomOptionView]:
+        if self._options is None:
+            self._options = [
+                RoomOptionView(o) for o in self._data.get("options") or () if isinstance(o, dict)
+            ]
+        return self._options
+
+
 class ListingRaw(BaseModel):
     """
     ListingRaw = минимальный контракт под то, что реально приходит из Apify/Booking actor.
@@ -67,7 +153,28 @@ class ListingRaw(BaseModel):
     facilities: List[Any] = Field(default_factory=list)
 
     # Rooms
-    rooms: List[Room] = Field(default_factory=list)
+    # Room после валидации; RoomView у listing из from_provider (сырой dict
+    # провайдера, сериализуется как есть).
+    rooms: List[Union[Room, RoomView]] = Field(default_factory=list)
 
     # На будущее: можно хранить “сырой” блок
     raw: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_provider(cls, item: Dict[str, Any]) -> "ListingRaw":
+        """
+        Listing из payload провайдера (Apify/Booking) с ленивой валидацией.
+
+        Eager-валидируются только объявленные поля верхнего уровня
+        (id, name, price, description, facilities, ...). rooms не
+        превращаются в модели Room/RoomOption: вместо этого RoomView поверх
+        сырых dict — occupancy, numeric extraction и collect_listing_signals
+        читают их через getattr по мере надобности. Extra-поля (reviews,
+        images, policies...) остаются ссылками на исходный payload.
+
+        model_dump() отдаёт rooms как исходные dict провайдера.
+        """
+        hot = {k: v for k, v in item.items() if k != "rooms"}
+        listing = cls.model_validate(hot)
+        listing.rooms = [RoomView(r) for r in item.get("rooms") or () if isinstance(r, dict)]
+        return listing
@@ -37,4 +37,16 @@ class SearchRequest(BaseModel):
     def validate_date_range(self):
         if self.check_in and self.check_out and self.check_out <= self.check_in:
             raise ValueError("check_out must be after check_in")
-        return self
\ No newline at end of file
+        return self
+
+    @classmethod
+    def from_trusted(cls, **values) -> "SearchRequest":
+        """
+        Build from parts that are already validated and typed (dates,
+        SearchFilters, UserConstraint objects coming from an IntentRoute or
+        another SearchRequest) without validating them again.
+
+        LLM / client JSON is validated once at the boundary; only the
+        date-range invariant is re-checked here.
+        """
+        return cls.model_construct(**values).validate_date_range()
\ No newline at end of file
@@ -7,6 +7,7 @@ from apify_client import ApifyClient
 
 from app.schemas.query import SearchRequest
 from app.schemas.listing import ListingRaw
+from app.services.cassette import get_cassette
 
 
 class ApifyBookingService:
@@ -28,12 +29,15 @@ class ApifyBookingService:
         self.token = token or os.getenv("APIFY_TOKEN")
         self.actor_id = actor_id or os.getenv("APIFY_BOOKING_ACTOR_ID")
 
-        if not self.token:
+        if not self.token and not get_cassette().offline:
             raise ValueError("APIFY_TOKEN is missing (env var).")
         if not self.actor_id:
             raise ValueError("APIFY_BOOKING_ACTOR_ID is missing (env var).")
 
-        self.client = ApifyClient(self.token)
+        self.client = ApifyClient(
+            self.token,
+            api_url=os.getenv("APIFY_BASE_URL", "https://api.apify.com"),
+        )
 
     def _build_actor_input(self, request: SearchRequest) -> Dict[str, Any]:
         run_input: Dict[str, Any] = {
@@ -59,13 +63,25 @@ class ApifyBookingService:
         run_input = self._build_actor_input(request)
         run_input["maxItems"] = limit
 
-        run = self.client.actor(self.actor_id).call(run_input=run_input)
-        dataset_id = run.get("defaultDatasetId")
-        if not dataset_id:
-            raise RuntimeError("Apify run returned no defaultDatasetId")
+        def _fetch_items() -> List[Dict[str, Any]]:
+            run = self.client.actor(self.actor_id).call(run_input=run_input)
+            # apify-client 2.x returns a dict, 3.x a Run model.
+            if isinstance(run, dict):
+                dataset_id = run.get("defaultDatasetId")
+            else:
+                dataset_id = getattr(run, "default_dataset_id", None)
+            if not dataset_id:
+                raise RuntimeError("Apify run returned no defaultDatasetId")
+            return list(self.client.dataset(dataset_id).iterate_items())
+
+        raw_items = get_cassette().call(
+            "apify.actor_call",
+            {"actor": self.actor_id, "input": run_input},
+            _fetch_items,
+        )
 
         items: List[ListingRaw] = []
-        for it in self.client.dataset(dataset_id).iterate_items():
+        for it in raw_items:
             if isinstance(it, dict):
-                items.append(ListingRaw(**it))
+                items.append(ListingRaw.from_provider(it))
         return items
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator, Literal, TypeVar
+
+from app.config.settings import CASSETTE_LATENCY_MS, CASSETTE_MODE, CASSETTE_PATH
+from app.services.llm_usage import LLMCall, is_llm_kind, llm_call
+from app.services.tracing import span
+
+
+T = TypeVar("T")
+
+CassetteMode = Literal["live", "record", "replay", "stub"]
+CASSETTE_MODES: tuple[str, ...] = ("live", "record", "replay", "stub")
+
+StubFn = Callable[[dict[str, Any]], Any]
+
+# Constraint ids are uuid4 and end up inside prompts (state JSON); they must
+# not make two otherwise identical requests hash differently.
+_UUID_RE = re.compile(
+    r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b",
+    re.IGNORECASE,
+)
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay/stub mode when there is no recorded or stub response."""
+
+
+def _canonicalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return _UUID_RE.sub("<uuid>", value)
+    if isinstance(value, dict):
+        return {str(k): _canonicalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(v) for v in value]
+    return value
+
+
+def canonical_request_key(kind: str, request: dict[str, Any]) -> str:
+    """Stable hash of (kind, request): sorted keys, compact JSON, uuids masked."""
+    blob = json.dumps(
+        {"kind": kind, "request": _canonicalize(request)},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _prompt_chars(request: dict[str, Any]) -> int:
+    return sum(len(v) for v in request.values() if isinstance(v, str))
+
+
+def _fixture_items(request: dict[str, Any]) -> list[dict[str, Any]]:
+    from app.retrieval.fixtures import load_fixture_listings
+
+    actor_input = request.get("input") or {}
+    limit = int(actor_input.get("maxItems") or 10)
+    return [
+        listing.model_dump(mode="json", exclude_none=True)
+        for listing in load_fixture_listings()[:limit]
+    ]
+
+
+def _stub_intent_repair(request: dict[str, Any]) -> str:
+    try:
+        return json.dumps(json.loads(request.get("contents") or "{}").get("input_intent") or {})
+    except (TypeError, ValueError):
+        return "{}"
+
+
+DEFAULT_STUBS: dict[str, StubFn] = {
+    "adk.intent_router": lambda request: "{}",
+    "adk.conversation_router": lambda request: json.dumps(
+        {"route": "search_update", "reason": "stub"}
+    ),
+    "adk.intent_update": lambda request: "{}",
+    "gemini.constraint_resolution": lambda request: json.dumps(
+        {
+            "status": "UNCERTAIN",
+            "answer": "UNCERTAIN",
+            "snippet": None,
+            "source": "llm_fallback",
+            "reason": "stub response",
+        }
+    ),
+    # Empty text makes the answer generator use the deterministic formatter.
+    "gemini.answer": lambda request: "",
+    "gemini.answer_stream": lambda request: [],
+    "gemini.intent_repair": _stub_intent_repair,
+    "apify.run_sync_get_dataset_items": _fixture_items,
+    "apify.actor_call": _fixture_items,
+}
+
+
+class Cassette:
+    """
+    Transport layer for external calls (Gemini, ADK agents, Apify).
+
+    Modes:
+    - live: call the service, nothing is stored (default)
+    - record: call the service and append request/response to the cassette
+    - replay: answer from the cassette only; a miss raises CassetteMiss
+    - stub: answer from stub functions (per call kind), never from network
+
+    Entries are keyed by canonical_request_key(kind, request) and stored as
+    JSONL, so a cassette can be recorded once and replayed at any concurrency.
+    latency_seconds is added to every replayed/stubbed call.
+
+    LLM kinds (gemini.*, adk.*) are accounted via llm_usage.llm_call; token
+    counts seen while recording are stored with the entry and reported again
+    on replay.
+    """
+
+    def __init__(
+        self,
+        mode: CassetteMode = "live",
+        path: str | Path | None = None,
+        *,
+        stubs: dict[str, StubFn] | None = None,
+        latency_seconds: float = 0.0,
+    ) -> None:
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode={mode!r}; expected one of {CASSETTE_MODES}")
+        if mode in ("record", "replay") and path is None:
+            raise ValueError(f"Cassette mode={mode!r} requires a path")
+
+        self.mode = mode
+        self.path = Path(path) if path is not None else None
+        self.stubs = {**DEFAULT_STUBS, **(stubs or {})}
+        self.latency_seconds = max(0.0, latency_seconds)
+
+        self._entries: dict[str, Any] | None = None
+        self._usage: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+    @property
+    def offline(self) -> bool:
+        return self.mode in ("replay", "stub")
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def _load(self) -> dict[str, Any]:
+        if self._entries is not None:
+            return self._entries
+
+        with self._lock:
+            if self._entries is None:
+                entries: dict[str, Any] = {}
+                if self.path is not None and self.path.exists():
+                    with self.path.open("r", encoding="utf-8") as f:
+                        for line in f:
+                            line = line.strip()
+                            if not line:
+                                continue
+                            row = json.loads(line)
+                            entries[row["key"]] = row["response"]
+                            if row.get("usage"):
+                                self._usage[row["key"]] = row["usage"]
+                self._entries = entries
+        return self._entries
+
+    def _offline_response(self, kind: str, request: dict[str, Any], call: LLMCall | None = None) -> Any:
+        if self.mode == "stub":
+            stub = self.stubs.get(kind)
+            if stub is None:
+                self.misses += 1
+                raise CassetteMiss(f"No stub for kind={kind!r}")
+            self.hits += 1
+            return stub(request)
+
+        key = canonical_request_key(kind, request)
+        entries = self._load()
+        if key not in entries:
+            self.misses += 1
+            raise CassetteMiss(f"No recorded response for kind={kind!r} key={key[:12]}")
+        self.hits += 1
+        usage = self._usage.get(key)
+        if call is not None and usage:
+            call.prompt_tokens = usage.get("prompt_tokens", 0)
+            call.response_tokens = usage.get("response_tokens", 0)
+            call.total_tokens = usage.get("total_tokens", 0)
+        return entries[key]
+
+    def record(
+        self,
+        kind: str,
+        request: dict[str, Any],
+        response: Any,
+        *,
+        call: LLMCall | None = None,
+    ) -> None:
+        if self.path is None:
+            return
+
+        key = canonical_request_key(kind, request)
+        row = {
+            "key": key,
+            "kind": kind,
+            "request": request,
+            "response": response,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if call is not None and call.total_tokens:
+            row["usage"] = {
+                "prompt_tokens": call.prompt_tokens,
+                "response_tokens": call.response_tokens,
+                "total_tokens": call.total_tokens,
+            }
+        line = json.dumps(row, ensure_ascii=False, default=str)
+
+        entries = self._load()
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            entries[key] = response
+            if "usage" in row:
+                self._usage[key] = row["usage"]
+            self.recorded += 1
+
+    def _account(self, kind: str, request: dict[str, Any]) -> Any:
+        if not is_llm_kind(kind):
+            return nullcontext()
+        return llm_call(kind, model=request.get("model"), transport=self.mode)
+
+    def call(self, kind: str, request: dict[str, Any], live: Callable[[], T]) -> T:
+        """Sync entry point (for calls made inside asyncio.to_thread)."""
+        with span(f"external.{kind}", transport=self.mode) as sp, self._account(kind, request) as call:
+            if sp is not None:
+                sp.set(prompt_chars=_prompt_chars(request))
+
+            if self.offline:
+                if self.latency_seconds:
+                    time.sleep(self.latency_seconds)
+                return self._offline_response(kind, request, call)
+
+            response = live()
+            if self.mode == "record":
+                self.record(kind, request, response, call=call)
+            return response
+
+    async def acall(
+        self,
+        kind: str,
+        request: dict[str, Any],
+        live: Callable[[], Awaitable[T]],
+    ) -> T:
+        with span(f"external.{kind}", transport=self.mode) as sp, self._account(kind, request) as call:
+            if sp is not None:
+                sp.set(prompt_chars=_prompt_chars(request))
+
+            if self.offline:
+                if self.latency_seconds:
+                    await asyncio.sleep(self.latency_seconds)
+                return self._offline_response(kind, request, call)
+
+            response = await live()
+            if self.mode == "record":
+                self.record(kind, request, response, call=call)
+            return response
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "path": str(self.path) if self.path is not None else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "recorded": self.recorded,
+        }
+
+
+_CASSETTE: Cassette | None = None
+
+
+def get_cassette() -> Cassette:
+    """Process-wide cassette, configured from LLM_CASSETTE_* env vars."""
+    global _CASSETTE
+    if _CASSETTE is None:
+        _CASSETTE = Cassette(
+            CASSETTE_MODE,  # type: ignore[arg-type]
+            CASSETTE_PATH if CASSETTE_MODE in ("record", "replay") else None,
+            latency_seconds=CASSETTE_LATENCY_MS / 1000.0,
+        )
+    return _CASSETTE
+
+
+def set_cassette(cassette: Cassette | None) -> None:
+    global _CASSETTE
+    _CASSETTE = cassette
+
+
+@contextmanager
+def use_cassette(cassette: Cassette) -> Iterator[Cassette]:
+    global _CASSETTE
+    previous = _CASSETTE
+    _CASSETTE = cassette
+    try:
+        yield cassette
+    finally:
+        _CASSETTE = previous
@@ -8,6 +8,10 @@ from pathlib import Path
 from typing import Any
 from urllib import request as urlrequest
 
+from app.services.logs import get_logger
+from app.services.tracing import incr, span
+
+log = get_logger(__name__)
 
 
 _DEFAULT_FX_API_URL = "https://api.frankfurter.dev/v2/rates?base=USD"
@@ -48,10 +52,10 @@ def _api_url() -> str:
     return os.getenv("FX_API_URL", _DEFAULT_FX_API_URL)
 
 
-import requests
-
-
 def _read_json_from_url(url: str, timeout: int = 20) -> dict[str, Any] | list[dict[str, Any]]:
+    # requests costs ~80 ms to import and is only needed on a cache miss.
+    import requests
+
     resp = requests.get(
         url,
         headers={
@@ -165,22 +169,63 @@ def _fetch_latest_snapshot() -> FxSnapshot:
     )
 
 
+# In-process copy of the last fresh snapshot, keyed by cache path,
+# so conversions don't re-read the JSON file every time.
+_memory_snapshot: tuple[str, FxSnapshot] | None = None
+
+
+def _remember_snapshot(snapshot: FxSnapshot) -> None:
+    global _memory_snapshot
+    _memory_snapshot = (str(_cache_path()), snapshot)
+
+
+def _memory_cached_snapshot() -> FxSnapshot | None:
+    if _memory_snapshot is None:
+        return None
+
+    path, snapshot = _memory_snapshot
+    if path != str(_cache_path()) or not _snapshot_is_fresh(snapshot):
+        return None
+    return snapshot
+
+
+def fx_snapshot_status() -> dict[str, Any] | None:
+    """Age / staleness of the snapshot conversions would use (for metrics)."""
+    snapshot = _memory_cached_snapshot() or _load_cached_snapshot()
+    if snapshot is None:
+        return None
+    return {
+        "age_seconds": round((_utc_now() - snapshot.fetched_at).total_seconds(), 3),
+        "stale": snapshot.is_stale or not _snapshot_is_fresh(snapshot),
+    }
+
+
 def get_fx_snapshot() -> FxSnapshot | None:
-    print("FX DEBUG: get_fx_snapshot called")
-    print("FX DEBUG: cache path =", _cache_path().resolve())
+    in_memory = _memory_cached_snapshot()
+    if in_memory is not None:
+        incr("fx_cache_hits")
+        return in_memory
+
+    incr("fx_cache_misses")
     cached = _load_cached_snapshot()
-    print("FX DEBUG: cached exists =", cached is not None)
+    log.debug(
+        "fx.snapshot_lookup",
+        cache_path=lambda: str(_cache_path().resolve()),
+        cached=cached is not None,
+        base=cached.base if cached else None,
+        rates=len(cached.rates) if cached else 0,
+        fresh=bool(cached and _snapshot_is_fresh(cached)),
+    )
 
     if cached and _snapshot_is_fresh(cached):
-        print("FX DEBUG: cached base =", cached.base)
-        print("FX DEBUG: cached rates count =", len(cached.rates))
-        print("FX DEBUG: cached fresh =", _snapshot_is_fresh(cached))
+        _remember_snapshot(cached)
         return cached
 
     try:
-        fresh = _fetch_latest_snapshot()
+        with span("external.fx_rates"):
+            fresh = _fetch_latest_snapshot()
     except Exception as e:
-        print("FX DEBUG: fetch failed:", repr(e))
+        log.warning("fx.fetch_failed", error=repr(e), has_cached=cached is not None)
         if cached:
             return FxSnapshot(
                 base=cached.base,
@@ -192,6 +237,7 @@ def get_fx_snapshot() -> FxSnapshot | None:
         return None
 
     _save_snapshot(fresh)
+    _remember_snapshot(fresh)
     return fresh
 
 
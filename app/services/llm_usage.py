@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from app.config.settings import LLM_PRICES_JSON
+from app.services.tracing import Span, current_span
+
+
+# USD per 1M tokens: (input, output). Longest model-name prefix wins;
+# LLM_PRICES_JSON='{"gemini-2.5-flash": [0.3, 2.5]}' overrides / extends.
+DEFAULT_PRICES_PER_MILLION: dict[str, tuple[float, float]] = {
+    "gemini-2.5-pro": (1.25, 10.0),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.0-flash-lite": (0.075, 0.30),
+}
+
+
+def _load_prices() -> dict[str, tuple[float, float]]:
+    prices = dict(DEFAULT_PRICES_PER_MILLION)
+    if LLM_PRICES_JSON:
+        for model, pair in json.loads(LLM_PRICES_JSON).items():
+            prices[model] = (float(pair[0]), float(pair[1]))
+    return prices
+
+
+_PRICES = _load_prices()
+
+
+def _price_for(model: str | None) -> tuple[float, float] | None:
+    if not model:
+        return None
+    name = model.removeprefix("models/")
+    best: str | None = None
+    for prefix in _PRICES:
+        if name.startswith(prefix) and (best is None or len(prefix) > len(best)):
+            best = prefix
+    return _PRICES[best] if best is not None else None
+
+
+def estimate_cost_usd(model: str | None, prompt_tokens: int, response_tokens: int) -> float | None:
+    price = _price_for(model)
+    if price is None:
+        return None
+    return (prompt_tokens * price[0] + response_tokens * price[1]) / 1_000_000
+
+
+def is_rate_limited_error(exc: BaseException) -> bool:
+    text = str(exc)
+    return "429" in text or "RESOURCE_EXHAUSTED" in text or "ResourceExhausted" in exc.__class__.__name__
+
+
+@dataclass
+class LLMCall:
+    """One LLM call (one attempt). stage is the cassette kind, e.g. "gemini.answer"."""
+    stage: str
+    model: str | None = None
+    transport: str = "live"
+    attempt: int = 0
+    prompt_tokens: int = 0
+    response_tokens: int = 0
+    total_tokens: int = 0
+    latency_ms: float = 0.0
+    error: bool = False
+    rate_limited: bool = False
+
+    @property
+    def cost_usd(self) -> float | None:
+        return estimate_cost_usd(self.model, self.prompt_tokens, self.response_tokens)
+
+
+@dataclass
+class UsageTotals:
+    calls: int = 0
+    retries: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    prompt_tokens: int = 0
+    response_tokens: int = 0
+    total_tokens: int = 0
+    latency_ms: float = 0.0
+    cost_usd: float = 0.0
+
+    def add(self, call: LLMCall) -> None:
+        self.calls += 1
+        self.retries += 1 if call.attempt > 0 else 0
+        self.errors += 1 if call.error else 0
+        self.rate_limited += 1 if call.rate_limited else 0
+        self.prompt_tokens += call.prompt_tokens
+        self.response_tokens += call.response_tokens
+        self.total_tokens += call.total_tokens
+        self.latency_ms += call.latency_ms
+        self.cost_usd += call.cost_usd or 0.0
+
+    def merge(self, other: UsageTotals) -> None:
+        for name in self.__dataclass_fields__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "prompt_tokens": self.prompt_tokens,
+            "response_tokens": self.response_tokens,
+            "total_tokens": self.total_tokens,
+            "latency_ms": round(self.latency_ms, 3),
+            "cost_usd": round(self.cost_usd, 6),
+        }
+
+
+@dataclass
+class LLMUsage:
+    """Aggregated LLM usage (a request, a session, or the whole process)."""
+    total: UsageTotals = field(default_factory=UsageTotals)
+    by_stage: dict[str, UsageTotals] = field(default_factory=dict)
+    by_model: dict[str, UsageTotals] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, call: LLMCall) -> None:
+        with self._lock:
+            self.total.add(call)
+            self.by_stage.setdefault(call.stage, UsageTotals()).add(call)
+            self.by_model.setdefault(call.model or "unknown", UsageTotals()).add(call)
+
+    def merge(self, other: LLMUsage) -> None:
+        with self._lock:
+            self.total.merge(other.total)
+            for key, totals in other.by_stage.items():
+                self.by_stage.setdefault(key, UsageTotals()).merge(totals)
+            for key, totals in other.by_model.items():
+                self.by_model.setdefault(key, UsageTotals()).merge(totals)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self.total.to_dict(),
+                "by_stage": {k: v.to_dict() for k, v in sorted(self.by_stage.items())},
+                "by_model": {k: v.to_dict() for k, v in sorted(self.by_model.items())},
+            }
+
+
+# Everything this process spent (exposed by /metrics).
+PROCESS_USAGE = LLMUsage()
+
+_CURRENT_CALL: ContextVar[LLMCall | None] = ContextVar("current_llm_call", default=None)
+_ATTEMPT: ContextVar[int] = ContextVar("llm_attempt", default=0)
+
+
+def is_llm_kind(kind: str) -> bool:
+    return kind.startswith(("gemini.", "adk."))
+
+
+@contextmanager
+def llm_attempt(attempt: int) -> Iterator[None]:
+    """Mark LLM calls inside as attempt N of a retry loop (N > 0 counts as a retry)."""
+    token = _ATTEMPT.set(attempt)
+    try:
+        yield
+    finally:
+        _ATTEMPT.reset(token)
+
+
+def record_usage_metadata(metadata: Any) -> None:
+    """
+    Copy token counts from a genai usage_metadata (response.usage_metadata,
+    a stream chunk's, or an ADK event's) onto the current LLM call.
+
+    Later non-empty counts replace earlier ones: streams report running totals.
+    """
+    call = _CURRENT_CALL.get()
+    if call is None or metadata is None:
+        return
+
+    prompt = getattr(metadata, "prompt_token_count", None)
+    candidates = getattr(metadata, "candidates_token_count", None)
+    thoughts = getattr(metadata, "thoughts_token_count", None)
+    total = getattr(metadata, "total_token_count", None)
+
+    if prompt is not None:
+        call.prompt_tokens = int(prompt)
+    if candidates is not None or thoughts is not None:
+        # Thinking tokens are billed as output.
+        call.response_tokens = int(candidates or 0) + int(thoughts or 0)
+    if total is not None:
+        call.total_tokens = int(total)
+    elif prompt is not None or candidates is not None:
+        call.total_tokens = call.prompt_tokens + call.response_tokens
+
+
+def _finish(call: LLMCall) -> None:
+    PROCESS_USAGE.add(call)
+
+    span = current_span()
+    if span is not None:
+        span.set(
+            llm_model=call.model,
+            llm_attempt=call.attempt,
+            prompt_tokens=call.prompt_tokens,
+            response_tokens=call.response_tokens,
+            total_tokens=call.total_tokens,
+        )
+        if call.cost_usd is not None:
+            span.set(cost_usd=round(call.cost_usd, 6))
+        if call.error:
+            span.set(error=True, rate_limited=call.rate_limited)
+
+
+@contextmanager
+def llm_call(stage: str, *, model: str | None, transport: str = "live") -> Iterator[LLMCall]:
+    """
+    Account one LLM call: latency, attempt number, errors / 429s, and the
+    token counts reported through record_usage_metadata() inside the block.
+    """
+    call = LLMCall(stage=stage, model=model, transport=transport, attempt=_ATTEMPT.get())
+    previous = _CURRENT_CALL.get()
+    # set() + set(previous): the block may span async generator steps.
+    _CURRENT_CALL.set(call)
+    started = time.perf_counter()
+    try:
+        yield call
+    except BaseException as exc:
+        call.error = True
+        call.rate_limited = is_rate_limited_error(exc)
+        raise
+    finally:
+        call.latency_ms = (time.perf_counter() - started) * 1000
+        _CURRENT_CALL.set(previous)
+        _finish(call)
+
+
+def usage_from_trace(root: Span) -> LLMUsage:
+    """Per-request usage: every LLM call recorded on spans under root."""
+    usage = LLMUsage()
+
+    def _walk(span: Span) -> None:
+        attrs = span.attrs
+        if "llm_model" in attrs:
+            call = LLMCall(
+                stage=span.name.removeprefix("external."),
+                model=attrs.get("llm_model"),
+                transport=attrs.get("transport", "live"),
+                attempt=attrs.get("llm_attempt", 0),
+                prompt_tokens=attrs.get("prompt_tokens", 0),
+                response_tokens=attrs.get("response_tokens", 0),
+                total_tokens=attrs.get("total_tokens", 0),
+                latency_ms=span.duration_ms or 0.0,
+                error=attrs.get("error", False),
+                rate_limited=attrs.get("rate_limited", False),
+            )
+            usage.add(call)
+        for child in span.children:
+            _walk(child)
+
+    _walk(root)
+    return usage
+
+
+def attach_llm_usage(result: dict[str, Any], root: Span) -> dict[str, Any]:
+    """Put the request's LLM usage under result["debug"]["llm_usage"]."""
+    debug = result.get("debug")
+    if not isinstance(debug, dict):
+        debug = result["debug"] = {}
+    debug["llm_usage"] = usage_from_trace(root).to_dict()
+    return result
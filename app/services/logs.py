@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import logging
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Any
+
+from app.config.settings import LOG_DEBUG_SAMPLE_RATE, LOG_FORMAT, LOG_LEVEL
+from app.services.serialization import dumps
+from app.services.tracing import current_span
+
+
+# Structured logging on top of stdlib logging.
+#
+# log.debug("intent_router.parsed_intent", intent=lambda: intent.model_dump())
+#
+# - the level check comes first: a disabled call does no formatting and
+#   never evaluates callable fields;
+# - callable field values are evaluated lazily, only for emitted records;
+# - sample=<0..1> keeps only that share of records (DEBUG records default
+#   to LOG_DEBUG_SAMPLE_RATE);
+# - fields travel on the record and are rendered by JsonFormatter / TextFormatter.
+
+_ROOT_LOGGER = "booking_ai"
+
+
+def _resolve(value: Any) -> Any:
+    return value() if callable(value) else value
+
+
+class StructuredLogger:
+    __slots__ = ("_logger",)
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self._logger = logger
+
+    @property
+    def name(self) -> str:
+        return self._logger.name
+
+    def is_enabled_for(self, level: int) -> bool:
+        return self._logger.isEnabledFor(level)
+
+    def log(self, level: int, event: str, *, sample: float | None = None, exc_info: Any = None, **fields: Any) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
+
+        if sample is None and level <= logging.DEBUG:
+            sample = LOG_DEBUG_SAMPLE_RATE
+        if sample is not None and sample < 1.0 and random.random() >= sample:
+            return
+
+        resolved = {key: _resolve(value) for key, value in fields.items()}
+        self._logger.log(
+            level,
+            event,
+            exc_info=exc_info,
+            extra={"event_fields": resolved},
+            stacklevel=3,
+        )
+
+    def debug(self, event: str, **fields: Any) -> None:
+        self.log(logging.DEBUG, event, **fields)
+
+    def info(self, event: str, **fields: Any) -> None:
+        self.log(logging.INFO, event, **fields)
+
+    def warning(self, event: str, **fields: Any) -> None:
+        self.log(logging.WARNING, event, **fields)
+
+    def error(self, event: str, **fields: Any) -> None:
+        self.log(logging.ERROR, event, **fields)
+
+
+def get_logger(name: str) -> StructuredLogger:
+    """Logger under the project namespace ("app.logic.x" -> "booking_ai.app.logic.x")."""
+    return StructuredLogger(logging.getLogger(f"{_ROOT_LOGGER}.{name}"))
+
+
+def _record_fields(record: logging.LogRecord) -> dict[str, Any]:
+    return getattr(record, "event_fields", None) or {}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, event, span, fields..."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "logger": record.name.removeprefix(f"{_ROOT_LOGGER}."),
+            "event": record.getMessage(),
+        }
+        span = getattr(record, "span", None)
+        if span:
+            payload["span"] = span
+        payload.update(_record_fields(record))
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return dumps(payload)
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable: "<time> LEVEL logger event key=value ..."."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        head = f"{self.formatTime(record, '%H:%M:%S')} {record.levelname:<7} {record.name.removeprefix(_ROOT_LOGGER + '.')} {record.getMessage()}"
+        fields = " ".join(
+            f"{key}={dumps(value)}"
+            for key, value in _record_fields(record).items()
+        )
+        text = f"{head} {fields}" if fields else head
+        if record.exc_info:
+            text += "\n" + self.formatException(record.exc_info)
+        return text
+
+
+class _SpanFilter(logging.Filter):
+    # Tags records with the current tracing span, so logs line up with timings.
+    def filter(self, record: logging.LogRecord) -> bool:
+        span = current_span()
+        record.span = span.name if span is not None else None
+        return True
+
+
+_CONFIGURED_HANDLER: logging.Handler | None = None
+
+
+def configure_logging(
+    level: str | int = LOG_LEVEL,
+    fmt: str = LOG_FORMAT,
+    *,
+    stream: Any = None,
+) -> logging.Logger:
+    """
+    Install one stderr handler on the project logger (idempotent: a second
+    call replaces it). fmt: "json" | "text".
+    """
+    global _CONFIGURED_HANDLER
+
+    root = logging.getLogger(_ROOT_LOGGER)
+    if _CONFIGURED_HANDLER is not None:
+        root.removeHandler(_CONFIGURED_HANDLER)
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+    handler.addFilter(_SpanFilter())
+
+    root.addHandler(handler)
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+    root.propagate = False
+    _CONFIGURED_HANDLER = handler
+    return root
+
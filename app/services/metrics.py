@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+import math
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from app.services.tracing import Span
+
+
+# In-process Prometheus-style metrics, rendered in the text exposition format
+# (version 0.0.4) by render_prometheus().
+#
+# Pipeline metrics are not incremented stage by stage: every finished request
+# trace (a root "turn" / "orchestrate_search" span) is folded in by
+# observe_trace(), so the spans stay the single source of instrumentation.
+# Values that already live elsewhere (LLM usage, FX snapshot age, service
+# counters) are read at render time through collectors.
+
+_PREFIX = "booking"
+
+# Seconds; roughly the Prometheus client defaults, extended for LLM stages.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.label_names: LabelValues = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name}: expected labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()) -> None:
+        super().__init__(name, help_text, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters only go up")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> (per-bucket counts, sum, count)
+        self._series: dict[LabelValues, tuple[list[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._series.get(key) or ([0] * len(self.buckets), 0.0, 0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._series[key] = (counts, total + value, count + 1)
+
+    def count(self, **labels: Any) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted((key, (list(c), s, n)) for key, (c, s, n) in self._series.items())
+        for key, (counts, total, count) in items:
+            for bound, bucket_count in zip(self.buckets, counts):
+                labels = _format_labels(self.label_names, key, f'le="{_format_value(bound)}"')
+                yield f"{self.name}_bucket{labels} {bucket_count}"
+            labels = _format_labels(self.label_names, key, 'le="+Inf"')
+            yield f"{self.name}_bucket{labels} {count}"
+            yield f"{self.name}_sum{_format_labels(self.label_names, key)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.label_names, key)} {count}"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+# A collector returns ready-made metrics, built fresh at render time.
+Collector = Callable[[], Iterable[_Metric]]
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: dict[str, Collector] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.label_names != metric.label_names:
+                    raise ValueError(f"metric {metric.name} already registered differently")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labels, buckets))
+
+    def register_collector(self, key: str, collector: Collector) -> None:
+        """Add (or replace, by key) a render-time collector."""
+        with self._lock:
+            self._collectors[key] = collector
+
+    def unregister_collector(self, key: str) -> None:
+        with self._lock:
+            self._collectors.pop(key, None)
+
+    def collect(self) -> list[_Metric]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.values())
+        for collector in collectors:
+            metrics.extend(collector())
+        return metrics
+
+    def reset(self) -> None:
+        """Zero every registered metric (tests, benchmark runs)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+REGISTRY = MetricsRegistry()
+
+
+def render_prometheus(registry: MetricsRegistry = REGISTRY) -> str:
+    """Text exposition format; metrics without samples are left out."""
+    lines: list[str] = []
+    for metric in sorted(registry.collect(), key=lambda m: m.name):
+        samples = list(metric.samples())
+        if samples:
+            lines.extend(metric.header())
+            lines.extend(samples)
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def write_prometheus(path: str | Path, registry: MetricsRegistry = REGISTRY) -> Path:
+    """Dump the current metrics to a .prom file (node_exporter textfile style)."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(target.suffix + ".tmp")
+    tmp.write_text(render_prometheus(registry), encoding="utf-8")
+    tmp.replace(target)
+    return target
+
+
+# ---------------------------------------------------------------------------
+# Pipeline metrics, folded in from finished traces
+# ---------------------------------------------------------------------------
+
+REQUESTS = REGISTRY.counter(
+    f"{_PREFIX}_requests_total", "Finished pipeline requests by kind (root span name).", ["kind"]
+)
+REQUEST_SECONDS = REGISTRY.histogram(
+    f"{_PREFIX}_request_duration_seconds", "End-to-end pipeline request latency.", ["kind"]
+)
+STAGE_SECONDS = REGISTRY.histogram(
+    f"{_PREFIX}_stage_duration_seconds", "Latency of one pipeline stage span.", ["stage"]
+)
+EXTERNAL_SECONDS = REGISTRY.histogram(
+    f"{_PREFIX}_external_call_duration_seconds",
+    "Latency of external calls (LLM, FX) as seen by the pipeline.",
+    ["kind", "transport"],
+)
+CANDIDATES = REGISTRY.counter(
+    f"{_PREFIX}_stage_candidates_total",
+    "Candidates entering (in) and leaving (out) each pipeline stage.",
+    ["stage", "direction"],
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    f"{_PREFIX}_cache_lookups_total", "Cache lookups by cache and result (hit|miss).", ["cache", "result"]
+)
+FALLBACK_RESOLUTIONS = REGISTRY.counter(
+    f"{_PREFIX}_fallback_resolutions_total",
+    "Fallback constraint resolutions by outcome (llm|cache_hit).",
+    ["outcome"],
+)
+
+# span attr -> (cache, result)
+_CACHE_ATTRS: dict[str, tuple[str, str]] = {
+    "fx_cache_hits": ("fx", "hit"),
+    "fx_cache_misses": ("fx", "miss"),
+    "resolution_cache_hits": ("resolution", "hit"),
+    "llm_resolutions": ("resolution", "miss"),
+}
+
+
+def _span_cache_lookups(span: Span) -> Iterator[tuple[str, str, int]]:
+    attrs = span.attrs
+    if span.name == "retrieval" and "cache_hit" in attrs:
+        yield "retrieval", "hit" if attrs["cache_hit"] else "miss", 1
+    for attr, (cache, result) in _CACHE_ATTRS.items():
+        if attrs.get(attr):
+            yield cache, result, attrs[attr]
+
+
+def cache_lookups(root: Span) -> dict[str, dict[str, int]]:
+    """Cache hits / misses recorded anywhere in a trace: {cache: {"hit": n, "miss": n}}."""
+    totals: dict[str, dict[str, int]] = {}
+
+    def _walk(span: Span) -> None:
+        for cache, result, n in _span_cache_lookups(span):
+            counts = totals.setdefault(cache, {"hit": 0, "miss": 0})
+            counts[result] += n
+        for child in span.children:
+            _walk(child)
+
+    _walk(root)
+    return totals
+
+
+def _observe_span(span: Span) -> None:
+    attrs = span.attrs
+    seconds = (span.duration_ms or 0.0) / 1000
+
+    if span.name.startswith("external."):
+        EXTERNAL_SECONDS.observe(
+            seconds, kind=span.name.removeprefix("external."), transport=attrs.get("transport", "live")
+        )
+    elif not span.is_root:
+        STAGE_SECONDS.observe(seconds, stage=span.name)
+
+    if "candidates" in attrs:
+        CANDIDATES.inc(attrs["candidates"], stage=span.name, direction="out")
+    if "candidates_in" in attrs:
+        CANDIDATES.inc(attrs["candidates_in"], stage=span.name, direction="in")
+    if "candidates_out" in attrs:
+        CANDIDATES.inc(attrs["candidates_out"], stage=span.name, direction="out")
+
+    for cache, result, n in _span_cache_lookups(span):
+        CACHE_LOOKUPS.inc(n, cache=cache, result=result)
+
+    if attrs.get("llm_resolutions"):
+        FALLBACK_RESOLUTIONS.inc(attrs["llm_resolutions"], outcome="llm")
+    if attrs.get("resolution_cache_hits"):
+        FALLBACK_RESOLUTIONS.inc(attrs["resolution_cache_hits"], outcome="cache_hit")
+
+    for child in span.children:
+        _observe_span(child)
+
+
+def observe_trace(root: Span) -> None:
+    """Fold one finished request trace into the pipeline metrics (roots only)."""
+    if not root.is_root:
+        return
+    REQUESTS.inc(kind=root.name)
+    REQUEST_SECONDS.observe((root.duration_ms or 0.0) / 1000, kind=root.name)
+    _observe_span(root)
+
+
+# ---------------------------------------------------------------------------
+# Render-time collectors
+# ---------------------------------------------------------------------------
+
+def _llm_metrics() -> list[_Metric]:
+    from app.services.llm_usage import PROCESS_USAGE
+
+    calls = Counter(f"{_PREFIX}_llm_calls_total", "LLM calls by stage (retries included).", ["stage"])
+    retries = Counter(f"{_PREFIX}_llm_retries_total", "LLM retry attempts by stage.", ["stage"])
+    errors = Counter(f"{_PREFIX}_llm_errors_total", "Failed LLM calls by stage.", ["stage"])
+    rate_limited = Counter(
+        f"{_PREFIX}_llm_rate_limited_total", "LLM calls rejected with 429 / RESOURCE_EXHAUSTED.", ["stage"]
+    )
+    tokens = Counter(f"{_PREFIX}_llm_tokens_total", "LLM tokens by stage and direction.", ["stage", "direction"])
+    cost = Counter(f"{_PREFIX}_llm_cost_usd_total", "Estimated LLM spend in USD by model.", ["model"])
+
+    usage = PROCESS_USAGE.to_dict()
+    for stage, totals in usage["by_stage"].items():
+        calls.inc(totals["calls"], stage=stage)
+        retries.inc(totals["retries"], stage=stage)
+        errors.inc(totals["errors"], stage=stage)
+        rate_limited.inc(totals["rate_limited"], stage=stage)
+        tokens.inc(totals["prompt_tokens"], stage=stage, direction="prompt")
+        tokens.inc(totals["response_tokens"], stage=stage, direction="response")
+    for model, totals in usage["by_model"].items():
+        cost.inc(totals["cost_usd"], model=model)
+    return [calls, retries, errors, rate_limited, tokens, cost]
+
+
+def _fx_metrics() -> list[_Metric]:
+    from app.services.currency_rates import fx_snapshot_status
+
+    status = fx_snapshot_status()
+    if status is None:
+        return []
+
+    age = Gauge(f"{_PREFIX}_fx_snapshot_age_seconds", "Age of the FX rates snapshot in use.")
+    stale = Gauge(f"{_PREFIX}_fx_snapshot_stale", "1 when the FX snapshot is older than FX_CACHE_TTL_DAYS.")
+    age.set(status["age_seconds"])
+    stale.set(1 if status["stale"] else 0)
+    return [age, stale]
+
+
+REGISTRY.register_collector("llm", _llm_metrics)
+REGISTRY.register_collector("fx", _fx_metrics)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+import weakref
+from typing import Any
+
+from pydantic import BaseModel
+
+try:  # optional: a faster encoder when installed, same output shape
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# Serialization for everything that leaves the process.
+#
+# dump_model_json(model)  compact JSON text of a model's wire shape
+#                    (mode="json", exclude_none), computed once per model
+#                    instance: a turn's state is embedded in the payload,
+#                    the router prompt and the update prompt, but dumped
+#                    only once.
+# dump_model(model)  the same wire shape as a dict, parsed from the memoized
+#                    text: every caller gets its own copy.
+# dumps(obj)         compact JSON text for wire payloads (SSE, API bodies,
+#                    JSON logs) and LLM prompts.
+# dumps_debug(obj)   indented JSON, for humans only (debug scripts, files
+#                    meant to be read).
+#
+# Models are treated as immutable once built (updates go through
+# model_copy / apply_intent_patch). The memo holds immutable text, so a
+# caller that edits its dict (result["state"][...] = ...) cannot leak into
+# the prompts or payloads built later from the same model.
+
+_DUMPS: dict[int, tuple[weakref.ref, str]] = {}
+
+
+def _forget(key: int, ref: weakref.ref) -> None:
+    entry = _DUMPS.get(key)
+    if entry is not None and entry[0] is ref:
+        del _DUMPS[key]
+
+
+def dump_model_json(model: BaseModel) -> str:
+    key = id(model)
+    entry = _DUMPS.get(key)
+    if entry is not None and entry[0]() is model:
+        return entry[1]
+
+    text = dumps(model.model_dump(mode="json", exclude_none=True))
+    ref = weakref.ref(model, lambda r, key=key: _forget(key, r))
+    _DUMPS[key] = (ref, text)
+    return text
+
+
+def dump_model(model: BaseModel) -> dict[str, Any]:
+    return json.loads(dump_model_json(model))
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+def dumps(obj: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits: let the stdlib encoder handle it
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def dumps_debug(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=str)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Iterator
+
+
+class Span:
+    """
+    One timed section of a request.
+
+    attrs holds small facts about the section (candidate counts, prompt size,
+    cache hits); children are the spans opened while this one was current.
+    """
+
+    __slots__ = ("name", "attrs", "children", "parent", "_started", "duration_ms")
+
+    def __init__(self, name: str, parent: Span | None = None, **attrs: Any) -> None:
+        self.name = name
+        self.attrs: dict[str, Any] = attrs
+        self.children: list[Span] = []
+        self.parent = parent
+        self._started = time.perf_counter()
+        self.duration_ms: float | None = None
+
+    @property
+    def is_root(self) -> bool:
+        return self.parent is None
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def incr(self, key: str, n: int = 1) -> None:
+        self.attrs[key] = self.attrs.get(key, 0) + n
+
+    def finish(self) -> None:
+        if self.duration_ms is None:
+            self.duration_ms = round((time.perf_counter() - self._started) * 1000, 3)
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"name": self.name, "duration_ms": self.duration_ms}
+        if self.attrs:
+            out["attrs"] = dict(self.attrs)
+        if self.children:
+            out["children"] = [c.to_dict() for c in self.children]
+        return out
+
+    def breakdown(self) -> dict[str, float]:
+        """Total milliseconds per span name over the whole subtree (flat view)."""
+        totals: dict[str, float] = {}
+
+        def _walk(span: Span) -> None:
+            if span.duration_ms is not None:
+                totals[span.name] = round(totals.get(span.name, 0.0) + span.duration_ms, 3)
+            for child in span.children:
+                _walk(child)
+
+        _walk(self)
+        return totals
+
+
+_CURRENT_SPAN: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Span | None:
+    return _CURRENT_SPAN.get()
+
+
+def start_span(name: str, **attrs: Any) -> Span:
+    """Open a child of the current span (or a root) without making it current."""
+    parent = _CURRENT_SPAN.get()
+    child = Span(name, parent, **attrs)
+    if parent is not None:
+        parent.children.append(child)
+    return child
+
+
+@contextmanager
+def _activate(span: Span) -> Iterator[Span]:
+    # set() + set(parent) rather than a reset token: a span opened inside an
+    # async generator may be closed from another task's context.
+    _CURRENT_SPAN.set(span)
+    try:
+        yield span
+    finally:
+        span.finish()
+        _CURRENT_SPAN.set(span.parent)
+
+
+@contextmanager
+def trace(name: str, **attrs: Any) -> Iterator[Span]:
+    """Always-recording span: a child of the current span, or a new root."""
+    with _activate(start_span(name, **attrs)) as opened:
+        yield opened
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Span | None]:
+    """
+    Child span of the current trace; yields None (and costs nothing) when
+    no trace is active, so stages can be instrumented unconditionally.
+    """
+    if _CURRENT_SPAN.get() is None:
+        yield None
+        return
+    with _activate(start_span(name, **attrs)) as child:
+        yield child
+
+
+def annotate(**attrs: Any) -> None:
+    """Set attrs on the current span, if any."""
+    current = _CURRENT_SPAN.get()
+    if current is not None:
+        current.attrs.update(attrs)
+
+
+def incr(key: str, n: int = 1) -> None:
+    """Increment a counter attr on the current span, if any."""
+    current = _CURRENT_SPAN.get()
+    if current is not None:
+        current.attrs[key] = current.attrs.get(key, 0) + n
+
+
+async def iterate_in_span(agen: AsyncIterator[Any], span: Span) -> AsyncIterator[Any]:
+    """
+    Drive an async generator with span current at every step.
+
+    Steps of a generator may run in different tasks (e.g. a UI thread driving
+    __anext__ through run_coroutine_threadsafe), each with its own context;
+    the span that was current when a step yielded is restored for the next one.
+    """
+    current: Span | None = span
+    try:
+        while True:
+            _CURRENT_SPAN.set(current)
+            try:
+                item = await agen.__anext__()
+            except StopAsyncIteration:
+                return
+            current = _CURRENT_SPAN.get()
+            _CURRENT_SPAN.set(span.parent)
+            yield item
+    finally:
+        _CURRENT_SPAN.set(span.parent)
+        aclose = getattr(agen, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def timings_payload(root: Span) -> dict[str, Any]:
+    """Debug-section form of a finished trace."""
+    return {
+        "total_ms": root.duration_ms,
+        "by_stage_ms": root.breakdown(),
+        "spans": root.to_dict(),
+    }
+
+
+def attach_timings(result: dict[str, Any], root: Span) -> dict[str, Any]:
+    """Put the timing breakdown under result["debug"]["timings"]."""
+    debug = result.get("debug")
+    if not isinstance(debug, dict):
+        debug = result["debug"] = {}
+    debug["timings"] = timings_payload(root)
+    return result
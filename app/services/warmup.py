@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+
+def _preload_fixtures() -> int:
+    from app.retrieval.fixtures import load_fixture_listings
+
+    return len(load_fixture_listings())
+
+
+def _compile_field_rules() -> int:
+    from app.logic.field_rules import compile_field_rules
+
+    return len(compile_field_rules())
+
+
+def _load_fx_snapshot() -> int:
+    from app.services.currency_rates import get_fx_snapshot
+
+    snapshot = get_fx_snapshot()
+    return len(snapshot.rates) if snapshot is not None else 0
+
+
+def _build_agents() -> int:
+    from app.agents.conversation_router_agent import get_conversation_router_agent
+    from app.agents.intent_router_agent import get_intent_router_agent
+    from app.agents.intent_update_agent import get_intent_update_agent
+
+    get_intent_router_agent()
+    get_conversation_router_agent()
+    get_intent_update_agent()
+    return 3
+
+
+def _import_pipeline() -> int:
+    # The conversation pipeline imports the LLM SDKs lazily (first use);
+    # the service pays for them here instead of on the first message.
+    import app.logic.conversation_flow  # noqa: F401
+    import google.adk.agents  # noqa: F401
+    import google.adk.runners  # noqa: F401
+    import google.genai  # noqa: F401
+
+    return 4
+
+
+WARMUP_STEPS: dict[str, Callable[[], int]] = {
+    "pipeline_imports": _import_pipeline,
+    "fixtures": _preload_fixtures,
+    "field_rules": _compile_field_rules,
+    "fx_snapshot": _load_fx_snapshot,
+    "agents": _build_agents,
+}
+
+
+def warm_up(*, steps: list[str] | None = None) -> dict[str, dict[str, Any]]:
+    """
+    Preload process-wide resources so the first user message does not pay
+    cold-start latency.
+
+    Every step is best-effort: a failure (e.g. missing GOOGLE_API_KEY for the
+    agents) is reported in the result and the remaining steps still run.
+    """
+    report: dict[str, dict[str, Any]] = {}
+
+    for name in steps or list(WARMUP_STEPS):
+        fn = WARMUP_STEPS[name]
+        started = time.perf_counter()
+        try:
+            count = fn()
+            report[name] = {"ok": True, "count": count, "error": None}
+        except Exception as e:
+            report[name] = {"ok": False, "count": 0, "error": repr(e)}
+        report[name]["seconds"] = round(time.perf_counter() - started, 4)
+
+    return report
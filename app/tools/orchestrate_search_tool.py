@@ -4,17 +4,18 @@ import asyncio
 import json
 import os
 from datetime import date
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from app.logic import explanations
+from app.logic.ranked_item import RankedItem
 from app.logic.result_selection import select_ranked_items
-from google.genai import Client
-from google.genai import types as genai_types
 from pydantic import ValidationError
 from app.agents.intent_router_agent import IntentRoute
-from app.config.settings import MAX_ITEMS_HARD_CAP
+from app.config.settings import DEBUG_TIMINGS, MAX_ITEMS_HARD_CAP, TOP_N_DEFAULT
 from app.logic.matcher_structured import match_listing_structured
 from app.logic.numeric_filters import evaluate_numeric_filters
 from app.retrieval import Source, get_candidates
 from app.schemas.fields import Field
+from app.schemas.filters import SearchFilters
 from app.schemas.listing import ListingRaw
 from app.schemas.match import Ternary
 from app.schemas.query import SearchRequest
@@ -22,6 +23,7 @@ from app.logic.property_semantics import match_occupancy_types, match_property_t
 from app.schemas.match import Ternary
 from app.logic.normalize_search_response import normalize_search_response
 from app.logic.request_resolution import resolve_required_search_context
+from app.logic.search_context import SearchResultContext, build_retrieval_key
 from app.logic.occupancy import evaluate_occupancy
 from app.config.llm import get_gemini_model_for_adk
 from app.config.llm import get_gemini_model
@@ -31,6 +33,11 @@ from app.logic.constraint_evidence_resolution import (
     resolve_listing_constraints_with_fallback,
 )
 from app.schemas.fallback_policy import FallbackPolicy
+from app.services.cassette import get_cassette
+from app.services.llm_usage import attach_llm_usage, llm_attempt, record_usage_metadata
+from app.services.metrics import observe_trace
+from app.services.serialization import dump_model, dumps
+from app.services.tracing import annotate, attach_timings, iterate_in_span, span, start_span
 
 
 
@@ -136,17 +143,30 @@ def _covers_dates(lst: ListingRaw, check_in: date, check_out: date) -> bool:
     return lst_in <= check_in and check_out <= lst_out
 
 
-def _gemini_client() -> Client:
+def _gemini_client():
+    try:
+        from google.genai import Client
+    except ImportError as e:
+        raise ImportError("google-genai is not installed") from e
+
     api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError("Missing GEMINI_API_KEY/GOOGLE_API_KEY")
     return Client(api_key=api_key)
 
 
+def _genai_types():
+    try:
+        from google.genai import types as genai_types
+    except ImportError as e:
+        raise ImportError("google-genai is not installed") from e
+    return genai_types
+
+
 async def _repair_intent_with_llm(
     intent_raw: Dict[str, Any],
     errors: list[dict],
-    model: str = get_gemini_model(),
+    model: str | None = None,
 ) -> Dict[str, Any]:
     """Ask LLM to repair intent so it matches IntentRoute exactly.
 
@@ -156,6 +176,7 @@ async def _repair_intent_with_llm(
     - invalid legacy enum-like items may be dropped from enum slots
     - preserve user meaning inside constraints whenever possible
     """
+    model = model or get_gemini_model()
     allowed_values = [f.value for f in Field]
     
     system = (
@@ -214,20 +235,31 @@ async def _repair_intent_with_llm(
         },
     }
 
-    def _call_sync() -> Dict[str, Any]:
+    user_prompt = dumps(payload)
+
+    def _generate() -> str:
         client = _gemini_client()
+        genai_types = _genai_types()
         resp = client.models.generate_content(
             model=model,
             contents=[
                 genai_types.Content(
                     role="user",
-                    parts=[genai_types.Part(text=json.dumps(payload, ensure_ascii=False))],
+                    parts=[genai_types.Part(text=user_prompt)],
                 )
             ],
             config=genai_types.GenerateContentConfig(system_instruction=system),
         )
-        text = (resp.text or "").strip()
-        return json.loads(text)
+        record_usage_metadata(getattr(resp, "usage_metadata", None))
+        return resp.text or ""
+
+    def _call_sync() -> Dict[str, Any]:
+        text = get_cassette().call(
+            "gemini.intent_repair",
+            {"model": model, "system": system, "contents": user_prompt},
+            _generate,
+        )
+        return json.loads(text.strip())
 
     return await asyncio.to_thread(_call_sync)
 
@@ -320,13 +352,14 @@ async def _validate_and_repair_intent(intent: Any, attempts: int = 2) -> Tuple[I
     dropped_requests: list[str] = []
 
     intent_obj: Optional[IntentRoute] = None
-    for _ in range(max(0, attempts)):
+    for attempt in range(max(0, attempts)):
         try:
             intent_obj = IntentRoute.model_validate(intent_work)
             break
         except ValidationError as e:
             try:
-                intent_work = await _repair_intent_with_llm(intent_work, e.errors())
+                with llm_attempt(attempt):
+                    intent_work = await _repair_intent_with_llm(intent_work, e.errors())
             except Exception:
                 break
 
@@ -346,40 +379,55 @@ async def _validate_and_repair_intent(intent: Any, attempts: int = 2) -> Tuple[I
 
 def _build_request(
     user_text: str,
-    intent_obj: IntentRoute,
+    intent_obj: IntentRoute | SearchRequest,
     city: str,
     check_in: date,
     check_out: date,
 ) -> SearchRequest:
-    req = SearchRequest(
-    city=city,
-    check_in=check_in,
-    check_out=check_out,
-    adults=intent_obj.adults or 2,
-    children=intent_obj.children or 0,
-    rooms=intent_obj.rooms or 1,
-    currency="USD",
-    budget_max=None,
-    min_guest_rating=None,
-    filters=intent_obj.filters,
-    property_types=intent_obj.property_types or None,
-    occupancy_types=intent_obj.occupancy_types or None,
-    constraints=intent_obj.constraints,
-)
+    # intent_obj is already validated (IntentRoute or the conversation's
+    # SearchRequest): reuse its typed parts instead of validating them again.
+    req = SearchRequest.from_trusted(
+        city=city,
+        check_in=check_in,
+        check_out=check_out,
+        adults=intent_obj.adults or 2,
+        children=intent_obj.children or 0,
+        rooms=intent_obj.rooms or 1,
+        currency="USD",
+        budget_max=None,
+        min_guest_rating=None,
+        filters=intent_obj.filters if intent_obj.filters is not None else SearchFilters(),
+        property_types=intent_obj.property_types or None,
+        occupancy_types=intent_obj.occupancy_types or None,
+        constraints=list(intent_obj.constraints or []),
+    )
     # Canonical flow:
     # SearchRequest semantic state is carried by constraints.
     return req
 
 
-def _rank_structured(req: SearchRequest, listings: List[ListingRaw]) -> List[Dict[str, Any]]:
-    ranked: List[Dict[str, Any]] = []
+def _rank_structured(
+    req: SearchRequest,
+    listings: List[ListingRaw],
+    *,
+    context: SearchResultContext | None = None,
+) -> List[RankedItem]:
+    ranked: List[RankedItem] = []
 
     must_constraints, nice_constraints, _ = _constraints_by_priority(req)
     structured_must_fields = _known_mapped_fields(must_constraints)
     structured_nice_fields = _known_mapped_fields(nice_constraints)
 
     for lst in listings:
-        report = match_listing_structured(lst, req)
+        if context is not None:
+            report = match_listing_structured(
+                lst,
+                req,
+                signals=context.signals_for(lst),
+                field_match_cache=context.field_matches_for(lst),
+            )
+        else:
+            report = match_listing_structured(lst, req)
         numeric_results = evaluate_numeric_filters(
             lst,
             req.filters,
@@ -404,88 +452,70 @@ def _rank_structured(req: SearchRequest, listings: List[ListingRaw]) -> List[Dic
         if occupancy_result is not None and occupancy_result.value == Ternary.NO:
             continue
 
-        score, must_yes, must_total, why = _score_listing(
-            req,
+        score, must_yes, must_total, why_codes = _score_listing(
             report.matches,
-            numeric_results=numeric_results,
+            numeric_results,
+            must_fields=structured_must_fields,
+            nice_fields=structured_nice_fields,
         )
 
         if property_result is not None:
-            why.append(property_result.why)
+            why_codes.append((explanations.RESULT, property_result))
 
         if occupancy_result is not None:
-            why.append(occupancy_result.why)
+            why_codes.append((explanations.RESULT, occupancy_result))
 
         ranked.append(
-            {
-                "listing_name": lst.name,
-                "listing_id": getattr(lst, "id", None),
-                "report": report,
-                "matches": report.matches,
-                "numeric_results": numeric_results,
-                "property_result": property_result,
-                "occupancy_result": occupancy_result,
-                "score": score,
-                "matched_must_count": must_yes,
-                "matched_must_total": must_total,
-                "why": why,
-                "listing": lst,
-            }
+            RankedItem(
+                lst,
+                report,
+                numeric_results=numeric_results,
+                property_result=property_result,
+                occupancy_result=occupancy_result,
+                score=score,
+                matched_must_count=must_yes,
+                matched_must_total=must_total,
+                why_codes=why_codes,
+            )
         )
 
-    ranked.sort(key=lambda x: x["score"], reverse=True)
+    ranked.sort(key=_by_score, reverse=True)
     return ranked
 
 
+def _by_score(item: RankedItem) -> float:
+    return item.score
 
 
 
 
-async def orchestrate_search(
-    user_text: str,
-    intent: Dict[str, Any],
-    top_n: int = MAX_ITEMS_HARD_CAP,
-    max_items: int = MAX_ITEMS_HARD_CAP,
-    source: Source = "fixtures",
-    fallback_policy: FallbackPolicy | None = None,
-) -> Dict[str, Any]:
-    """High-level search orchestration tool (fixtures + apify)."""
-    if max_items > MAX_ITEMS_HARD_CAP:
-        return {
-            "need_clarification": True,
-            "questions": [f"Too many items requested ({max_items}). Please use <= {MAX_ITEMS_HARD_CAP}."],
-        }
-
-    intent_obj, dropped_requests = await _validate_and_repair_intent(intent, attempts=2)
-
-
-
-    resolved = resolve_required_search_context(intent_obj)
-
-    if resolved.need_clarification:
-        return {
-            "need_clarification": True,
-            "questions": resolved.questions,
-            "dropped_requests": dropped_requests,
-        }
 
-    req = _build_request(
-        user_text=user_text,
-        intent_obj=intent_obj,
-        city=resolved.city,
-        check_in=resolved.check_in,
-        check_out=resolved.check_out,
-    )
 
+async def _retrieve_filtered_candidates(
+    req: SearchRequest,
+    *,
+    max_items: int,
+    source: Source,
+) -> List[ListingRaw]:
+    """Retrieve candidates and apply the initial city/date/occupancy filters."""
     # 1) Retrieve candidates (Apify строго 1 раз / fixtures — просто читаем файл)
-    try:
+    with span("retrieval", source=source, cache_hit=False):
         listings = await get_candidates(req, max_items=max_items, source=source)
-    except NotImplementedError:
-        return {
-            "need_clarification": True,
-            "questions": ["Apify retriever is not enabled yet. Using fixtures only for now."],
-        }
+        annotate(candidates=len(listings))
+
+    with span("initial_filters", candidates_in=len(listings)):
+        filtered = _filter_initial_candidates(req, listings, source=source)
+        annotate(candidates_out=len(filtered))
+    return filtered
 
+
+def _filter_initial_candidates(
+    req: SearchRequest,
+    listings: List[ListingRaw],
+    *,
+    source: Source,
+) -> List[ListingRaw]:
+    """Initial city/date/occupancy filters over retrieved candidates."""
     # 2) Fixtures safety: fixtures могут не иметь поля city вообще.
     # Тогда фильтруем по явному упоминанию города в name/description/url.
     if source == "fixtures" and req.city:
@@ -517,48 +547,233 @@ async def orchestrate_search(
         if occ.passed:
             filtered_listings.append(lst)
 
-    listings = filtered_listings
+    return filtered_listings
+
+
+async def orchestrate_search(
+    user_text: str,
+    intent: Dict[str, Any] | SearchRequest,
+    top_n: int = MAX_ITEMS_HARD_CAP,
+    max_items: int = MAX_ITEMS_HARD_CAP,
+    source: Source = "fixtures",
+    fallback_policy: FallbackPolicy | None = None,
+    result_context: SearchResultContext | None = None,
+    debug_timings: bool = DEBUG_TIMINGS,
+) -> Dict[str, Any]:
+    """High-level search orchestration tool (fixtures + apify).
+
+    intent: a raw intent dict (validated as IntentRoute, repaired by the LLM
+    if needed) or an already validated SearchRequest, used as is.
+
+    result_context (optional, one per session): when city/dates/guests and
+    source are unchanged since the previous search, candidates are reused
+    instead of re-retrieved, and cached structured matches / LLM fallback
+    resolutions are reused for unchanged constraints.
+
+    debug_timings: add the per-stage timing breakdown as payload["debug"]["timings"].
+    """
+    payload: Dict[str, Any] = {}
+
+    async for event in orchestrate_search_events(
+        user_text=user_text,
+        intent=intent,
+        top_n=top_n,
+        max_items=max_items,
+        source=source,
+        fallback_policy=fallback_policy,
+        result_context=result_context,
+        progress=False,
+        debug_timings=debug_timings,
+    ):
+        if event["event"] == "final":
+            payload = event["data"]
+
+    return payload
+
+
+async def orchestrate_search_events(
+    user_text: str,
+    intent: Dict[str, Any] | SearchRequest,
+    top_n: int = MAX_ITEMS_HARD_CAP,
+    max_items: int = MAX_ITEMS_HARD_CAP,
+    source: Source = "fixtures",
+    fallback_policy: FallbackPolicy | None = None,
+    result_context: SearchResultContext | None = None,
+    progress: bool = True,
+    debug_timings: bool = DEBUG_TIMINGS,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Progressive variant of orchestrate_search.
+
+    Yields {"event": ..., "data": ...} dicts as stages complete:
+    - "intent": validated active intent
+    - "structured_results": top-N by structured ranking, before LLM fallback
+    - "fallback_resolution": one per listing, as its fallback lands
+    - "final": the same payload orchestrate_search returns (always last)
+
+    With progress=False only the "final" event is produced.
+
+    Every stage runs in a tracing span under "orchestrate_search"; with
+    debug_timings the breakdown is attached to "final" unless an outer
+    trace (e.g. the conversation turn) owns it.
+    """
+    root = start_span("orchestrate_search", source=source)
+
+    async for event in iterate_in_span(
+        _orchestrate_search_stages(
+            user_text=user_text,
+            intent=intent,
+            top_n=top_n,
+            max_items=max_items,
+            source=source,
+            fallback_policy=fallback_policy,
+            result_context=result_context,
+            progress=progress,
+        ),
+        root,
+    ):
+        if event["event"] == "final":
+            root.finish()
+            observe_trace(root)
+            if debug_timings and root.is_root:
+                attach_timings(event["data"], root)
+                attach_llm_usage(event["data"], root)
+        yield event
+
+
+async def _orchestrate_search_stages(
+    user_text: str,
+    intent: Dict[str, Any] | SearchRequest,
+    top_n: int,
+    max_items: int,
+    source: Source,
+    fallback_policy: FallbackPolicy | None,
+    result_context: SearchResultContext | None,
+    progress: bool,
+) -> AsyncIterator[Dict[str, Any]]:
+    if max_items > MAX_ITEMS_HARD_CAP:
+        yield _search_event("final", {
+            "need_clarification": True,
+            "questions": [f"Too many items requested ({max_items}). Please use <= {MAX_ITEMS_HARD_CAP}."],
+        })
+        return
+
+    with span("intent_validation"):
+        if isinstance(intent, SearchRequest):
+            # Conversation state is validated when it is built; do not
+            # round-trip it through a dict and IntentRoute again.
+            intent_obj, dropped_requests = intent, []
+        else:
+            intent_obj, dropped_requests = await _validate_and_repair_intent(intent, attempts=2)
+        annotate(dropped_requests=len(dropped_requests))
+
+
+
+    resolved = resolve_required_search_context(intent_obj)
+
+    if resolved.need_clarification:
+        yield _search_event("final", {
+            "need_clarification": True,
+            "questions": resolved.questions,
+            "dropped_requests": dropped_requests,
+        })
+        return
+
+    req = _build_request(
+        user_text=user_text,
+        intent_obj=intent_obj,
+        city=resolved.city,
+        check_in=resolved.check_in,
+        check_out=resolved.check_out,
+    )
+
+    if progress:
+        yield _search_event("intent", {
+            "active_intent": dump_model(req),
+            "dropped_requests": dropped_requests,
+        })
+
+    retrieval_key = build_retrieval_key(req, source=source, max_items=max_items)
+
+    if result_context is not None:
+        result_context.clear_ranking()
+
+    if result_context is not None and result_context.can_reuse(retrieval_key):
+        listings = result_context.listings
+        with span("retrieval", source=source, cache_hit=True, candidates=len(listings)):
+            pass
+    else:
+        try:
+            listings = await _retrieve_filtered_candidates(req, max_items=max_items, source=source)
+        except NotImplementedError:
+            yield _search_event("final", {
+                "need_clarification": True,
+                "questions": ["Apify retriever is not enabled yet. Using fixtures only for now."],
+            })
+            return
+
+        if result_context is not None:
+            result_context.reset(retrieval_key, listings)
 
     # 4) No candidates after initial filters
     if not listings:
-        return {
+        yield _search_event("final", {
             "need_clarification": True,
             "questions": ["Ничего не найдено по текущим условиям. Попробуй изменить требования."],
             "debug_notes": [
                 "No listings remained after initial city/date/occupancy filtering.",
                 f"city={req.city}, check_in={req.check_in}, check_out={req.check_out}",
             ],
-            "active_intent": req.model_dump(mode="json", exclude_none=True),
+            "active_intent": dump_model(req),
             "dropped_requests": dropped_requests,
-        }
+        })
+        return
 
     # 5) Structured ranking
-    ranked = _rank_structured(req, listings)
+    with span("rank_structured", candidates_in=len(listings)):
+        ranked = _rank_structured(req, listings, context=result_context)
+        annotate(candidates_out=len(ranked))
+
+    if progress:
+        yield _search_event("structured_results", _structured_preview(
+            req,
+            ranked,
+            top_n=top_n,
+            dropped_requests=dropped_requests,
+        ))
 
-    # 6) Unified constraint fallback layer on top-K
     # 6) Unified constraint fallback layer on top-K
     if fallback_policy is None:
         fallback_policy = _build_fallback_policy(fallback_top_k=5)
 
-    await _apply_constraint_fallback_layer(
-        req,
-        ranked,
-        policy=fallback_policy,
-    )
-
-    # 7) Apply fallback-informed scoring
-    ranked = _apply_constraint_resolution_scoring(ranked)
+    with span("fallback_layer", enabled=fallback_policy.enabled, candidates_in=len(ranked)):
+        async for item in _iter_constraint_fallback_layer(
+            req,
+            ranked,
+            policy=fallback_policy,
+            resolution_cache=result_context.resolutions if result_context is not None else None,
+        ):
+            if progress:
+                yield _search_event("fallback_resolution", {
+                    "listing_id": item.listing_id,
+                    "listing_name": item.listing_name,
+                    "constraint_resolution_results": item.constraint_resolution_results,
+                })
+
+        # 7) Apply fallback-informed scoring
+        ranked = _apply_constraint_resolution_scoring(ranked)
 
     must_constraints, _, _ = _constraints_by_priority(req)
     structured_must_fields = _known_mapped_fields(must_constraints)
 
-    ranked = [
-        it
-        for it in ranked
-        if not _fails_must(it["matches"], structured_must_fields)
-        and not _fails_numeric_filters(it.get("numeric_results"))
-    ]
-    ranked.sort(key=lambda x: x["score"], reverse=True)
+    with span("must_filter", candidates_in=len(ranked)):
+        ranked = [
+            it
+            for it in ranked
+            if not _fails_must(it.matches, structured_must_fields)
+            and not _fails_numeric_filters(it.numeric_results)
+        ]
+        ranked.sort(key=_by_score, reverse=True)
+        annotate(candidates_out=len(ranked))
     
     if not ranked:
         debug_notes = ["No listings remained after structured filtering."]
@@ -606,15 +821,75 @@ async def orchestrate_search(
                 "Optional constraints: " + ", ".join(nice_constraints)
             )
 
-        return {
+        yield _search_event("final", {
             "need_clarification": True,
             "questions": ["Ничего не найдено по текущим условиям. Попробуй изменить требования."],
             "debug_notes": debug_notes,
-            "active_intent": req.model_dump(mode="json", exclude_none=True),
+            "active_intent": dump_model(req),
             "dropped_requests": dropped_requests,
-        }
+        })
+        return
+
+    # Full selection order is kept so that "show more" can page through it.
+    with span("selection", candidates_in=len(ranked)):
+        ordered = select_ranked_items(ranked, top_n=len(ranked))
+        selected = ordered[: max(0, top_n)]
+        annotate(candidates_out=len(selected))
+
+    if result_context is not None:
+        result_context.remember_ranking(
+            req,
+            ordered,
+            shown=len(selected),
+            dropped_requests=dropped_requests,
+            fallback_policy=fallback_policy,
+        )
+
+    with span("normalize", results=len(selected)):
+        normalized = normalize_search_response(
+            req,
+            selected,
+            top_n=top_n,
+            dropped_requests=dropped_requests,
+        )
+
+        payload = normalized.model_dump(mode="json", exclude_none=True)
+        payload["constraint_statuses"] = _build_constraint_statuses(selected[: max(0, top_n)])
+    payload["pagination"] = _pagination_info(
+        offset=0,
+        returned=len(selected),
+        has_more=len(ordered) > len(selected),
+    )
+    yield _search_event("final", payload)
+
 
-    selected = select_ranked_items(ranked, top_n=top_n)
+def _search_event(event: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    return {"event": event, "data": data}
+
+
+def _structured_preview(
+    req: SearchRequest,
+    ranked: list[RankedItem],
+    *,
+    top_n: int,
+    dropped_requests: List[str],
+) -> Dict[str, Any]:
+    """
+    Top-N as known from structured ranking alone.
+
+    Only structured must/numeric failures are dropped here; the LLM fallback
+    may still reorder or exclude items in the final payload.
+    """
+    must_constraints, _, _ = _constraints_by_priority(req)
+    structured_must_fields = _known_mapped_fields(must_constraints)
+
+    candidates = [
+        it
+        for it in ranked
+        if not _fails_must(it.matches, structured_must_fields)
+        and not _fails_numeric_filters(it.numeric_results)
+    ]
+    selected = select_ranked_items(candidates, top_n=top_n)
 
     normalized = normalize_search_response(
         req,
@@ -622,31 +897,94 @@ async def orchestrate_search(
         top_n=top_n,
         dropped_requests=dropped_requests,
     )
+    return normalized.model_dump(mode="json", exclude_none=True)
 
-    payload = normalized.model_dump(mode="json", exclude_none=True)
-    payload["constraint_statuses"] = _build_constraint_statuses(selected[: max(0, top_n)])
-    return payload
-    
-def _format_match_why(field: Field, fm: Any) -> str:
-    if fm is None:
-        return f"{field.name}: missing match"
 
-    if fm.value == Ternary.YES:
-        if fm.evidence and fm.evidence[0].snippet:
-            return f"{field.name}: {fm.evidence[0].snippet}"
-        return f"{field.name}: matched"
+def _pagination_info(*, offset: int, returned: int, has_more: bool) -> Dict[str, Any]:
+    return {
+        "offset": offset,
+        "returned": returned,
+        "has_more": has_more,
+    }
+
+
+async def show_more_results(
+    result_context: SearchResultContext,
+    *,
+    page_size: int = TOP_N_DEFAULT,
+) -> Dict[str, Any]:
+    """Serve the next page of the latest ranking kept in result_context.
+
+    No retrieval and no re-ranking: the cursor moves over the stored
+    selection order. LLM fallback runs lazily, only for revealed items that
+    were outside the fallback top-K of the original search.
+    """
+    if not result_context.has_more():
+        return {
+            "need_clarification": True,
+            "questions": ["There are no more results for the current search."],
+            "pagination": _pagination_info(
+                offset=result_context.cursor,
+                returned=0,
+                has_more=False,
+            ),
+        }
 
-    if fm.value == Ternary.UNCERTAIN:
-        return f"{field.name}: maybe (needs check)"
+    req = result_context.request
+    policy = result_context.fallback_policy or _build_fallback_policy(fallback_top_k=5)
+    offset = result_context.cursor
+    page: list[RankedItem] = []
+
+    while len(page) < page_size and result_context.has_more():
+        start = result_context.cursor
+        chunk = result_context.ordered[start : start + page_size - len(page)]
+        result_context.cursor = start + len(chunk)
+
+        pending = [it for it in chunk if not it.get("fallback_resolved")]
+        if pending:
+            with span("fallback_layer", lazy=True, candidates_in=len(pending)):
+                await _apply_constraint_fallback_layer(
+                    req,
+                    pending,
+                    policy=policy.model_copy(update={"top_k": len(pending)}),
+                    resolution_cache=result_context.resolutions,
+                )
+                _apply_constraint_resolution_scoring(pending)
 
-    return f"{field.name}: not found"
+        # Re-classify: lazily resolved constraints may make an item ineligible.
+        page.extend(select_ranked_items(chunk, top_n=len(chunk)))
 
+    if not page:
+        return {
+            "need_clarification": True,
+            "questions": ["There are no more results for the current search."],
+            "pagination": _pagination_info(offset=offset, returned=0, has_more=False),
+        }
+
+    with span("normalize", results=len(page)):
+        normalized = normalize_search_response(
+            req,
+            page,
+            top_n=len(page),
+            dropped_requests=result_context.dropped_requests,
+        )
 
+        payload = normalized.model_dump(mode="json", exclude_none=True)
+        payload["constraint_statuses"] = _build_constraint_statuses(page)
+    payload["pagination"] = _pagination_info(
+        offset=offset,
+        returned=len(page),
+        has_more=result_context.has_more(),
+    )
+    return payload
+    
 def _score_listing(
-    req: SearchRequest,
     matches: dict[Field, Any],
     numeric_results: List[Any] | None = None,
-) -> Tuple[float, int, int, List[str]]:
+    *,
+    must_fields: List[Field],
+    nice_fields: List[Field],
+) -> Tuple[float, int, int, List[explanations.WhyCode]]:
     """
     Canonical scoring.
 
@@ -657,23 +995,21 @@ def _score_listing(
 
     Unresolved constraints are handled later by fallback and
     constraint_resolution_results scoring.
+
+    The explanation is returned as codes (see app.logic.explanations),
+    rendered to text only for returned results.
     """
     score = 0.0
-    why: List[str] = []
+    why_codes: List[explanations.WhyCode] = []
 
-    must_constraints, nice_constraints, _ = _constraints_by_priority(req)
-
-    structured_must_fields = _known_mapped_fields(must_constraints)
-    structured_nice_fields = _known_mapped_fields(nice_constraints)
-
-    must_total = len(structured_must_fields)
+    must_total = len(must_fields)
     must_yes = 0
 
-    for f in structured_must_fields:
+    for f in must_fields:
         fm = matches.get(f)
+        why_codes.append((explanations.MUST_FIELD, f, fm))
 
         if fm is None:
-            why.append(_format_match_why(f, fm))
             continue
 
         if fm.value == Ternary.YES:
@@ -684,16 +1020,11 @@ def _score_listing(
         else:
             score -= 100
 
-        why.append(_format_match_why(f, fm))
-
-    for f in structured_nice_fields:
+    for f in nice_fields:
         fm = matches.get(f)
         if fm and fm.value == Ternary.YES:
             score += 1
-            if fm.evidence and fm.evidence[0].snippet:
-                why.append(f"+ {f.name}: {fm.evidence[0].snippet}")
-            else:
-                why.append(f"+ {f.name}: matched")
+            why_codes.append((explanations.NICE_FIELD, f, fm))
 
     for nr in (numeric_results or []):
         if nr.value == Ternary.YES:
@@ -703,9 +1034,9 @@ def _score_listing(
         else:
             score -= 100
 
-        why.append(nr.why)
+        why_codes.append((explanations.RESULT, nr))
 
-    return score, must_yes, must_total, why
+    return score, must_yes, must_total, why_codes
 
 
 def _build_fallback_policy(
@@ -724,42 +1055,58 @@ def _build_fallback_policy(
 
 async def _apply_constraint_fallback_layer(
     req: SearchRequest,
-    ranked: list[dict],
+    ranked: list[RankedItem],
     *,
     policy: FallbackPolicy,
+    resolution_cache: dict[tuple, Any] | None = None,
 ) -> None:
+    async for _ in _iter_constraint_fallback_layer(
+        req,
+        ranked,
+        policy=policy,
+        resolution_cache=resolution_cache,
+    ):
+        pass
+
+
+async def _iter_constraint_fallback_layer(
+    req: SearchRequest,
+    ranked: list[RankedItem],
+    *,
+    policy: FallbackPolicy,
+    resolution_cache: dict[tuple, Any] | None = None,
+) -> AsyncIterator[RankedItem]:
+    """Fill constraint_resolution_results, yielding each item once its fallback ran."""
     if not policy.enabled:
         for item in ranked:
-            item["constraint_resolution_results"] = []
+            item.constraint_resolution_results = []
+            item.fallback_resolved = True
         return
 
     top_k = policy.normalized_top_k()
 
     for item in ranked[:top_k]:
-        listing = item.get("listing")
-        if listing is None:
-            item["constraint_resolution_results"] = []
-            continue
-
+        item.fallback_resolved = True
         results = await resolve_listing_constraints_with_fallback(
-            listing=listing,
+            listing=item.listing,
             constraints=req.constraints or [],
-            structured_matches_by_field=item.get("matches", {}),
+            structured_matches_by_field=item.matches,
             policy=policy,
+            resolution_cache=resolution_cache,
         )
 
-        item["constraint_resolution_results"] = [
+        item.constraint_resolution_results = [
             r.model_dump(mode="json") for r in results
         ]
+        yield item
 
     for item in ranked[top_k:]:
-        item["constraint_resolution_results"] = []
+        item.constraint_resolution_results = []
 
 
-def _apply_constraint_resolution_scoring(ranked_items: list[dict]) -> list[dict]:
+def _apply_constraint_resolution_scoring(ranked_items: list[RankedItem]) -> list[RankedItem]:
     for item in ranked_items:
         delta = 0.0
-        extra_why: list[str] = []
 
         for r in item.get("constraint_resolution_results", []) or []:
             label = r.get("normalized_text") or "constraint"
@@ -769,53 +1116,30 @@ def _apply_constraint_resolution_scoring(ranked_items: list[dict]) -> list[dict]
             if priority == "must":
                 if decision == "YES":
                     delta += 3.0
-                    extra_why.append(f"CONSTRAINT_MATCH: {label} confirmed by listing text")
                 elif decision == "NO":
                     delta -= 100.0
-                    extra_why.append(f"CONSTRAINT_FAIL: must constraint '{label}' not satisfied")
-                else:
-                    extra_why.append(f"CONSTRAINT_UNCERTAIN: must constraint '{label}' not confirmed")
 
             elif priority in {"nice", "nice_to_have"}:
                 if decision == "YES":
                     delta += 3.0
-                    extra_why.append(f"CONSTRAINT_MATCH: nice-to-have '{label}' confirmed by listing text")
-                elif decision == "NO":
-                    extra_why.append(f"CONSTRAINT_NO_MATCH: nice-to-have '{label}' not satisfied")
-                else:
-                    extra_why.append(f"CONSTRAINT_UNCERTAIN: nice-to-have '{label}' not confirmed")
 
             elif priority == "forbidden":
                 if decision == "YES":
                     delta -= 100.0
-                    extra_why.append(f"CONSTRAINT_FAIL: forbidden constraint '{label}' detected")
                 elif decision == "NO":
                     delta += 3.0
-                    extra_why.append(f"CONSTRAINT_MATCH: forbidden constraint '{label}' not detected")
-                else:
-                    extra_why.append(f"CONSTRAINT_UNCERTAIN: forbidden constraint '{label}' unclear")
 
-            else:
-                # Defensive fallback: do not reward unknown priority.
-                if decision == "YES":
-                    extra_why.append(f"CONSTRAINT_MATCH: {label} confirmed, but priority is unknown")
-                elif decision == "NO":
-                    extra_why.append(f"CONSTRAINT_NO_MATCH: {label} not satisfied, but priority is unknown")
-                else:
-                    extra_why.append(f"CONSTRAINT_UNCERTAIN: {label} not confirmed")
+            # Unknown priority: defensive fallback, explained but never rewarded.
+            item.why_codes.append((explanations.CONSTRAINT, priority, decision, label))
 
         if delta != 0:
-            item["score"] = float(item.get("score", 0.0)) + delta
-
-        why = list(item.get("why") or [])
-        why.extend(extra_why)
-        item["why"] = why
+            item.score = float(item.score) + delta
 
-    ranked_items.sort(key=lambda x: x.get("score", 0.0), reverse=True)
+    ranked_items.sort(key=_by_score, reverse=True)
     return ranked_items
 
 
-def _build_constraint_statuses(ranked_items: list[dict]) -> list[dict]:
+def _build_constraint_statuses(ranked_items: list[RankedItem]) -> list[dict]:
     statuses: list[dict] = []
 
     for item in ranked_items:
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Sequence, TypeVar
+
+from app.services.llm_usage import is_rate_limited_error
+from evaluation.core.io import Checkpoint
+
+
+CaseT = TypeVar("CaseT")
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket shared by all eval workers.
+
+    Refills at `rate` requests per second (up to `burst` tokens). A 429 /
+    RESOURCE_EXHAUSTED halves the rate (never below min_rate), empties the
+    bucket and pauses everyone for one refill period; every success gives
+    back `rate * increase` until max_rate is reached again.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: int = 1,
+        min_rate: float = 0.05,
+        max_rate: float | None = None,
+        backoff: float = 0.5,
+        increase: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.min_rate = min(min_rate, rate)
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.backoff = backoff
+        self.increase = increase
+        self.rate_limited_total = 0
+
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        # Holding the lock while sleeping keeps waiters in FIFO order.
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._paused_until:
+                    await self._sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await self._sleep((1 - self._tokens) / self.rate)
+
+    def on_success(self) -> None:
+        self.rate = min(self.max_rate, self.rate * (1 + self.increase))
+
+    def on_rate_limited(self) -> None:
+        self.rate_limited_total += 1
+        self.rate = max(self.min_rate, self.rate * self.backoff)
+        now = self._clock()
+        self._refill(now)
+        self._tokens = 0.0
+        self._paused_until = max(self._paused_until, now + 1 / self.rate)
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def latency_summary(results: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    """
+    p50/p95/max over the per-case latency_ms written by run_cases(), plus
+    the median rate-limit wait (wait_ms) reported separately.
+    """
+    latencies = [r["latency_ms"] for r in results if r.get("latency_ms") is not None]
+    waits = [r["wait_ms"] for r in results if r.get("wait_ms") is not None]
+    return {
+        "cases": len(latencies),
+        "p50_ms": round(statistics.median(latencies), 1) if latencies else None,
+        "p95_ms": _percentile(latencies, 95),
+        "max_ms": max(latencies) if latencies else None,
+        "wait_p50_ms": round(statistics.median(waits), 1) if waits else None,
+        "total_attempts": sum(r.get("attempts", 1) for r in results),
+    }
+
+
+async def run_cases(
+    cases: Sequence[CaseT],
+    run_one: Callable[[CaseT], Awaitable[dict[str, Any]]],
+    *,
+    case_id: Callable[[CaseT], str],
+    on_error: Callable[[CaseT, Exception], dict[str, Any]],
+    concurrency: int = 4,
+    limiter: AdaptiveRateLimiter | None = None,
+    max_retries: int = 3,
+    progress_path: str | Path | None = None,
+    progress_meta: dict[str, Any] | None = None,
+    resume: bool = True,
+    log: Callable[[str], None] = print,
+) -> list[dict[str, Any]]:
+    """
+    Run eval cases with bounded concurrency and return their results in
+    dataset order.
+
+    run_one(case) produces the case result (usually adapter + comparator).
+    Rate-limited attempts are retried (up to max_retries) after the limiter
+    backs off; any other exception, or running out of retries, turns into
+    on_error(case, exc). Every result gets latency_ms (time spent inside
+    run_one, summed over attempts), wait_ms (rate limiter queueing and 429
+    back-off) and attempts.
+
+    With progress_path, each finished case is appended to a Checkpoint
+    (progress_meta identifies the run); with resume, cases already
+    completed there are not run again. The checkpoint is compacted at the
+    end, so the returned results and the file agree.
+    """
+    checkpoint = (
+        Checkpoint(progress_path, meta=progress_meta, resume=resume) if progress_path is not None else None
+    )
+    results: dict[str, dict[str, Any]] = {}
+    if checkpoint is not None:
+        results = {
+            key: row["result"]
+            for key, row in checkpoint.rows.items()
+            if checkpoint.done(key)
+        }
+
+    pending = [case for case in cases if case_id(case) not in results]
+    if len(pending) < len(cases):
+        log(f"Resuming: {len(cases) - len(pending)} of {len(cases)} cases already done")
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    finished = len(cases) - len(pending)
+
+    async def _run(case: CaseT) -> None:
+        nonlocal finished
+        key = case_id(case)
+        attempts = 0
+        ok = True
+
+        async with semaphore:
+            started = time.perf_counter()
+            run_seconds = 0.0
+            while True:
+                attempts += 1
+                if limiter is not None:
+                    await limiter.acquire()
+                attempt_started = time.perf_counter()
+                try:
+                    result = await run_one(case)
+                except Exception as e:
+                    run_seconds += time.perf_counter() - attempt_started
+                    if is_rate_limited_error(e) and attempts <= max_retries:
+                        if limiter is not None:
+                            limiter.on_rate_limited()
+                        log(f"429 for {key}, retry {attempts}/{max_retries}")
+                        continue
+                    log(f"ERROR in {key}: {type(e).__name__}: {e}")
+                    result = on_error(case, e)
+                    ok = False
+                    break
+                else:
+                    run_seconds += time.perf_counter() - attempt_started
+                    if limiter is not None:
+                        limiter.on_success()
+                    break
+            latency_ms = round(run_seconds * 1000, 1)
+            wait_ms = round((time.perf_counter() - started - run_seconds) * 1000, 1)
+
+        result = {**result, "latency_ms": latency_ms, "wait_ms": wait_ms, "attempts": attempts}
+        results[key] = result
+        if checkpoint is not None:
+            checkpoint.append(key, result, ok=ok)
+
+        finished += 1
+        log(f"[{finished}/{len(cases)}] {key} {'ok' if ok else 'error'} in {latency_ms} ms")
+
+    try:
+        await asyncio.gather(*(_run(case) for case in pending))
+    finally:
+        if checkpoint is not None:
+            checkpoint.compact()
+            checkpoint.close()
+    return [results[case_id(case)] for case in cases]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Iterable, Any
 
@@ -20,5 +21,126 @@ def load_jsonl(path: str | Path) -> list[dict[str, Any]]:
 def save_json(path: str | Path, payload: dict[str, Any]) -> None:
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+    # Write-then-rename: an interrupted run never leaves a truncated report.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    tmp.replace(path)
+
+
+# Eval checkpoints: append-only JSONL, one line per finished case.
+#
+#   {"checkpoint": 1, "meta": {...}}                     <- header
+#   {"case_id": "cr_001", "ok": true, "result": {...}}
+#   {"case_id": "cr_002", "ok": false, "result": {...}}
+#
+# Appends are O(1) per case and a crash loses at most the line being
+# written (a torn last line is ignored on load). The latest row per case_id
+# wins, so a retried case simply appends again; compact_checkpoint() drops
+# the superseded rows.
+
+CHECKPOINT_VERSION = 1
+
+
+def _read_checkpoint(path: Path) -> tuple[dict[str, Any] | None, dict[str, dict[str, Any]]]:
+    header: dict[str, Any] | None = None
+    rows: dict[str, dict[str, Any]] = {}
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                # Torn write from an interrupted run.
+                continue
+            if "checkpoint" in row:
+                header = row
+            elif "case_id" in row:
+                rows.pop(row["case_id"], None)
+                rows[row["case_id"]] = row
+    return header, rows
+
+
+def discard_checkpoint(path: str | Path) -> None:
+    """
+    Remove the checkpoint of a finished run. Resume is for interrupted runs
+    only: a kept file would make the next run (after a prompt or code
+    change) skip every case and report the old results.
+    """
+    Path(path).unlink(missing_ok=True)
+
+
+def load_checkpoint(path: str | Path) -> dict[str, dict[str, Any]]:
+    """Latest row per case_id, in the order cases were last written."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return _read_checkpoint(path)[1]
+
+
+class Checkpoint:
+    """
+    Append-only progress file for an eval run.
+
+    Opening with resume=True keeps existing rows if the header meta matches
+    (ValueError otherwise: the run was started with a different dataset or
+    settings); resume=False starts a new file.
+    """
+
+    def __init__(self, path: str | Path, *, meta: dict[str, Any] | None = None, resume: bool = True) -> None:
+        self.path = Path(path)
+        self.meta = meta or {}
+        self.rows: dict[str, dict[str, Any]] = {}
+
+        if resume and self.path.exists():
+            header, self.rows = _read_checkpoint(self.path)
+            if header is not None and header.get("meta") != self.meta:
+                raise ValueError(
+                    f"{self.path} was written for {header.get('meta')}, not {self.meta}; "
+                    "start a fresh run instead of resuming"
+                )
+        # Always rewrite on open: a torn last line from an interrupted run
+        # is dropped here, so the next append starts on a fresh line.
+        self._rewrite()
+
+        self._file = self.path.open("a", encoding="utf-8")
+
+    def __enter__(self) -> Checkpoint:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def done(self, case_id: str) -> bool:
+        row = self.rows.get(case_id)
+        return bool(row and row.get("ok"))
+
+    def append(self, case_id: str, result: dict[str, Any], *, ok: bool = True) -> None:
+        row = {"case_id": case_id, "ok": ok, "result": result}
+        self.rows.pop(case_id, None)
+        self.rows[case_id] = row
+        self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _rewrite(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            f.write(json.dumps({"checkpoint": CHECKPOINT_VERSION, "meta": self.meta}, ensure_ascii=False) + "\n")
+            for row in self.rows.values():
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        tmp.replace(self.path)
+
+    def compact(self) -> list[dict[str, Any]]:
+        """Rewrite the file with one row per case (latest wins); returns the rows."""
+        self._file.close()
+        self._rewrite()
+        self._file = self.path.open("a", encoding="utf-8")
+        return list(self.rows.values())
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
@@ -1,44 +1,69 @@
 from __future__ import annotations
 
+import argparse
 import asyncio
+from pathlib import Path
+from typing import Any
 
-from evaluation.core.io import load_jsonl, save_json
+from evaluation.core.executor import AdaptiveRateLimiter, latency_summary, run_cases
+from evaluation.core.io import discard_checkpoint, load_jsonl, save_json
 from evaluation.tasks.constraint_extraction.dataset import ConstraintEvalCase
 from evaluation.tasks.constraint_extraction.adapter import run_case
 from evaluation.tasks.constraint_extraction.comparator import compare_case
 from evaluation.tasks.constraint_extraction.metrics import compute_metrics
 
 
-async def run_eval(dataset_path: str, output_path: str) -> dict:
+MAX_CONCURRENCY = 4
+REQUESTS_PER_SECOND = 1.0
+
+
+def build_runtime_error_result(case: ConstraintEvalCase, error: Exception) -> dict[str, Any]:
+    return {
+        "case_id": case.case_id,
+        "group": case.group,
+        "user_message": case.user_message,
+        "error": str(error),
+        "constraint_extraction": {
+            "gold_count": len(case.expected_constraints),
+            "pred_count": 0,
+            "correct_count": 0,
+            "missed_constraints": [c.normalized_text for c in case.expected_constraints],
+            "extra_constraints": [],
+            "exact_constraint_set_match": False,
+            "exact_full_case_match": False,
+        },
+        "matched_rows": [],
+    }
+
+
+async def compare_one(case: ConstraintEvalCase) -> dict[str, Any]:
+    result = await run_case(case.user_message)
+    return compare_case(case, result)
+
+
+async def run_eval(
+    dataset_path: str,
+    output_path: str,
+    *,
+    concurrency: int = MAX_CONCURRENCY,
+    requests_per_second: float = REQUESTS_PER_SECOND,
+    progress_path: str | Path | None = None,
+    resume: bool = True,
+) -> dict:
     raw_cases = load_jsonl(dataset_path)
     cases = [ConstraintEvalCase.model_validate(x) for x in raw_cases]
 
-    case_results = []
-
-    for case in cases:
-        try:
-            result = await run_case(case.user_message)
-            compared = compare_case(case, result)
-            case_results.append(compared)
-        except Exception as e:
-            case_results.append(
-                {
-                    "case_id": case.case_id,
-                    "group": case.group,
-                    "user_message": case.user_message,
-                    "error": str(e),
-                    "constraint_extraction": {
-                        "gold_count": len(case.expected_constraints),
-                        "pred_count": 0,
-                        "correct_count": 0,
-                        "missed_constraints": [c.normalized_text for c in case.expected_constraints],
-                        "extra_constraints": [],
-                        "exact_constraint_set_match": False,
-                        "exact_full_case_match": False,
-                    },
-                    "matched_rows": [],
-                }
-            )
+    case_results = await run_cases(
+        cases,
+        compare_one,
+        case_id=lambda case: case.case_id,
+        on_error=build_runtime_error_result,
+        concurrency=concurrency,
+        limiter=AdaptiveRateLimiter(requests_per_second, burst=concurrency),
+        progress_path=progress_path,
+        progress_meta={"task": "constraint_extraction", "dataset": Path(dataset_path).name},
+        resume=resume,
+    )
 
     metrics = compute_metrics(case_results)
 
@@ -46,14 +71,33 @@ async def run_eval(dataset_path: str, output_path: str) -> dict:
         "dataset_path": dataset_path,
         "n_cases": len(cases),
         "metrics": metrics,
+        "latency": latency_summary(case_results),
         "cases": case_results,
     }
 
     save_json(output_path, report)
+    if progress_path is not None:
+        discard_checkpoint(progress_path)
     return report
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Constraint extraction eval")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY)
+    parser.add_argument("--rps", type=float, default=REQUESTS_PER_SECOND, help="initial requests per second")
+    parser.add_argument("--fresh", action="store_true", help="ignore and clear previous progress")
+    args = parser.parse_args()
+
     dataset_path = "evaluation/datasets/constraint_extraction/constraint_golden_set_v2_final.jsonl"
     output_path = "evaluation/outputs/constraint_extraction_report.json"
-    asyncio.run(run_eval(dataset_path, output_path))
\ No newline at end of file
+    progress_path = "evaluation/outputs/constraint_extraction_progress.jsonl"
+    asyncio.run(
+        run_eval(
+            dataset_path,
+            output_path,
+            concurrency=args.concurrency,
+            requests_per_second=args.rps,
+            progress_path=progress_path,
+            resume=not args.fresh,
+        )
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 import asyncio
 import json
 import sys
@@ -11,6 +12,8 @@ PROJECT_ROOT = Path(__file__).resolve().parents[3]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from evaluation.core.executor import AdaptiveRateLimiter, latency_summary, run_cases
+from evaluation.core.io import discard_checkpoint, save_json
 from evaluation.tasks.constraint_resolution.adapter import run_case
 from evaluation.tasks.constraint_resolution.comparator import compare_case
 from evaluation.tasks.constraint_resolution.dataset import load_constraint_resolution_dataset
@@ -36,10 +39,20 @@ ERRORS_PATH = (
     / "evaluation/outputs/constraint_resolution_eval_runtime_errors.json"
 )
 
-REQUEST_DELAY_SECONDS = 10.0
-MAX_RETRIES_PER_CASE = 1
+# Append-only checkpoint (evaluation.core.io.Checkpoint): an interrupted run resumes
+# from it; it is removed once the report is saved.
+PROGRESS_PATH = (
+    PROJECT_ROOT
+    / "evaluation/outputs/constraint_resolution_eval_progress.jsonl"
+)
+
+# Gemini rate limiting: start at REQUESTS_PER_SECOND, back off on 429s.
+MAX_CONCURRENCY = 4
+REQUESTS_PER_SECOND = 1.0
+MAX_RETRIES_PER_CASE = 3
 
-MAX_CASES: int | None = 3
+CASE_IDS: set[str] | None = {"cr_012", "cr_017", "cr_032", "cr_037", "cr_045"}
+MAX_CASES: int | None = None
 
 
 def build_runtime_error_result(case: Any, error: Exception) -> dict[str, Any]:
@@ -63,84 +76,42 @@ def build_runtime_error_result(case: Any, error: Exception) -> dict[str, Any]:
         "raw_prediction": None,
     }
     
-async def run_case_with_retry(case: Any) -> dict[str, Any]:
-    last_error: Exception | None = None
-
-    for attempt in range(1, MAX_RETRIES_PER_CASE + 1):
-        try:
-            return await run_case(case)
-
-        except Exception as e:
-            last_error = e
-            message = str(e)
-
-            if "429" in message or "RESOURCE_EXHAUSTED" in message:
-                sleep_seconds = 15 * attempt
-                print(
-                    f"429 for {case.case_id}. "
-                    f"Retry {attempt}/{MAX_RETRIES_PER_CASE}. "
-                    f"Sleeping {sleep_seconds}s"
-                )
-                await asyncio.sleep(sleep_seconds)
-                continue
-
-            raise
-
-    raise RuntimeError(f"Failed after retries: {case.case_id}: {last_error}")
-
-
-async def run_async() -> dict[str, Any]:
+async def compare_one(case: Any) -> dict[str, Any]:
+    prediction = await run_case(case)
+    return compare_case(case=case, prediction=prediction)
+
+
+async def run_async(
+    *,
+    case_ids: set[str] | None = CASE_IDS,
+    max_cases: int | None = MAX_CASES,
+    concurrency: int = MAX_CONCURRENCY,
+    requests_per_second: float = REQUESTS_PER_SECOND,
+    resume: bool = True,
+) -> dict[str, Any]:
     cases = load_constraint_resolution_dataset(DATASET_PATH)
-    
-    CASE_IDS = {"cr_012", "cr_017", "cr_032", "cr_037", "cr_045"}
 
-    cases = [
-        case for case in cases
-        if case.case_id in CASE_IDS
-    ]
+    if case_ids:
+        cases = [case for case in cases if case.case_id in case_ids]
 
-    # if MAX_CASES is not None:
-    #     cases = cases[:MAX_CASES]
+    if max_cases is not None:
+        cases = cases[:max_cases]
 
-    results: list[dict[str, Any]] = []
-    runtime_errors: list[dict[str, Any]] = []
+    limiter = AdaptiveRateLimiter(requests_per_second, burst=concurrency)
 
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-
-    for index, case in enumerate(cases, start=1):
-        print(f"[{index}/{len(cases)}] Running {case.case_id} ({case.case_type})")
-
-        try:
-            prediction = await run_case_with_retry(case)
-
-            result = compare_case(
-                case=case,
-                prediction=prediction,
-            )
-
-            results.append(result)
-
-        except Exception as e:
-            print(f"ERROR in {case.case_id}: {type(e).__name__}: {e}")
-
-            error_result = build_runtime_error_result(case, e)
-            results.append(error_result)
-            runtime_errors.append(error_result)
-
-        # Rate limiting for Gemini API
-        await asyncio.sleep(REQUEST_DELAY_SECONDS)
-
-        # Save partial progress after every case
-        partial_report = {
-            "completed_cases": len(results),
-            "total_cases": len(cases),
-            "runtime_error_count": len(runtime_errors),
-            "cases": results,
-            "runtime_errors": runtime_errors,
-        }
-
-        with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-            json.dump(partial_report, f, ensure_ascii=False, indent=2)
+    results = await run_cases(
+        cases,
+        compare_one,
+        case_id=lambda case: case.case_id,
+        on_error=build_runtime_error_result,
+        concurrency=concurrency,
+        limiter=limiter,
+        max_retries=MAX_RETRIES_PER_CASE,
+        progress_path=PROGRESS_PATH,
+        progress_meta={"task": "constraint_resolution", "dataset": DATASET_PATH.name},
+        resume=resume,
+    )
+    runtime_errors = [result for result in results if result.get("predicted_decision") == "ERROR"]
 
     valid_results = [
         result
@@ -161,19 +132,23 @@ async def run_async() -> dict[str, Any]:
         "completed_cases": len(results),
         "valid_evaluated_cases": len(valid_results),
         "total_cases": len(cases),
+        "latency": latency_summary(results),
+        "rate_limited_count": limiter.rate_limited_total,
         "cases": results,
     }
 
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(report, f, ensure_ascii=False, indent=2)
+    save_json(OUTPUT_PATH, report)
 
     with open(ERRORS_PATH, "w", encoding="utf-8") as f:
         json.dump(runtime_errors, f, ensure_ascii=False, indent=2)
 
+    discard_checkpoint(PROGRESS_PATH)
+
     print("\n=== CONSTRAINT RESOLUTION EVAL ===")
     print(f"completed_cases: {len(results)}")
     print(f"valid_evaluated_cases: {len(valid_results)}")
     print(f"runtime_errors: {len(runtime_errors)}")
+    print(f"latency: {json.dumps(report['latency'])}")
 
     if overall_metrics:
         print("\nOverall metrics:")
@@ -212,9 +187,23 @@ async def run_async() -> dict[str, Any]:
     return report
 
 
-def run() -> dict[str, Any]:
-    return asyncio.run(run_async())
+def run(**kwargs: Any) -> dict[str, Any]:
+    return asyncio.run(run_async(**kwargs))
 
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Constraint resolution eval")
+    parser.add_argument("--all", action="store_true", help="run every case, not just CASE_IDS")
+    parser.add_argument("--max-cases", type=int, default=MAX_CASES)
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY)
+    parser.add_argument("--rps", type=float, default=REQUESTS_PER_SECOND, help="initial requests per second")
+    parser.add_argument("--fresh", action="store_true", help="ignore and clear previous progress")
+    args = parser.parse_args()
+
+    run(
+        case_ids=None if args.all else CASE_IDS,
+        max_cases=args.max_cases,
+        concurrency=args.concurrency,
+        requests_per_second=args.rps,
+        resume=not args.fresh,
+    )
\ No newline at end of file
@@ -1,5 +1,16 @@
+import os
+
+
 def main():
-    print("Hello from booking-ai-agent!")
+    import uvicorn
+
+    uvicorn.run(
+        "app.api:create_app",
+        factory=True,
+        host=os.getenv("API_HOST", "127.0.0.1"),
+        port=int(os.getenv("API_PORT", "8000")),
+        timeout_graceful_shutdown=int(os.getenv("API_SHUTDOWN_GRACE_SECONDS", "30")),
+    )
 
 
 if __name__ == "__main__":
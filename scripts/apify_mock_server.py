@@ -0,0 +1,70 @@
+"""
+Local Apify-compatible mock server for retriever load testing.
+
+Serves fixture listings (or listings from --listings, a JSON array / JSONL
+file of Booking actor items) through the Apify endpoints used by
+ApifyRetriever and ApifyBookingService.
+
+Usage:
+    python scripts/apify_mock_server.py --port 8765 --latency-ms 800 --error-rate 0.05
+    APIFY_BASE_URL=http://127.0.0.1:8765 APIFY_TOKEN=mock python scripts/smoke_apify_search.py
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import uvicorn
+
+from app.api.apify_mock import ApifyMockConfig, create_apify_mock_app
+
+
+def load_listings(path: Path | None) -> list[dict]:
+    if path is None:
+        from app.retrieval.fixtures import load_fixture_listings
+
+        return [lst.model_dump(mode="json", exclude_none=True) for lst in load_fixture_listings()]
+
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".jsonl":
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    data = json.loads(text)
+    return data if isinstance(data, list) else [data]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--listings", type=Path, default=None)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--items-per-run", type=int, default=None)
+    parser.add_argument("--description-padding", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = ApifyMockConfig(
+        listings=load_listings(args.listings),
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        items_per_run=args.items_per_run,
+        description_padding=args.description_padding,
+        seed=args.seed,
+    )
+    uvicorn.run(create_apify_mock_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
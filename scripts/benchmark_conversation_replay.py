@@ -0,0 +1,360 @@
+"""
+End-to-end replay benchmark over the golden datasets.
+
+Every case goes through the real pipeline, with LLM responses from a
+cassette, and is scored with the dataset's own comparator and metrics:
+
+    constraint_extraction   handle_user_message -> orchestrate_search
+                            -> build_answer_payload; the turn's search
+                            state is compared with the expected constraints
+    constraint_resolution   resolve_constraint_via_textual_evidence
+    ranking_selection       select_ranked_items over the case items
+
+Each case runs in its own trace, so next to the accuracy metrics the report
+has per-stage latency (p50 / p95 / max over cases), LLM calls and tokens per
+case, and cache hit ratios. A performance change and its effect on quality
+can therefore be checked in the same run.
+
+Modes:
+    record   call Gemini (needs GOOGLE_API_KEY) and append to the cassette
+    replay   answer only from the cassette (default); misses count as errors.
+             No cassette is committed: record one first. Without one, the
+             default command prints how to do that and exits.
+    stub     canned responses, no cassette (pipeline cost only; accuracy is
+             meaningless)
+
+Usage:
+    python scripts/benchmark_conversation_replay.py --mode record
+    python scripts/benchmark_conversation_replay.py
+    python scripts/benchmark_conversation_replay.py --datasets ranking_selection --max-cases 20
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Offline: use the committed FX snapshot as-is, never refresh it.
+os.environ.setdefault("FX_CACHE_PATH", str(PROJECT_ROOT / "data" / "fx_rates_usd.json"))
+os.environ["FX_CACHE_TTL_DAYS"] = "36500"
+
+from app.logic.build_answer_payload import build_answer_payload
+from app.logic.conversation_flow import handle_user_message
+from app.schemas.fallback_policy import FallbackPolicy
+from app.schemas.search_response import NormalizedSearchResponse
+from app.services.cassette import Cassette, use_cassette
+from app.services.llm_usage import usage_from_trace
+from app.services.metrics import cache_lookups
+from app.services.tracing import Span, span, trace
+from evaluation.core.io import load_jsonl
+from evaluation.tasks.constraint_extraction import comparator as extraction_comparator
+from evaluation.tasks.constraint_extraction import metrics as extraction_metrics
+from evaluation.tasks.constraint_extraction.dataset import ConstraintEvalCase
+from evaluation.tasks.constraint_extraction.runner import (
+    build_runtime_error_result as extraction_error_result,
+)
+from evaluation.tasks.constraint_resolution import metrics as resolution_metrics
+from evaluation.tasks.constraint_resolution.dataset import load_constraint_resolution_dataset
+from evaluation.tasks.constraint_resolution.runner import (
+    build_runtime_error_result as resolution_error_result,
+    compare_one as resolution_compare_one,
+)
+from evaluation.tasks.ranking_selection import metrics as ranking_metrics
+from evaluation.tasks.ranking_selection.adapter import run_selection
+from evaluation.tasks.ranking_selection.comparator import compare_case as ranking_compare_case
+from evaluation.tasks.ranking_selection.dataset import load_ranking_selection_dataset
+
+
+DATASETS_DIR = PROJECT_ROOT / "evaluation" / "datasets"
+DEFAULT_CASSETTE = PROJECT_ROOT / "data" / "cassettes" / "golden_replay.jsonl"
+
+DATASET_FILES = {
+    "constraint_extraction": DATASETS_DIR / "constraint_extraction" / "constraint_golden_set_v2_final.jsonl",
+    "constraint_resolution": DATASETS_DIR / "constraint_resolution" / "constraint_resolution_golden_set_120_cleaned.jsonl",
+    "ranking_selection": DATASETS_DIR / "ranking_selection" / "ranking_selection_golden_set.jsonl",
+}
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _distribution(values: list[float]) -> dict[str, float]:
+    return {
+        "p50_ms": round(statistics.median(values), 3) if values else 0.0,
+        "p95_ms": round(_percentile(values, 95), 3),
+        "max_ms": round(max(values), 3) if values else 0.0,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Per-dataset case runners: (case) -> comparator result, run inside a trace
+# ---------------------------------------------------------------------------
+
+async def _extraction_case(case: ConstraintEvalCase) -> dict[str, Any]:
+    result = await handle_user_message(
+        user_message=case.user_message,
+        source="fixtures",
+        top_n=5,
+        fallback_policy=FallbackPolicy(enabled=True, top_k=5),
+        max_items=10,
+    )
+
+    if not result.get("need_clarification"):
+        with span("answer_payload"):
+            build_answer_payload(
+                NormalizedSearchResponse.model_validate(result),
+                latest_user_query=case.user_message,
+                top_k=3,
+            )
+
+    return extraction_comparator.compare_case(case, result.get("state") or {})
+
+
+async def _ranking_case(case: dict[str, Any]) -> dict[str, Any]:
+    with span("ranking_selection"):
+        predicted = run_selection(input_items=case["input_items"], top_n=case["top_n"])
+    return ranking_compare_case(case=case, predicted_items=predicted)
+
+
+def _extraction_metrics(results: list[dict[str, Any]]) -> dict[str, Any]:
+    return extraction_metrics.compute_metrics(results)
+
+
+def _resolution_metrics(results: list[dict[str, Any]]) -> dict[str, Any]:
+    valid = [r for r in results if r.get("predicted_decision") in {"YES", "NO", "UNCERTAIN"}]
+    return resolution_metrics.compute_metrics(valid) if valid else {}
+
+
+def _ranking_metrics(results: list[dict[str, Any]]) -> dict[str, Any]:
+    return ranking_metrics.compute_metrics(results)
+
+
+class _Dataset:
+    def __init__(
+        self,
+        name: str,
+        load: Callable[[], list[Any]],
+        run: Callable[[Any], Awaitable[dict[str, Any]]],
+        on_error: Callable[[Any, Exception], dict[str, Any]],
+        metrics: Callable[[list[dict[str, Any]]], dict[str, Any]],
+        case_id: Callable[[Any], str],
+    ) -> None:
+        self.name = name
+        self.load = load
+        self.run = run
+        self.on_error = on_error
+        self.metrics = metrics
+        self.case_id = case_id
+
+
+DATASETS: dict[str, _Dataset] = {
+    "constraint_extraction": _Dataset(
+        "constraint_extraction",
+        load=lambda: [
+            ConstraintEvalCase.model_validate(row)
+            for row in load_jsonl(DATASET_FILES["constraint_extraction"])
+        ],
+        run=_extraction_case,
+        on_error=extraction_error_result,
+        metrics=_extraction_metrics,
+        case_id=lambda case: case.case_id,
+    ),
+    "constraint_resolution": _Dataset(
+        "constraint_resolution",
+        load=lambda: load_constraint_resolution_dataset(DATASET_FILES["constraint_resolution"]),
+        run=resolution_compare_one,
+        on_error=resolution_error_result,
+        metrics=_resolution_metrics,
+        case_id=lambda case: case.case_id,
+    ),
+    "ranking_selection": _Dataset(
+        "ranking_selection",
+        load=lambda: load_ranking_selection_dataset(str(DATASET_FILES["ranking_selection"])),
+        run=_ranking_case,
+        on_error=lambda case, e: {"case_id": case.get("case_id"), "error": f"{type(e).__name__}: {e}"},
+        metrics=_ranking_metrics,
+        case_id=lambda case: str(case.get("case_id")),
+    ),
+}
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+def _case_perf(root: Span) -> dict[str, Any]:
+    usage = usage_from_trace(root).total
+    return {
+        "total_ms": root.duration_ms or 0.0,
+        "stages_ms": {name: ms for name, ms in root.breakdown().items() if name != root.name},
+        "llm_calls": usage.calls,
+        "llm_tokens": usage.total_tokens,
+        "cache": cache_lookups(root),
+    }
+
+
+def _summarize_perf(perfs: list[dict[str, Any]]) -> dict[str, Any]:
+    stage_values: dict[str, list[float]] = {}
+    cache_totals: dict[str, dict[str, int]] = {}
+    for perf in perfs:
+        for stage, ms in perf["stages_ms"].items():
+            stage_values.setdefault(stage, []).append(ms)
+        for cache, counts in perf["cache"].items():
+            totals = cache_totals.setdefault(cache, {"hit": 0, "miss": 0})
+            totals["hit"] += counts["hit"]
+            totals["miss"] += counts["miss"]
+
+    n = len(perfs) or 1
+    return {
+        "case_ms": _distribution([p["total_ms"] for p in perfs]),
+        "stages": {
+            stage: {"cases": len(values), **_distribution(values)}
+            for stage, values in sorted(stage_values.items())
+        },
+        "llm_calls_per_case": round(sum(p["llm_calls"] for p in perfs) / n, 3),
+        "llm_tokens_per_case": round(sum(p["llm_tokens"] for p in perfs) / n, 1),
+        "cache_hit_ratio": {
+            cache: {
+                **counts,
+                "ratio": round(counts["hit"] / (counts["hit"] + counts["miss"]), 4)
+                if counts["hit"] + counts["miss"]
+                else None,
+            }
+            for cache, counts in sorted(cache_totals.items())
+        },
+    }
+
+
+async def benchmark_dataset(dataset: _Dataset, *, max_cases: int | None) -> dict[str, Any]:
+    cases = dataset.load()
+    if max_cases is not None:
+        cases = cases[:max_cases]
+
+    results: list[dict[str, Any]] = []
+    perfs: list[dict[str, Any]] = []
+    errors: list[dict[str, str]] = []
+
+    for case in cases:
+        with trace("case", dataset=dataset.name) as root:
+            try:
+                result = await dataset.run(case)
+            except Exception as e:
+                result = dataset.on_error(case, e)
+                errors.append({"case_id": dataset.case_id(case), "error": f"{type(e).__name__}: {e}"})
+        results.append(result)
+        perfs.append(_case_perf(root))
+
+    return {
+        "cases": len(cases),
+        "runtime_errors": len(errors),
+        "runtime_error_samples": errors[:5],
+        "accuracy": dataset.metrics(results),
+        "performance": _summarize_perf(perfs),
+    }
+
+
+async def run_benchmark(
+    *,
+    datasets: list[str],
+    mode: str,
+    cassette_path: Path,
+    max_cases: int | None,
+) -> dict[str, Any]:
+    report: dict[str, Any] = {
+        "benchmark": "conversation_replay",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mode": mode,
+        "max_cases": max_cases,
+        "datasets": {},
+    }
+
+    cassette = Cassette(mode, cassette_path if mode in ("record", "replay") else None)  # type: ignore[arg-type]
+    with use_cassette(cassette):
+        for name in datasets:
+            report["datasets"][name] = await benchmark_dataset(DATASETS[name], max_cases=max_cases)
+
+    report["cassette"] = cassette.stats()
+    return report
+
+
+def _parse_datasets(raw: str) -> list[str]:
+    names = [x.strip() for x in raw.split(",") if x.strip()]
+    unknown = [n for n in names if n not in DATASETS]
+    if not names or unknown:
+        raise argparse.ArgumentTypeError(f"datasets must be among {sorted(DATASETS)}")
+    return names
+
+
+_NO_CASSETTE_HINT = """\
+No cassette at {cassette}: nothing to replay yet.
+
+Record the golden datasets once (needs GOOGLE_API_KEY; re-record after a
+prompt change: cassette keys hash the model, the system instruction and
+the prompt, so edited prompts miss instead of replaying stale answers):
+    python scripts/benchmark_conversation_replay.py --mode record
+then replay offline as often as needed:
+    python scripts/benchmark_conversation_replay.py
+Pipeline cost only, without a cassette (accuracy is meaningless):
+    python scripts/benchmark_conversation_replay.py --mode stub"""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--datasets", type=_parse_datasets, default=list(DATASETS))
+    parser.add_argument("--mode", choices=("record", "replay", "stub"), default=None, help="default: replay")
+    parser.add_argument("--cassette", type=Path, default=DEFAULT_CASSETTE)
+    parser.add_argument("--max-cases", type=int, default=None, help="per dataset")
+    parser.add_argument("--out", type=Path, default=None)
+    args = parser.parse_args()
+
+    if args.mode is None:
+        args.mode = "replay"
+        if not args.cassette.exists():
+            # No cassette is shipped (recording needs a Gemini key, and the
+            # responses are tied to the current prompts): explain the first
+            # step instead of failing.
+            print(_NO_CASSETTE_HINT.format(cassette=args.cassette), file=sys.stderr)
+            return 0
+    elif args.mode == "replay" and not args.cassette.exists():
+        parser.error(f"{args.cassette} does not exist; record it first with --mode record (or use --mode stub)")
+
+    with contextlib.ExitStack() as stack:
+        # Pipeline debug prints would end up in the JSON on stdout.
+        devnull = stack.enter_context(open(os.devnull, "w", encoding="utf-8"))
+        with contextlib.redirect_stdout(devnull):
+            report = asyncio.run(
+                run_benchmark(
+                    datasets=args.datasets,
+                    mode=args.mode,
+                    cassette_path=args.cassette,
+                    max_cases=args.max_cases,
+                )
+            )
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out is not None:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+"""
+Import-time benchmark: cold-start cost of the app's entry modules.
+
+Each module is imported in a fresh interpreter (--repeats times) and the
+report has the import time (p50 / min, interpreter start-up excluded), the
+number of modules loaded and which heavy SDKs came along with it.
+
+The pure matching / ranking path (workers, tests, offline scripts) must not
+pull in the LLM / provider SDKs: google.adk, google.genai, apify_client and
+requests are imported on first use only. With --fail-on-heavy the exit code
+is 1 if one of the PURE_MODULES loads any of them.
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --repeats 10 --fail-on-heavy
+    python scripts/benchmark_import_time.py --modules app.api.app
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Must stay cheap: no LLM / provider SDK at import time.
+PURE_MODULES = (
+    "app.logic.matcher_structured",
+    "app.logic.result_selection",
+    "app.logic.normalize_search_response",
+    "app.retrieval.fixtures",
+    "app.tools.orchestrate_search_tool",
+    "app.logic.conversation_flow",
+)
+
+# Reported for reference (the service itself needs FastAPI).
+OTHER_MODULES = (
+    "app.api.app",
+)
+
+HEAVY_PACKAGES = (
+    "google.adk",
+    "google.genai",
+    "apify_client",
+    "requests",
+)
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted(p for p in {heavy!r} if p in sys.modules)
+print(json.dumps({{"ms": elapsed * 1000, "modules": len(sys.modules), "heavy": heavy}}))
+"""
+
+
+def _probe(module: str) -> dict[str, Any]:
+    code = _PROBE.format(module=module, heavy=HEAVY_PACKAGES)
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def benchmark_module(module: str, *, repeats: int) -> dict[str, Any]:
+    runs = [_probe(module) for _ in range(repeats)]
+    times = [r["ms"] for r in runs]
+    return {
+        "p50_ms": round(statistics.median(times), 1),
+        "min_ms": round(min(times), 1),
+        "modules_loaded": runs[-1]["modules"],
+        "heavy_loaded": runs[-1]["heavy"],
+    }
+
+
+def run_benchmark(modules: list[str], *, repeats: int) -> dict[str, Any]:
+    report: dict[str, Any] = {
+        "benchmark": "import_time",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeats": repeats,
+        "heavy_packages": list(HEAVY_PACKAGES),
+        "modules": {},
+    }
+    for module in modules:
+        report["modules"][module] = benchmark_module(module, repeats=repeats)
+
+    report["heavy_on_pure_path"] = {
+        module: result["heavy_loaded"]
+        for module, result in report["modules"].items()
+        if module in PURE_MODULES and result["heavy_loaded"]
+    }
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", type=lambda raw: [m.strip() for m in raw.split(",") if m.strip()], default=None)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--fail-on-heavy", action="store_true")
+    parser.add_argument("--out", type=Path, default=None)
+    args = parser.parse_args()
+
+    modules = args.modules or [*PURE_MODULES, *OTHER_MODULES]
+    report = run_benchmark(modules, repeats=max(1, args.repeats))
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out is not None:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+    if args.fail_on_heavy and report["heavy_on_pure_path"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
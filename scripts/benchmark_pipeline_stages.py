@@ -0,0 +1,478 @@
+"""
+Stage-level benchmark of the search pipeline, offline.
+
+Every external call goes through the stub cassette (no Gemini, no Apify,
+no FX refresh), and each stage of orchestrate_search is timed on its own
+over seeded synthetic corpora of increasing size:
+
+    intent_validation   _validate_and_repair_intent + context + SearchRequest
+    retrieval           FixturesRetriever over the corpus file (cold parse)
+    initial_filters     city/date/occupancy filters
+    rank_structured     _rank_structured
+    fallback_layer      constraint fallback (top-K) + resolution scoring
+    select_ranked       must/numeric filter + select_ranked_items
+    normalize           normalize_search_response
+    answer_payload      build_answer_payload
+
+Downstream stages rank the whole corpus by default (--rank-on corpus), as
+with Apify results that are already scoped to city/dates; --rank-on filtered
+ranks only what survives the initial filters.
+
+The report (JSON on stdout, or --out) has p50/p95/mean, throughput and
+tracemalloc peak per stage and size. With --baseline, p50 is compared
+against a stored report; --save-baseline writes the current one.
+
+Usage:
+    python scripts/benchmark_pipeline_stages.py --sizes 500,2000,10000
+    python scripts/benchmark_pipeline_stages.py --baseline data/benchmarks/pipeline_stages_baseline.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Offline: use the committed FX snapshot as-is, never refresh it.
+os.environ.setdefault("FX_CACHE_PATH", str(PROJECT_ROOT / "data" / "fx_rates_usd.json"))
+os.environ["FX_CACHE_TTL_DAYS"] = "36500"
+
+from app.logic.build_answer_payload import build_answer_payload
+from app.logic.request_resolution import resolve_required_search_context
+from app.logic.ranked_item import RankedItem
+from app.logic.result_selection import select_ranked_items
+from app.logic.normalize_search_response import normalize_search_response
+from app.retrieval.fixtures import FixturesRetriever, _load_fixture_listings
+from app.retrieval.synthetic import write_synthetic_corpus
+from app.services.cassette import Cassette, use_cassette
+from app.tools.orchestrate_search_tool import (
+    _apply_constraint_fallback_layer,
+    _apply_constraint_resolution_scoring,
+    _build_fallback_policy,
+    _build_request,
+    _constraints_by_priority,
+    _fails_must,
+    _fails_numeric_filters,
+    _filter_initial_candidates,
+    _known_mapped_fields,
+    _rank_structured,
+    _validate_and_repair_intent,
+)
+
+
+DEFAULT_BASELINE = PROJECT_ROOT / "data" / "benchmarks" / "pipeline_stages_baseline.json"
+
+USER_TEXT = "apartment in Baku from May 10 to May 13 with a kitchen and balcony, quiet, under 900 USD"
+
+INTENT: dict[str, Any] = {
+    "city": "Baku",
+    "check_in": "2026-05-10",
+    "check_out": "2026-05-13",
+    "adults": 2,
+    "constraints": [
+        {
+            "raw_text": "kitchen",
+            "normalized_text": "kitchen",
+            "priority": "must",
+            "category": "amenity",
+            "mapping_status": "known",
+            "mapped_fields": ["kitchen"],
+            "evidence_strategy": "structured",
+        },
+        {
+            "raw_text": "balcony",
+            "normalized_text": "balcony",
+            "priority": "nice",
+            "category": "amenity",
+            "mapping_status": "known",
+            "mapped_fields": ["balcony"],
+            "evidence_strategy": "structured",
+        },
+        {
+            "raw_text": "quiet",
+            "normalized_text": "quiet area",
+            "priority": "must",
+            "category": "location",
+            "mapping_status": "unresolved",
+            "mapped_fields": [],
+            "evidence_strategy": "textual",
+        },
+    ],
+    "filters": {
+        "price": {"max_amount": 900, "currency": "USD", "scope": "total_stay"},
+    },
+}
+
+STAGES: tuple[str, ...] = (
+    "intent_validation",
+    "retrieval",
+    "initial_filters",
+    "rank_structured",
+    "fallback_layer",
+    "select_ranked",
+    "normalize",
+    "answer_payload",
+)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def _call(fn: Callable[[], Any]) -> Any:
+    result = fn()
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+class _Stage:
+    """
+    One timed stage: setup() builds fresh input (untimed), run(input) is timed.
+
+    items is the number of listings the stage works on (for throughput).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[Any], Any | Awaitable[Any]],
+        *,
+        setup: Callable[[], Any] | None = None,
+        items: int = 1,
+    ) -> None:
+        self.name = name
+        self.run = run
+        self.setup = setup or (lambda: None)
+        self.items = max(1, items)
+
+
+async def _time_stage(stage: _Stage, *, repeats: int, warmup: int) -> dict[str, Any]:
+    durations: list[float] = []
+    for i in range(warmup + repeats):
+        arg = stage.setup()
+        started = time.perf_counter()
+        await _call(lambda: stage.run(arg))
+        elapsed = time.perf_counter() - started
+        if i >= warmup:
+            durations.append(elapsed)
+
+    mean = statistics.fmean(durations)
+    p50 = statistics.median(durations)
+    return {
+        "items": stage.items,
+        "repeats": repeats,
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(_percentile(durations, 95) * 1000, 3),
+        "mean_ms": round(mean * 1000, 3),
+        "throughput_items_per_s": round(stage.items / p50, 1) if p50 > 0 else None,
+    }
+
+
+async def _peak_memory_kb(stage: _Stage) -> float:
+    # Separate pass: tracemalloc slows allocations down and would skew timings.
+    arg = stage.setup()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await _call(lambda: stage.run(arg))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(max(0, peak - before) / 1024, 1)
+
+
+async def _build_stages(corpus_path: Path, *, size: int, top_n: int, rank_on: str) -> tuple[list[_Stage], dict[str, int]]:
+    """Run the pipeline once to get each stage's real input, then wrap the stages."""
+
+    async def intent_validation(_: Any):
+        intent_obj, dropped = await _validate_and_repair_intent(INTENT, attempts=2)
+        resolved = resolve_required_search_context(intent_obj)
+        req = _build_request(
+            user_text=USER_TEXT,
+            intent_obj=intent_obj,
+            city=resolved.city,
+            check_in=resolved.check_in,
+            check_out=resolved.check_out,
+        )
+        return req, dropped
+
+    req, dropped = await intent_validation(None)
+    retriever = FixturesRetriever(corpus_path)
+
+    async def retrieval(_: Any):
+        _load_fixture_listings.cache_clear()
+        return await retriever.get_candidates(req, max_items=size)
+
+    listings = await retrieval(None)
+    filtered = _filter_initial_candidates(req, listings, source="fixtures")
+    candidates = listings if rank_on == "corpus" else filtered
+
+    policy = _build_fallback_policy(fallback_top_k=5)
+
+    async def fallback_layer(ranked: list[RankedItem]):
+        await _apply_constraint_fallback_layer(req, ranked, policy=policy)
+        return _apply_constraint_resolution_scoring(ranked)
+
+    must_constraints, _, _ = _constraints_by_priority(req)
+    structured_must_fields = _known_mapped_fields(must_constraints)
+
+    def select_ranked(ranked: list[RankedItem]):
+        kept = [
+            it
+            for it in ranked
+            if not _fails_must(it.matches, structured_must_fields)
+            and not _fails_numeric_filters(it.numeric_results)
+        ]
+        kept.sort(key=lambda x: x.score, reverse=True)
+        return select_ranked_items(kept, top_n=len(kept))
+
+    ranked = _rank_structured(req, candidates)
+    await fallback_layer(ranked)
+    ordered = select_ranked(ranked)
+    selected = ordered[:top_n]
+    normalized = normalize_search_response(req, selected, top_n=top_n, dropped_requests=dropped)
+
+    stages = [
+        _Stage("intent_validation", intent_validation),
+        _Stage("retrieval", retrieval, items=size),
+        _Stage(
+            "initial_filters",
+            lambda _: _filter_initial_candidates(req, listings, source="fixtures"),
+            items=len(listings),
+        ),
+        _Stage("rank_structured", lambda _: _rank_structured(req, candidates), items=len(candidates)),
+        # Fallback and scoring mutate ranked items, so each run gets a fresh ranking.
+        _Stage("fallback_layer", fallback_layer, setup=lambda: _rank_structured(req, candidates), items=len(candidates)),
+        _Stage("select_ranked", select_ranked, setup=lambda: [it.copy() for it in ranked], items=len(ranked)),
+        _Stage(
+            "normalize",
+            lambda _: normalize_search_response(req, selected, top_n=top_n, dropped_requests=dropped),
+            items=len(selected),
+        ),
+        _Stage(
+            "answer_payload",
+            lambda _: build_answer_payload(normalized, latest_user_query=USER_TEXT, top_k=3),
+            items=len(selected),
+        ),
+    ]
+    counts = {
+        "corpus": size,
+        "retrieved": len(listings),
+        "after_initial_filters": len(filtered),
+        "ranked": len(ranked),
+        "selected": len(selected),
+    }
+    return stages, counts
+
+
+async def benchmark_size(
+    corpus_path: Path,
+    *,
+    size: int,
+    top_n: int,
+    rank_on: str,
+    repeats: int,
+    warmup: int,
+    memory: bool,
+) -> dict[str, Any]:
+    stages, counts = await _build_stages(corpus_path, size=size, top_n=top_n, rank_on=rank_on)
+
+    results: dict[str, Any] = {}
+    for stage in stages:
+        row = await _time_stage(stage, repeats=repeats, warmup=warmup)
+        if memory:
+            row["peak_memory_kb"] = await _peak_memory_kb(stage)
+        results[stage.name] = row
+
+    return {"counts": counts, "stages": results}
+
+
+def compare_with_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float,
+    min_ms: float = 1.0,
+) -> dict[str, Any]:
+    """
+    Per (size, stage) p50 ratio current/baseline.
+
+    ratio > 1 + tolerance -> "regression", ratio < 1 - tolerance -> "improvement".
+    Stages faster than min_ms on both sides are timer noise ("below_floor").
+    Pairs missing on either side are skipped.
+    """
+    rows: dict[str, dict[str, Any]] = {}
+    regressions: list[str] = []
+    improvements: list[str] = []
+
+    for size, current in report.get("sizes", {}).items():
+        base_size = baseline.get("sizes", {}).get(size)
+        if not base_size:
+            continue
+        for name, cur in current["stages"].items():
+            base = base_size["stages"].get(name)
+            if not base or not base.get("p50_ms"):
+                continue
+
+            ratio = cur["p50_ms"] / base["p50_ms"]
+            if max(cur["p50_ms"], base["p50_ms"]) < min_ms:
+                status = "below_floor"
+            elif ratio > 1 + tolerance:
+                status = "regression"
+                regressions.append(f"{size}/{name}")
+            elif ratio < 1 - tolerance:
+                status = "improvement"
+                improvements.append(f"{size}/{name}")
+            else:
+                status = "ok"
+
+            rows.setdefault(size, {})[name] = {
+                "p50_ms": cur["p50_ms"],
+                "baseline_p50_ms": base["p50_ms"],
+                "ratio": round(ratio, 3),
+                "status": status,
+            }
+
+    return {
+        "tolerance": tolerance,
+        "min_ms": min_ms,
+        "regressions": regressions,
+        "improvements": improvements,
+        "sizes": rows,
+    }
+
+
+async def run_benchmark(
+    *,
+    sizes: list[int],
+    seed: int,
+    top_n: int,
+    rank_on: str,
+    repeats: int,
+    warmup: int,
+    memory: bool,
+    corpus_dir: Path,
+) -> dict[str, Any]:
+    report: dict[str, Any] = {
+        "benchmark": "pipeline_stages",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "top_n": top_n,
+        "rank_on": rank_on,
+        "repeats": repeats,
+        "warmup": warmup,
+        "stages": list(STAGES),
+        "sizes": {},
+    }
+
+    cassette = Cassette("stub")
+    with use_cassette(cassette):
+        for size in sizes:
+            corpus_path = corpus_dir / f"synthetic_{seed}_{size}.jsonl"
+            if not corpus_path.exists():
+                write_synthetic_corpus(corpus_path, size, seed=seed)
+
+            report["sizes"][str(size)] = await benchmark_size(
+                corpus_path,
+                size=size,
+                top_n=top_n,
+                rank_on=rank_on,
+                repeats=repeats,
+                warmup=warmup,
+                memory=memory,
+            )
+
+    report["cassette"] = cassette.stats()
+    return report
+
+
+def _parse_sizes(raw: str) -> list[int]:
+    sizes = [int(x) for x in raw.split(",") if x.strip()]
+    if not sizes or any(s < 1 for s in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive integers")
+    return sizes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=_parse_sizes, default=[500, 2000, 10000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top-n", type=int, default=5)
+    parser.add_argument("--rank-on", choices=("corpus", "filtered"), default="corpus")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--corpus-dir", type=Path, default=None, help="keep generated corpora here (default: temp dir)")
+    parser.add_argument("--baseline", type=Path, default=None, help="compare p50 against this report")
+    parser.add_argument("--save-baseline", type=Path, nargs="?", const=DEFAULT_BASELINE, default=None)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--min-ms", type=float, default=1.0, help="p50 below this is not compared")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--out", type=Path, default=None)
+    args = parser.parse_args()
+
+    with contextlib.ExitStack() as stack:
+        corpus_dir = args.corpus_dir or Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        # Pipeline debug prints would end up in the JSON on stdout.
+        devnull = stack.enter_context(open(os.devnull, "w", encoding="utf-8"))
+        with contextlib.redirect_stdout(devnull):
+            report = asyncio.run(
+                run_benchmark(
+                    sizes=args.sizes,
+                    seed=args.seed,
+                    top_n=args.top_n,
+                    rank_on=args.rank_on,
+                    repeats=max(1, args.repeats),
+                    warmup=max(0, args.warmup),
+                    memory=not args.no_memory,
+                    corpus_dir=corpus_dir,
+                )
+            )
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        report["comparison"] = compare_with_baseline(
+            report,
+            baseline,
+            tolerance=args.tolerance,
+            min_ms=args.min_ms,
+        )
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.save_baseline is not None:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        baseline_report = {k: v for k, v in report.items() if k != "comparison"}
+        args.save_baseline.write_text(json.dumps(baseline_report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    if args.out is not None:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+    if args.fail_on_regression and report.get("comparison", {}).get("regressions"):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""
+Generate a seeded synthetic ListingRaw corpus for scale benchmarks.
+
+Listings are streamed to disk, so 1M items need constant memory.
+A .jsonl path writes one listing per line; .json writes a JSON array in
+the fixtures format. Both can be passed to FixturesRetriever(path).
+
+Usage:
+    python scripts/generate_synthetic_listings.py --count 10000 --out data/synthetic/listings_10k.jsonl
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.retrieval.synthetic import write_synthetic_corpus
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, required=True)
+    args = parser.parse_args()
+
+    if not 1 <= args.count <= 1_000_000:
+        parser.error("--count must be between 1 and 1000000")
+
+    started = time.perf_counter()
+    written = write_synthetic_corpus(args.out, args.count, seed=args.seed)
+    elapsed = time.perf_counter() - started
+
+    size_mb = args.out.stat().st_size / (1024 * 1024)
+    print(f"Wrote {written} listings to {args.out} ({size_mb:.1f} MB) in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
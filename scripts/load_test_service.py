@@ -0,0 +1,200 @@
+"""
+In-process load test for the ASGI service with a stubbed LLM.
+
+Every LLM stage (intent router, conversation router, intent update,
+fallback resolver) is replaced by a deterministic stub with configurable
+latency, so the run measures the service itself: session handling,
+concurrency limits, retrieval over fixtures, ranking and normalization.
+
+Usage:
+    python scripts/load_test_service.py --users 50 --turns 3 --concurrency 16
+    python scripts/load_test_service.py --metrics-out data/metrics/load_test.prom
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections import Counter
+from datetime import date
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+
+from app.api import create_app
+from app.logic import constraint_evidence_resolution, conversation_flow
+from app.logic.apply_intent_patch import apply_intent_patch
+from app.schemas.constraints import (
+    ConstraintCategory,
+    ConstraintMappingStatus,
+    ConstraintPriority,
+    EvidenceStrategy,
+    UserConstraint,
+)
+from app.schemas.conversation_route import ConversationRouteDecision
+from app.schemas.fields import Field
+from app.schemas.intent_patch import SearchIntentPatch
+from app.schemas.query import SearchRequest
+
+
+TURNS = [
+    "apartment in Baku from April 8 to April 15 with a kitchen",
+    "add a balcony",
+    "show me more",
+    "also something quiet",
+]
+
+
+def _constraint(text: str, *, field: Field | None = None) -> UserConstraint:
+    return UserConstraint(
+        raw_text=text,
+        normalized_text=text,
+        priority=ConstraintPriority.MUST,
+        category=ConstraintCategory.AMENITY if field else ConstraintCategory.OTHER,
+        mapping_status=ConstraintMappingStatus.KNOWN if field else ConstraintMappingStatus.UNRESOLVED,
+        mapped_fields=[field] if field else [],
+        evidence_strategy=EvidenceStrategy.STRUCTURED if field else EvidenceStrategy.TEXTUAL,
+    )
+
+
+def install_stub_llm(latency_ms: float) -> None:
+    delay = latency_ms / 1000.0
+
+    async def build_search_request(user_message: str) -> SearchRequest:
+        await asyncio.sleep(delay)
+        return SearchRequest(
+            city="Baku",
+            check_in=date(2026, 4, 8),
+            check_out=date(2026, 4, 15),
+            constraints=[_constraint("kitchen", field=Field.KITCHEN)],
+        )
+
+    async def route_conversation(*, user_message: str, **_: object) -> ConversationRouteDecision:
+        await asyncio.sleep(delay)
+        route = "show_more" if "more" in user_message else "search_update"
+        return ConversationRouteDecision(route=route, reason="stub")
+
+    async def update_search_state(previous_state: SearchRequest, user_message: str) -> SearchRequest:
+        await asyncio.sleep(delay)
+        if "balcony" in user_message:
+            patch = SearchIntentPatch(add_constraints=[_constraint("balcony", field=Field.BALCONY)])
+        else:
+            patch = SearchIntentPatch(add_constraints=[_constraint(user_message)])
+        return apply_intent_patch(previous_state, patch)
+
+    async def resolve_constraint(req, *, model=None):
+        await asyncio.sleep(delay)
+        return constraint_evidence_resolution.ConstraintResolutionResult(
+            listing_id=req.listing_id,
+            listing_title=req.listing_title,
+            constraint_id=req.constraint_id,
+            raw_text=req.raw_text,
+            normalized_text=req.normalized_text,
+            resolver_type="textual",
+            decision="UNCERTAIN",
+            resolution_status="uncertain",
+            confidence=0.3,
+            reason="stub resolver",
+            evidence=[],
+        )
+
+    conversation_flow.build_search_request_adk_async = build_search_request
+    conversation_flow.route_conversation_async = route_conversation
+    conversation_flow.update_search_state_async = update_search_state
+    constraint_evidence_resolution.resolve_constraint_via_textual_evidence = resolve_constraint
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def run_load_test(
+    *,
+    users: int,
+    turns: int,
+    concurrency: int,
+    llm_latency_ms: float,
+    metrics_out: Path | None = None,
+) -> dict:
+    install_stub_llm(llm_latency_ms)
+    app = create_app(max_concurrency=concurrency, queue_timeout=30.0)
+
+    latencies: list[float] = []
+    statuses: Counter[int] = Counter()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=120.0) as client:
+
+        async def one_user(i: int) -> None:
+            session_id = f"load-{i}"
+            for message in TURNS[:turns]:
+                started = time.perf_counter()
+                resp = await client.post(
+                    "/v1/messages",
+                    json={"session_id": session_id, "message": message, "top_n": 5},
+                )
+                latencies.append(time.perf_counter() - started)
+                statuses[resp.status_code] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one_user(i) for i in range(users)))
+        elapsed = time.perf_counter() - started
+
+        metrics = (await client.get("/metrics")).json()
+        if metrics_out is not None:
+            metrics_out.parent.mkdir(parents=True, exist_ok=True)
+            metrics_out.write_text((await client.get("/metrics/prometheus")).text, encoding="utf-8")
+
+    return {
+        "users": users,
+        "turns_per_user": turns,
+        "concurrency": concurrency,
+        "llm_latency_ms": llm_latency_ms,
+        "requests": len(latencies),
+        "status_codes": dict(statuses),
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed > 0 else None,
+        "latency_ms": {
+            "p50": round(statistics.median(latencies) * 1000, 2) if latencies else None,
+            "p95": round(_percentile(latencies, 95) * 1000, 2),
+            "p99": round(_percentile(latencies, 99) * 1000, 2),
+            "max": round(max(latencies) * 1000, 2) if latencies else None,
+        },
+        "service_metrics": metrics,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=3, choices=range(1, len(TURNS) + 1))
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--llm-latency-ms", type=float, default=50.0)
+    parser.add_argument("--metrics-out", type=Path, default=None, help="write Prometheus text metrics here")
+    args = parser.parse_args()
+
+    report = asyncio.run(
+        run_load_test(
+            users=args.users,
+            turns=args.turns,
+            concurrency=args.concurrency,
+            llm_latency_ms=args.llm_latency_ms,
+            metrics_out=args.metrics_out,
+        )
+    )
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
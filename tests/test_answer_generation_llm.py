@@ -20,4 +20,59 @@
 
 #     out = await generate_user_answer_with_llm(payload, use_fallback_on_error=True)
 
-#     assert "В каком городе искать?" in out
\ No newline at end of file
+#     assert "В каком городе искать?" in out
+
+import pytest
+from types import SimpleNamespace
+
+from app.logic import answer_generation_llm
+from app.logic.answer_generation_llm import _cleanup_llm_answer, stream_user_answer_with_llm
+
+
+def _fake_stream_client(chunks, *, fail_after=None):
+    async def _stream():
+        for i, text in enumerate(chunks):
+            if fail_after is not None and i == fail_after:
+                raise RuntimeError("stream dropped")
+            yield SimpleNamespace(text=text)
+
+    async def generate_content_stream(**kwargs):
+        return _stream()
+
+    return SimpleNamespace(
+        aio=SimpleNamespace(models=SimpleNamespace(generate_content_stream=generate_content_stream))
+    )
+
+
+CLARIFICATION_PAYLOAD = {
+    "need_clarification": True,
+    "questions": ["В каком городе искать?"],
+    "request_summary": None,
+    "results_count": 0,
+    "top_results": [],
+}
+
+
+@pytest.mark.asyncio
+async def test_stream_user_answer_matches_non_streaming_cleanup(monkeypatch):
+    chunks = ["  I found **2** options.\n\n- Top", " pick: [https://a.example](https://a.example)\n", "- It  might not allow pets"]
+    monkeypatch.setattr(answer_generation_llm, "_gemini_client", lambda: _fake_stream_client(chunks))
+
+    out = [c async for c in stream_user_answer_with_llm({"top_results": []}, model="m")]
+
+    assert out[0] == "I found 2 options."
+    assert "".join(out) == _cleanup_llm_answer("".join(chunks))
+
+
+@pytest.mark.asyncio
+async def test_stream_user_answer_falls_back_when_stream_fails(monkeypatch):
+    monkeypatch.setattr(
+        answer_generation_llm,
+        "_gemini_client",
+        lambda: _fake_stream_client(["First line\n", "never sent"], fail_after=1),
+    )
+
+    out = [c async for c in stream_user_answer_with_llm(CLARIFICATION_PAYLOAD, model="m")]
+
+    assert out[0] == "First line"
+    assert "В каком городе искать?" in out[-1]
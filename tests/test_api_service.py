@@ -0,0 +1,189 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.api import create_app
+from app.api import sessions as sessions_module
+from app.api.sessions import InMemorySessionStore
+from app.schemas.api import MessageRequest
+
+
+def _client(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_healthz_and_metrics():
+    app = create_app()
+
+    async with _client(app) as client:
+        health = await client.get("/healthz")
+        metrics = await client.get("/metrics")
+
+    assert health.status_code == 200
+    assert health.json() == {"status": "ok"}
+    assert metrics.json()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_messages_keep_state_per_session(monkeypatch):
+    seen_previous_states = []
+
+    async def _fake_handle_user_message(**kwargs):
+        previous_state = kwargs["previous_state"]
+        seen_previous_states.append(previous_state)
+        assert kwargs["result_context"] is not None
+        return {
+            "need_clarification": False,
+            "results": [],
+            "state": {"city": "Baku", "adults": 2, "children": 0, "rooms": 1, "constraints": []},
+        }
+
+    monkeypatch.setattr(
+        "app.logic.conversation_flow.handle_user_message",
+        _fake_handle_user_message,
+    )
+
+    app = create_app()
+
+    async with _client(app) as client:
+        first = await client.post("/v1/messages", json={"message": "Baku"})
+        session_id = first.json()["session_id"]
+        second = await client.post("/v1/messages", json={"session_id": session_id, "message": "add kitchen"})
+
+    assert first.status_code == 200
+    assert second.json()["session_id"] == session_id
+    assert seen_previous_states[0] is None
+    assert seen_previous_states[1].city == "Baku"
+
+
+@pytest.mark.asyncio
+async def test_requests_over_concurrency_limit_are_rejected(monkeypatch):
+    release = asyncio.Event()
+
+    async def _slow_orchestrate_search(**kwargs):
+        await release.wait()
+        return {"need_clarification": False, "results": []}
+
+    monkeypatch.setattr(
+        "app.tools.orchestrate_search_tool.orchestrate_search",
+        _slow_orchestrate_search,
+    )
+
+    app = create_app(max_concurrency=1, queue_timeout=0.01)
+    body = {"intent": {"city": "Baku"}}
+
+    async with _client(app) as client:
+        first = asyncio.create_task(client.post("/v1/search", json=body))
+        await asyncio.sleep(0.05)
+        rejected = await client.post("/v1/search", json=body)
+        release.set()
+        accepted = await first
+
+    assert rejected.status_code == 503
+    assert accepted.status_code == 200
+    assert app.state.limiter.rejected_total == 1
+
+
+@pytest.mark.asyncio
+async def test_draining_limiter_rejects_new_requests():
+    app = create_app()
+
+    assert await app.state.limiter.drain(timeout=0.1) is True
+
+    async with _client(app) as client:
+        health = await client.get("/healthz")
+        resp = await client.post("/v1/search", json={"intent": {}})
+
+    assert health.status_code == 503
+    assert resp.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_message_stream_sends_events_and_keeps_state(monkeypatch):
+    async def _fake_handle_user_message_events(**kwargs):
+        yield {"event": "parsed_intent", "data": {"state": {"city": "Baku"}}}
+        yield {
+            "event": "final",
+            "data": {
+                "need_clarification": False,
+                "results": [],
+                "state": {"city": "Baku", "adults": 2, "children": 0, "rooms": 1, "constraints": []},
+            },
+        }
+
+    monkeypatch.setattr(
+        "app.logic.conversation_flow.handle_user_message_events",
+        _fake_handle_user_message_events,
+    )
+
+    app = create_app()
+
+    async with _client(app) as client:
+        resp = await client.post("/v1/messages/stream", json={"session_id": "s-1", "message": "Baku"})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert "event: parsed_intent" in resp.text
+    assert resp.text.rstrip().splitlines()[-2] == "event: final"
+    assert app.state.sessions.get_or_create("s-1").search_state["city"] == "Baku"
+    assert app.state.limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_message_stream_keeps_its_session_while_other_sessions_arrive(monkeypatch):
+    async def _fake_handle_user_message_events(**kwargs):
+        yield {
+            "event": "final",
+            "data": {"results": [], "state": {"city": "Baku", "adults": 2, "children": 0, "rooms": 1, "constraints": []}},
+        }
+
+    monkeypatch.setattr(
+        "app.logic.conversation_flow.handle_user_message_events",
+        _fake_handle_user_message_events,
+    )
+
+    store = InMemorySessionStore(max_sessions=2, ttl_seconds=3600)
+    app = create_app(session_store=store)
+    endpoint = next(route.endpoint for route in app.routes if getattr(route, "path", None) == "/v1/messages/stream")
+
+    # The response is returned before its body runs; other sessions fill
+    # the store in between.
+    resp = await endpoint(MessageRequest(session_id="s-1", message="Baku"))
+    for i in range(store.max_sessions):
+        store.get_or_create(f"other-{i}")
+
+    body = [chunk async for chunk in resp.body_iterator]
+
+    assert "event: final" in body[-1]
+    session = store.get_or_create("s-1")
+    assert session.search_state["city"] == "Baku"
+    assert not session.lock.locked()
+    assert app.state.limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_session_store_never_drops_busy_sessions_and_stays_bounded(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(sessions_module.time, "monotonic", lambda: now[0])
+    store = InMemorySessionStore(max_sessions=2, ttl_seconds=10)
+
+    busy = store.get_or_create("busy")
+    await busy.lock.acquire()
+    store.get_or_create("idle")
+
+    # Full and the oldest is busy: the next idle session goes instead.
+    store.get_or_create("new")
+    assert len(store) == 2
+    assert store.get_or_create("busy") is busy
+
+    # Past the TTL a session with a turn in flight is kept.
+    now[0] = 100.0
+    store.get_or_create("other")
+    assert store.get_or_create("busy") is busy
+
+    busy.lock.release()
+    now[0] = 200.0
+    store.get_or_create("late")
+    assert store.get_or_create("busy") is not busy
@@ -0,0 +1,87 @@
+from datetime import date
+
+import httpx
+import pytest
+
+from app.api.apify_mock import ApifyMockConfig, create_apify_mock_app
+from app.retrieval import apify as apify_retrieval
+from app.retrieval.apify import ApifyRetriever
+from app.schemas.query import SearchRequest
+
+
+LISTINGS = [
+    {"id": "baku-1", "name": "Baku Old Town Flat", "url": "https://example.com/baku-1"},
+    {"id": "tbilisi-1", "name": "Tbilisi Loft", "url": "https://example.com/tbilisi-1"},
+]
+
+
+def _client(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://apify-mock")
+
+
+@pytest.mark.asyncio
+async def test_run_sync_filters_by_search_and_expands_payload():
+    app = create_apify_mock_app(ApifyMockConfig(listings=LISTINGS, items_per_run=5, description_padding=10))
+
+    async with _client(app) as client:
+        resp = await client.post(
+            "/v2/acts/voyager~booking-scraper/run-sync-get-dataset-items?maxItems=3",
+            json={"search": "Baku apartment"},
+        )
+
+    items = resp.json()
+    assert resp.status_code == 200
+    assert [it["id"] for it in items] == ["baku-1", "baku-1-1", "baku-1-2"]
+    assert items[0]["description"] == "x" * 10
+
+
+@pytest.mark.asyncio
+async def test_run_then_dataset_pagination():
+    app = create_apify_mock_app(ApifyMockConfig(listings=LISTINGS, latency_ms=10))
+
+    async with _client(app) as client:
+        started = await client.post("/v2/acts/a~b/runs", json={"maxItems": 10})
+        run = started.json()["data"]
+        finished = await client.get(f"/v2/actor-runs/{run['id']}?waitForFinish=5")
+        page = await client.get(f"/v2/datasets/{run['defaultDatasetId']}/items?offset=1&limit=1")
+
+    assert started.status_code == 201
+    assert finished.json()["data"]["status"] == "SUCCEEDED"
+    assert [it["id"] for it in page.json()] == ["tbilisi-1"]
+    assert page.headers["x-apify-pagination-total"] == "2"
+
+
+@pytest.mark.asyncio
+async def test_error_rate_injects_errors():
+    app = create_apify_mock_app(ApifyMockConfig(listings=LISTINGS, error_rate=1.0, error_status=502))
+
+    async with _client(app) as client:
+        resp = await client.post("/v2/acts/a~b/run-sync-get-dataset-items", json={})
+
+    assert resp.status_code == 502
+    assert app.state.mock.counters["errors_injected_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_apify_retriever_against_mock(monkeypatch):
+    app = create_apify_mock_app(ApifyMockConfig(listings=LISTINGS))
+
+    def _post_via_mock(url, payload, timeout=180):
+        # Sync helper runs in a worker thread; drive the ASGI app there.
+        import asyncio
+
+        async def _post():
+            async with _client(app) as client:
+                resp = await client.post(url.replace("http://apify-mock", ""), json=payload)
+                return resp.json()
+
+        return asyncio.run(_post())
+
+    monkeypatch.setenv("APIFY_TOKEN", "mock")
+    monkeypatch.setenv("APIFY_BASE_URL", "http://apify-mock")
+    monkeypatch.setattr(apify_retrieval, "_post_json_sync", _post_via_mock)
+
+    req = SearchRequest(city="Tbilisi", check_in=date(2026, 4, 8), check_out=date(2026, 4, 15))
+    listings = await ApifyRetriever().get_candidates(req, max_items=5)
+
+    assert [lst.id for lst in listings] == ["tbilisi-1"]
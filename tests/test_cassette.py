@@ -0,0 +1,76 @@
+from datetime import date
+
+import pytest
+
+from app.agents.runner import run_agent_text
+from app.config.llm import get_gemini_model_for_adk
+from app.logic.conversation_router import route_conversation_async
+from app.retrieval.apify import ApifyRetriever
+from app.schemas.query import SearchRequest
+from app.services.cassette import Cassette, CassetteMiss, canonical_request_key, use_cassette
+
+
+def test_request_key_ignores_key_order_and_uuids():
+    a = canonical_request_key(
+        "gemini.answer",
+        {"model": "m", "contents": 'state {"id": "0b9b3a37-0ba0-46af-8711-a21093d1b68f"}'},
+    )
+    b = canonical_request_key(
+        "gemini.answer",
+        {"contents": 'state {"id": "5f0c1e2a-1111-4a2b-9c3d-abcdefabcdef"}', "model": "m"},
+    )
+
+    assert a == b
+    assert a != canonical_request_key("gemini.intent_repair", {"model": "m"})
+
+
+def test_record_then_replay_from_disk(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    calls = []
+
+    def live():
+        calls.append(1)
+        return "recorded answer"
+
+    recorder = Cassette("record", path)
+    assert recorder.call("gemini.answer", {"contents": "hi"}, live) == "recorded answer"
+
+    replayer = Cassette("replay", path)
+    assert replayer.call("gemini.answer", {"contents": "hi"}, live) == "recorded answer"
+    assert len(calls) == 1
+
+    with pytest.raises(CassetteMiss):
+        replayer.call("gemini.answer", {"contents": "other"}, live)
+
+
+@pytest.mark.asyncio
+async def test_agent_replay_misses_after_instruction_change(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    request = {"model": get_gemini_model_for_adk(), "system": "old instruction", "prompt": "hi"}
+    Cassette("record", path).record("adk.intent_router", request, "recorded answer")
+
+    def no_agent():
+        pytest.fail("replay must not build the agent")
+
+    with use_cassette(Cassette("replay", path)):
+        text = await run_agent_text(no_agent, name="intent_router", instruction="old instruction", prompt="hi")
+        assert text == "recorded answer"
+
+        with pytest.raises(CassetteMiss):
+            await run_agent_text(no_agent, name="intent_router", instruction="new instruction", prompt="hi")
+
+
+@pytest.mark.asyncio
+async def test_stub_mode_runs_router_and_apify_without_credentials(monkeypatch):
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.delenv("APIFY_TOKEN", raising=False)
+
+    req = SearchRequest(city="Baku", check_in=date(2026, 4, 8), check_out=date(2026, 4, 15))
+
+    with use_cassette(Cassette("stub")) as cassette:
+        decision = await route_conversation_async(user_message="add a balcony", previous_state=req)
+        listings = await ApifyRetriever().get_candidates(req, max_items=3)
+
+    assert decision.route == "search_update"
+    assert len(listings) == 3
+    assert cassette.stats()["hits"] == 2
@@ -177,4 +177,75 @@ async def test_conversation_flow_other_route_returns_previous_state(monkeypatch)
     out = await handle_user_message("thanks", previous_state=previous_state)
 
     assert out["response_type"] == "other"
-    assert out["state"]["constraints"]
\ No newline at end of file
+    assert out["state"]["constraints"]
+
+@pytest.mark.asyncio
+async def test_conversation_flow_show_more_pages_without_new_search(monkeypatch):
+    previous_state = SearchRequest(
+        city="Baku",
+        constraints=[kitchen_constraint()],
+    )
+
+    async def _fake_route(**kwargs):
+        return ConversationRouteDecision(route="show_more")
+
+    async def _fake_show_more(result_context, *, page_size):
+        return {
+            "need_clarification": False,
+            "results": [{"title": "Next Apartment"}],
+            "pagination": {"offset": page_size, "returned": 1, "has_more": False},
+        }
+
+    async def _fail_orchestrate(**kwargs):
+        raise AssertionError("show_more must not trigger a new search")
+
+    monkeypatch.setattr("app.logic.conversation_flow.route_conversation_async", _fake_route)
+    monkeypatch.setattr("app.logic.conversation_flow.show_more_results", _fake_show_more)
+    monkeypatch.setattr("app.logic.conversation_flow.orchestrate_search", _fail_orchestrate)
+
+    from app.logic.conversation_flow import handle_user_message
+    from app.logic.search_context import SearchResultContext
+
+    out = await handle_user_message(
+        "show me more",
+        previous_state=previous_state,
+        top_n=5,
+        result_context=SearchResultContext(),
+    )
+
+    assert out["response_type"] == "show_more"
+    assert out["results"][0]["title"] == "Next Apartment"
+    assert out["state"]["city"] == "Baku"
+
+
+@pytest.mark.asyncio
+async def test_conversation_flow_events_stream_parsed_intent_then_search_stages(monkeypatch):
+    async def _fake_build_search_request(user_message: str) -> SearchRequest:
+        return SearchRequest(
+            city="Baku",
+            check_in=date(2026, 4, 20),
+            check_out=date(2026, 4, 25),
+            constraints=[kitchen_constraint()],
+        )
+
+    async def _fake_orchestrate_search_events(**kwargs):
+        yield {"event": "structured_results", "data": {"results": [{"title": "Draft"}]}}
+        yield {"event": "final", "data": {"need_clarification": False, "results": [{"title": "Final"}]}}
+
+    monkeypatch.setattr(
+        "app.logic.conversation_flow.build_search_request_adk_async",
+        _fake_build_search_request,
+    )
+    monkeypatch.setattr(
+        "app.logic.conversation_flow.orchestrate_search_events",
+        _fake_orchestrate_search_events,
+    )
+
+    from app.logic.conversation_flow import handle_user_message_events
+
+    events = [event async for event in handle_user_message_events("any query")]
+
+    assert [e["event"] for e in events] == ["parsed_intent", "structured_results", "final"]
+    assert events[0]["data"]["state"]["city"] == "Baku"
+    assert events[-1]["data"]["results"][0]["title"] == "Final"
+    assert events[-1]["data"]["state"]["city"] == "Baku"
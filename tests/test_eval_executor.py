@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from evaluation.core.executor import AdaptiveRateLimiter, latency_summary, run_cases
+from evaluation.core.io import Checkpoint, discard_checkpoint, load_checkpoint, load_jsonl
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.mark.asyncio
+async def test_limiter_paces_requests_and_backs_off_on_429():
+    clock = _FakeClock()
+    limiter = AdaptiveRateLimiter(2.0, burst=1, clock=clock, sleep=clock.sleep)
+
+    for _ in range(3):
+        await limiter.acquire()
+    assert clock.now == pytest.approx(1.0)
+
+    limiter.on_rate_limited()
+    assert limiter.rate == pytest.approx(1.0)
+    await limiter.acquire()
+    assert clock.now == pytest.approx(2.0)
+
+    for _ in range(50):
+        limiter.on_success()
+    assert limiter.rate == pytest.approx(2.0)
+
+
+@pytest.mark.asyncio
+async def test_run_cases_retries_429_records_latency_and_resumes(tmp_path):
+    progress = tmp_path / "progress.jsonl"
+    calls: list[str] = []
+    failures = {"b": 1}
+
+    async def run_one(case: str) -> dict:
+        calls.append(case)
+        await asyncio.sleep(0)
+        if failures.get(case):
+            failures[case] -= 1
+            raise RuntimeError("429 RESOURCE_EXHAUSTED")
+        if case == "c":
+            raise ValueError("broken case")
+        return {"case_id": case, "ok": True}
+
+    limiter = AdaptiveRateLimiter(1000.0, burst=3)
+    kwargs = dict(
+        case_id=lambda case: case,
+        on_error=lambda case, e: {"case_id": case, "error": str(e)},
+        concurrency=2,
+        limiter=limiter,
+        progress_path=progress,
+        log=lambda _: None,
+    )
+
+    results = await run_cases(["a", "b", "c"], run_one, **kwargs)
+
+    assert [r["case_id"] for r in results] == ["a", "b", "c"]
+    assert results[1]["attempts"] == 2
+    assert results[2]["error"] == "broken case"
+    assert all(r["latency_ms"] >= 0 for r in results)
+    assert limiter.rate_limited_total == 1
+    assert len(load_checkpoint(progress)) == 3
+    assert latency_summary(results)["total_attempts"] == 4
+
+    calls.clear()
+    resumed = await run_cases(["a", "b", "c"], run_one, **kwargs)
+
+    # Only the failed case runs again.
+    assert calls == ["c"]
+    assert [r["case_id"] for r in resumed] == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_run_cases_latency_excludes_rate_limiter_wait():
+    async def run_one(case: str) -> dict:
+        await asyncio.sleep(0)
+        return {"case_id": case}
+
+    results = await run_cases(
+        ["a", "b", "c"],
+        run_one,
+        case_id=lambda case: case,
+        on_error=lambda case, e: {"case_id": case},
+        concurrency=3,
+        limiter=AdaptiveRateLimiter(20.0, burst=1),
+        log=lambda _: None,
+    )
+
+    # The third case queues ~100 ms for a token; that is wait, not latency.
+    assert results[2]["wait_ms"] >= 50
+    assert all(r["latency_ms"] < 50 for r in results)
+    assert latency_summary(results)["wait_p50_ms"] >= 25
+
+
+def test_checkpoint_tolerates_torn_line_and_compacts(tmp_path):
+    path = tmp_path / "progress.jsonl"
+
+    with Checkpoint(path, meta={"dataset": "golden.jsonl"}) as checkpoint:
+        checkpoint.append("a", {"score": 0}, ok=False)
+        checkpoint.append("b", {"score": 1})
+        checkpoint.append("a", {"score": 1})
+
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"case_id": "c", "ok": tr')
+
+    rows = load_checkpoint(path)
+    assert list(rows) == ["b", "a"]
+    assert rows["a"]["result"] == {"score": 1}
+
+    with Checkpoint(path, meta={"dataset": "golden.jsonl"}) as checkpoint:
+        assert checkpoint.done("a") and not checkpoint.done("c")
+        checkpoint.append("c", {"score": 1})
+        checkpoint.append("d", {"score": 0})
+
+    # Appends after a resumed torn line land on their own lines.
+    assert list(load_checkpoint(path)) == ["b", "a", "c", "d"]
+
+    with Checkpoint(path, meta={"dataset": "golden.jsonl"}) as checkpoint:
+        compacted = checkpoint.compact()
+
+    assert [row["case_id"] for row in compacted] == ["b", "a", "c", "d"]
+    assert len(load_jsonl(path)) == 5  # header + one row per case
+
+    with pytest.raises(ValueError):
+        Checkpoint(path, meta={"dataset": "other.jsonl"})
+
+    Checkpoint(path, meta={"dataset": "other.jsonl"}, resume=False).close()
+    assert load_checkpoint(path) == {}
+
+
+def test_discard_checkpoint_makes_the_next_run_fresh(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    with Checkpoint(path, meta={"dataset": "golden.jsonl"}) as checkpoint:
+        checkpoint.append("a", {"score": 1})
+
+    discard_checkpoint(path)
+    discard_checkpoint(path)  # already gone: no error
+
+    with Checkpoint(path, meta={"dataset": "golden.jsonl"}) as checkpoint:
+        assert not checkpoint.done("a")
@@ -1,4 +1,4 @@
-from app.logic.field_rules import FIELD_RULES
+from app.logic.field_rules import FIELD_RULES, compile_field_rules
 from app.logic.listing_signals import collect_listing_signals, find_best_signal_match
 from app.schemas.fields import Field
 from app.schemas.listing import ListingRaw, Room, RoomOption
@@ -63,3 +63,14 @@ def test_find_best_signal_match_for_free_cancellation():
     assert best.raw_text == "Free cancellation"
 
 
+
+
+def test_compiled_field_rules_cover_all_rules_and_match_aliases():
+    compiled = compile_field_rules()
+
+    assert set(compiled) == set(FIELD_RULES)
+
+    kitchen = compiled[Field.KITCHEN]
+    assert kitchen.positive_pattern.search("private kitchen")
+    assert kitchen.negative_pattern.search("sorry, no kitchen here")
+    assert kitchen.positive_pattern.search("bathroom only") is None
@@ -50,8 +50,8 @@ def test_build_update_prompt_includes_canonical_constraints():
     prompt = _build_update_prompt(previous_state, "also add a balcony")
 
     assert '"constraints"' in prompt
-    assert '"normalized_text": "kitchen"' in prompt
-    assert '"normalized_text": "quiet neighborhood"' in prompt
+    assert '"normalized_text":"kitchen"' in prompt
+    assert '"normalized_text":"quiet neighborhood"' in prompt
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import random
+import warnings
+
+import pytest
+from pydantic import ValidationError
+
+from app.logic.listing_signals import collect_listing_signals
+from app.logic.numeric_filters import extract_total_price
+from app.logic.occupancy import extract_listing_max_occupancy
+from app.retrieval.synthetic import generate_listing
+from app.schemas.listing import ListingRaw, Room, RoomView
+
+
+def test_from_provider_reads_rooms_from_the_raw_payload():
+    item = generate_listing(random.Random(7), 0)
+    item["price"] = None
+    item["rooms"][0]["options"][0]["price"] = "120.5"
+
+    listing = ListingRaw.from_provider(item)
+    room = listing.rooms[0]
+
+    assert isinstance(room, RoomView)
+    assert room.facilities is item["rooms"][0]["facilities"]
+    assert getattr(room, "roomType") == item["rooms"][0]["roomType"]
+    assert getattr(room, "missing", "default") == "default"
+    assert room.options[0].price == 120.5
+    assert getattr(room.options[0], "yourChoices") is item["rooms"][0]["options"][0]["yourChoices"]
+
+
+def test_from_provider_matches_full_validation_for_pipeline_readers():
+    rng = random.Random(11)
+    for i in range(50):
+        item = generate_listing(rng, i)
+        lazy = ListingRaw.from_provider(item)
+        full = ListingRaw.model_validate(item)
+
+        assert lazy.name == full.name and lazy.price == full.price
+        assert extract_listing_max_occupancy(lazy) == extract_listing_max_occupancy(full)
+        assert extract_total_price(lazy) == extract_total_price(full)
+        assert collect_listing_signals(lazy) == collect_listing_signals(full)
+
+
+def test_from_provider_still_validates_hot_fields():
+    with pytest.raises(ValidationError):
+        ListingRaw.from_provider({"name": "Flat", "price": "not a number"})
+
+
+def test_from_provider_listing_dumps_raw_rooms():
+    item = generate_listing(random.Random(3), 0)
+    listing = ListingRaw.from_provider(item)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        dumped = listing.model_dump(mode="json")
+        listing.model_dump()
+
+    assert dumped["rooms"] == item["rooms"]
+    assert isinstance(ListingRaw.model_validate(item).rooms[0], Room)
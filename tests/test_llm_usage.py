@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.cassette import Cassette
+from app.services.llm_usage import (
+    PROCESS_USAGE,
+    LLMUsage,
+    estimate_cost_usd,
+    llm_attempt,
+    llm_call,
+    record_usage_metadata,
+    usage_from_trace,
+)
+from app.services.tracing import trace
+
+
+def _metadata(prompt: int, candidates: int, thoughts: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(
+        prompt_token_count=prompt,
+        candidates_token_count=candidates,
+        thoughts_token_count=thoughts,
+        total_token_count=prompt + candidates + thoughts,
+    )
+
+
+def test_llm_call_records_tokens_cost_and_process_totals():
+    before = PROCESS_USAGE.total.calls
+
+    with llm_call("gemini.answer", model="models/gemini-2.5-flash") as call:
+        record_usage_metadata(_metadata(1000, 200, thoughts=50))
+
+    assert call.prompt_tokens == 1000
+    assert call.response_tokens == 250
+    assert call.total_tokens == 1250
+    assert call.cost_usd == pytest.approx(estimate_cost_usd("gemini-2.5-flash", 1000, 250))
+    assert PROCESS_USAGE.total.calls == before + 1
+
+
+def test_llm_call_marks_rate_limited_errors():
+    with pytest.raises(RuntimeError):
+        with llm_call("adk.intent_router", model="gemini-2.5-flash") as call:
+            raise RuntimeError("429 RESOURCE_EXHAUSTED")
+
+    assert call.error and call.rate_limited
+
+
+def test_recorded_usage_is_replayed_and_aggregated_per_request(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    request = {"model": "gemini-2.5-flash", "system": "s", "contents": "c"}
+
+    def live() -> str:
+        record_usage_metadata(_metadata(120, 30))
+        return "answer"
+
+    Cassette("record", path).call("gemini.answer", request, live)
+
+    replay = Cassette("replay", path)
+    with trace("turn") as root:
+        with llm_attempt(1):
+            assert replay.call("gemini.answer", request, lambda: "unused") == "answer"
+
+    usage = usage_from_trace(root).to_dict()
+    assert usage["calls"] == 1
+    assert usage["retries"] == 1
+    assert usage["prompt_tokens"] == 120
+    assert usage["response_tokens"] == 30
+    assert usage["by_stage"]["gemini.answer"]["total_tokens"] == 150
+    assert usage["by_model"]["gemini-2.5-flash"]["calls"] == 1
+
+    session = LLMUsage()
+    session.merge(usage_from_trace(root))
+    session.merge(usage_from_trace(root))
+    assert session.to_dict()["total_tokens"] == 300
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+
+import pytest
+
+from app.services.logs import configure_logging, get_logger
+from app.services.tracing import trace
+
+
+@pytest.fixture
+def log_stream():
+    stream = io.StringIO()
+    configure_logging("DEBUG", "json", stream=stream)
+    yield stream
+    configure_logging("WARNING", "text")
+
+
+def test_disabled_level_never_evaluates_lazy_fields():
+    configure_logging("WARNING", "json", stream=io.StringIO())
+    calls = []
+
+    get_logger("tests.logs").debug("expensive", payload=lambda: calls.append(1))
+
+    assert calls == []
+
+
+def test_json_record_has_event_fields_and_span(log_stream):
+    log = get_logger("tests.logs")
+
+    with trace("rank_structured"):
+        log.debug("ranked", candidates=3, detail=lambda: {"top": "a"})
+
+    record = json.loads(log_stream.getvalue().strip())
+    assert record["level"] == "debug"
+    assert record["logger"] == "tests.logs"
+    assert record["event"] == "ranked"
+    assert record["span"] == "rank_structured"
+    assert record["candidates"] == 3
+    assert record["detail"] == {"top": "a"}
+
+
+def test_sampling_drops_records(log_stream):
+    log = get_logger("tests.logs")
+
+    for _ in range(20):
+        log.debug("sampled_out", sample=0.0)
+    log.log(logging.INFO, "kept", sample=1.0)
+
+    lines = log_stream.getvalue().strip().splitlines()
+    assert [json.loads(line)["event"] for line in lines] == ["kept"]
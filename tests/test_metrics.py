@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from app.api import create_app
+from app.services.metrics import (
+    CACHE_LOOKUPS,
+    CANDIDATES,
+    REQUESTS,
+    STAGE_SECONDS,
+    MetricsRegistry,
+    cache_lookups,
+    observe_trace,
+    render_prometheus,
+)
+from app.services.tracing import incr, span, trace
+
+
+def test_render_counter_and_histogram_exposition():
+    registry = MetricsRegistry()
+    hits = registry.counter("demo_hits_total", "Hits.", ["cache"])
+    latency = registry.histogram("demo_seconds", "Latency.", buckets=(0.1, 1.0))
+    registry.counter("demo_unused_total", "Never incremented.")
+
+    hits.inc(cache='fx "daily"')
+    hits.inc(2, cache="retrieval")
+    latency.observe(0.05)
+    latency.observe(0.5)
+
+    text = render_prometheus(registry)
+
+    assert "# TYPE demo_hits_total counter" in text
+    assert 'demo_hits_total{cache="fx \\"daily\\""} 1' in text
+    assert 'demo_hits_total{cache="retrieval"} 2' in text
+    assert 'demo_seconds_bucket{le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{le="1"} 2' in text
+    assert 'demo_seconds_bucket{le="+Inf"} 2' in text
+    assert "demo_seconds_count 2" in text
+    assert "demo_unused_total" not in text
+
+    with pytest.raises(ValueError):
+        hits.inc(cache="fx", extra="x")
+
+
+def test_observe_trace_folds_stage_spans_into_metrics():
+    requests_before = REQUESTS.value(kind="metrics_test")
+    ranked_before = STAGE_SECONDS.count(stage="rank_structured")
+    out_before = CANDIDATES.value(stage="initial_filters", direction="out")
+    fx_hits_before = CACHE_LOOKUPS.value(cache="fx", result="hit")
+
+    with trace("metrics_test") as root:
+        with span("initial_filters", candidates_in=10) as sp:
+            sp.set(candidates_out=4)
+            incr("fx_cache_hits")
+        with span("rank_structured"):
+            pass
+    observe_trace(root)
+
+    assert REQUESTS.value(kind="metrics_test") == requests_before + 1
+    assert STAGE_SECONDS.count(stage="rank_structured") == ranked_before + 1
+    assert CANDIDATES.value(stage="initial_filters", direction="out") == out_before + 4
+    assert CACHE_LOOKUPS.value(cache="fx", result="hit") == fx_hits_before + 1
+    assert cache_lookups(root) == {"fx": {"hit": 1, "miss": 0}}
+
+
+@pytest.mark.asyncio
+async def test_service_exposes_prometheus_text():
+    app = create_app()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/healthz")
+        resp = await client.get("/metrics/prometheus")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert "# TYPE booking_http_in_flight gauge" in resp.text
+    assert "booking_sessions 0" in resp.text
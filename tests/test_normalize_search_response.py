@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from app.logic import normalize_search_response as nsr
+from app.retrieval.fixtures import load_fixture_listings
+from app.schemas.query import SearchRequest
+from app.tools.orchestrate_search_tool import _rank_structured
+
+
+def _request() -> SearchRequest:
+    return SearchRequest.model_validate(
+        {
+            "city": "Baku",
+            "check_in": "2026-04-08",
+            "check_out": "2026-04-15",
+            "filters": {"price": {"max_amount": 200, "currency": "USD", "scope": "per_night"}},
+            "constraints": [
+                {
+                    "raw_text": "kitchen",
+                    "normalized_text": "kitchen",
+                    "priority": "nice",
+                    "category": "amenity",
+                    "mapping_status": "known",
+                    "mapped_fields": ["kitchen"],
+                    "evidence_strategy": "structured",
+                }
+            ],
+        }
+    )
+
+
+def test_request_level_work_is_done_once_per_response(monkeypatch):
+    req = _request()
+    ranked = _rank_structured(req, load_fixture_listings())
+    assert len(ranked) >= 3
+
+    calls = []
+    build_lookup = nsr._build_constraint_lookup
+    monkeypatch.setattr(nsr, "_build_constraint_lookup", lambda r: calls.append(r) or build_lookup(r))
+
+    out = nsr.normalize_search_response(req, ranked, top_n=3, dropped_requests=[])
+
+    assert len(calls) == 1
+    assert len(out.results) == 3
+    for result in out.results:
+        facts = {fact.key: fact.value for fact in result.facts}
+        assert facts["night_count"] == 7
+        assert facts["budget_total_derived"] == 1400.0
+        statuses = result.matched_constraints + result.uncertain_constraints + result.failed_constraints
+        kitchen = [s for s in statuses if s.name == "kitchen"]
+        assert kitchen and kitchen[0].constraint["priority"] == "nice"
@@ -4,10 +4,12 @@ from datetime import date
 from app.agents.intent_router_agent import IntentRoute
 from app.logic.request_resolution import resolve_required_search_context
 from app.tools.orchestrate_search_tool import orchestrate_search, _salvage_only_enum_keys
+from app.tools.orchestrate_search_tool import orchestrate_search_events, show_more_results
 from app.schemas.fallback_policy import FallbackPolicy
 from app.schemas.listing import ListingRaw, Room
 from app.tools import orchestrate_search_tool
 from app.logic.constraint_evidence_resolution import ConstraintResolutionResult
+from app.logic.search_context import SearchResultContext
 
 
 @pytest.mark.asyncio
@@ -720,4 +722,367 @@ async def test_occupancy_filter_is_applied():
         fallback_policy=FallbackPolicy(enabled=False),
     )
 
-    assert out["need_clarification"] is False
\ No newline at end of file
+    assert out["need_clarification"] is False
+
+@pytest.mark.asyncio
+async def test_result_context_reuses_candidates_when_only_constraints_change(monkeypatch):
+    calls = {"get_candidates": 0}
+
+    async def fake_get_candidates(req, max_items, source):
+        calls["get_candidates"] += 1
+        return [
+            ListingRaw(
+                id="kitchen-1",
+                name="Apartment with Kitchen",
+                url="https://example.com/kitchen-1",
+                description="Apartment in Baku with kitchen and balcony.",
+                facilities=[{"name": "Kitchen"}, {"name": "Balcony"}],
+            ),
+            ListingRaw(
+                id="plain-1",
+                name="Plain Room",
+                url="https://example.com/plain-1",
+                description="Room in Baku.",
+                facilities=[{"name": "Kitchen"}],
+            ),
+        ]
+
+    monkeypatch.setattr(orchestrate_search_tool, "get_candidates", fake_get_candidates)
+
+    kitchen = {
+        "raw_text": "kitchen",
+        "normalized_text": "kitchen",
+        "priority": "must",
+        "category": "amenity",
+        "mapping_status": "known",
+        "mapped_fields": ["kitchen"],
+        "evidence_strategy": "structured",
+    }
+    balcony = {
+        "raw_text": "balcony",
+        "normalized_text": "balcony",
+        "priority": "must",
+        "category": "amenity",
+        "mapping_status": "known",
+        "mapped_fields": ["balcony"],
+        "evidence_strategy": "structured",
+    }
+    intent = {
+        "city": "Baku",
+        "check_in": "2026-04-08",
+        "check_out": "2026-04-15",
+        "constraints": [kitchen],
+    }
+
+    context = SearchResultContext()
+
+    first = await orchestrate_search(
+        "Baku with kitchen",
+        intent,
+        source="fixtures",
+        max_items=10,
+        fallback_policy=FallbackPolicy(enabled=False),
+        result_context=context,
+    )
+    assert first["need_clarification"] is False
+    assert len(first["results"]) == 2
+
+    second = await orchestrate_search(
+        "add balcony",
+        {**intent, "constraints": [kitchen, balcony]},
+        source="fixtures",
+        max_items=10,
+        fallback_policy=FallbackPolicy(enabled=False),
+        result_context=context,
+    )
+
+    assert calls["get_candidates"] == 1
+    assert second["results"][0]["title"] == "Apartment with Kitchen"
+    assert second["results"][0]["score"] > second["results"][1]["score"]
+
+    await orchestrate_search(
+        "same but other dates",
+        {**intent, "check_in": "2026-05-08", "check_out": "2026-05-15"},
+        source="fixtures",
+        max_items=10,
+        fallback_policy=FallbackPolicy(enabled=False),
+        result_context=context,
+    )
+
+    assert calls["get_candidates"] == 2
+
+
+@pytest.mark.asyncio
+async def test_result_context_reuses_fallback_resolutions(monkeypatch):
+    calls = {"resolve": 0}
+
+    async def fake_resolve(req, *, model):
+        calls["resolve"] += 1
+        return ConstraintResolutionResult(
+            listing_id=req.listing_id,
+            listing_title=req.listing_title,
+            constraint_id=req.constraint_id,
+            raw_text=req.raw_text,
+            normalized_text=req.normalized_text,
+            resolver_type="textual",
+            decision="YES",
+            resolution_status="matched",
+            confidence=0.9,
+            reason="confirmed",
+            evidence=[],
+        )
+
+    monkeypatch.setattr(
+        "app.logic.constraint_evidence_resolution.resolve_constraint_via_textual_evidence",
+        fake_resolve,
+    )
+
+    intent = {
+        "city": "Baku",
+        "check_in": "2026-04-08",
+        "check_out": "2026-04-15",
+        "constraints": [
+            {
+                "id": "sat-tv",
+                "raw_text": "satellite TV",
+                "normalized_text": "satellite TV",
+                "priority": "must",
+                "category": "amenity",
+                "mapping_status": "unresolved",
+                "mapped_fields": [],
+                "evidence_strategy": "textual",
+            },
+        ],
+    }
+
+    context = SearchResultContext()
+    policy = FallbackPolicy(enabled=True, top_k=2)
+
+    await orchestrate_search("satellite TV", intent, source="fixtures", max_items=10,
+                             fallback_policy=policy, result_context=context)
+    first_calls = calls["resolve"]
+    assert first_calls > 0
+
+    await orchestrate_search("satellite TV", intent, source="fixtures", max_items=10,
+                             fallback_policy=policy, result_context=context)
+    assert calls["resolve"] == first_calls
+
+
+@pytest.mark.asyncio
+async def test_show_more_pages_cached_ranking_with_lazy_fallback(monkeypatch):
+    calls = {"get_candidates": 0, "resolved_listing_ids": []}
+
+    async def fake_get_candidates(req, max_items, source):
+        calls["get_candidates"] += 1
+        return [
+            ListingRaw(
+                id=f"apt-{i}",
+                name=f"Apartment {i}",
+                url=f"https://example.com/apt-{i}",
+                description="Apartment in Baku with kitchen.",
+                facilities=[{"name": "Kitchen"}],
+            )
+            for i in range(3)
+        ]
+
+    async def fake_resolve(req, *, model):
+        calls["resolved_listing_ids"].append(req.listing_id)
+        return ConstraintResolutionResult(
+            listing_id=req.listing_id,
+            listing_title=req.listing_title,
+            constraint_id=req.constraint_id,
+            raw_text=req.raw_text,
+            normalized_text=req.normalized_text,
+            resolver_type="textual",
+            decision="UNCERTAIN",
+            resolution_status="uncertain",
+            confidence=0.3,
+            reason="not confirmed",
+            evidence=[],
+        )
+
+    monkeypatch.setattr(orchestrate_search_tool, "get_candidates", fake_get_candidates)
+    monkeypatch.setattr(
+        "app.logic.constraint_evidence_resolution.resolve_constraint_via_textual_evidence",
+        fake_resolve,
+    )
+
+    intent = {
+        "city": "Baku",
+        "check_in": "2026-04-08",
+        "check_out": "2026-04-15",
+        "constraints": [
+            {
+                "raw_text": "quiet street",
+                "normalized_text": "quiet street",
+                "priority": "must",
+                "category": "location",
+                "mapping_status": "unresolved",
+                "mapped_fields": [],
+                "evidence_strategy": "textual",
+            },
+        ],
+    }
+
+    context = SearchResultContext()
+
+    first = await orchestrate_search(
+        "quiet apartment in Baku",
+        intent,
+        top_n=1,
+        source="fixtures",
+        max_items=10,
+        fallback_policy=FallbackPolicy(enabled=True, top_k=1),
+        result_context=context,
+    )
+
+    assert len(first["results"]) == 1
+    assert first["pagination"] == {"offset": 0, "returned": 1, "has_more": True}
+    assert len(calls["resolved_listing_ids"]) == 1
+
+    second = await show_more_results(context, page_size=1)
+
+    assert calls["get_candidates"] == 1
+    assert len(second["results"]) == 1
+    assert second["results"][0]["title"] != first["results"][0]["title"]
+    assert second["pagination"] == {"offset": 1, "returned": 1, "has_more": True}
+    assert len(calls["resolved_listing_ids"]) == 2
+
+    third = await show_more_results(context, page_size=5)
+    assert third["pagination"] == {"offset": 2, "returned": 1, "has_more": False}
+
+    done = await show_more_results(context, page_size=5)
+    assert done["need_clarification"] is True
+    assert calls["get_candidates"] == 1
+
+
+@pytest.mark.asyncio
+async def test_orchestrate_search_events_stream_stages_before_final(monkeypatch):
+    async def fake_get_candidates(req, max_items, source):
+        return [
+            ListingRaw(
+                id=f"apt-{i}",
+                name=f"Apartment {i}",
+                url=f"https://example.com/apt-{i}",
+                description="Apartment in Baku with kitchen.",
+                facilities=[{"name": "Kitchen"}],
+            )
+            for i in range(3)
+        ]
+
+    async def fake_resolve(req, *, model):
+        return ConstraintResolutionResult(
+            listing_id=req.listing_id,
+            listing_title=req.listing_title,
+            constraint_id=req.constraint_id,
+            raw_text=req.raw_text,
+            normalized_text=req.normalized_text,
+            resolver_type="textual",
+            decision="YES",
+            resolution_status="matched",
+            confidence=0.9,
+            reason="mentioned in description",
+            evidence=[],
+        )
+
+    monkeypatch.setattr(orchestrate_search_tool, "get_candidates", fake_get_candidates)
+    monkeypatch.setattr(
+        "app.logic.constraint_evidence_resolution.resolve_constraint_via_textual_evidence",
+        fake_resolve,
+    )
+
+    intent = {
+        "city": "Baku",
+        "check_in": "2026-04-08",
+        "check_out": "2026-04-15",
+        "constraints": [
+            {
+                "raw_text": "quiet street",
+                "normalized_text": "quiet street",
+                "priority": "must",
+                "category": "location",
+                "mapping_status": "unresolved",
+                "mapped_fields": [],
+                "evidence_strategy": "textual",
+            },
+        ],
+    }
+    kwargs = dict(
+        top_n=2,
+        source="fixtures",
+        max_items=10,
+        fallback_policy=FallbackPolicy(enabled=True, top_k=2),
+    )
+
+    events = [
+        event
+        async for event in orchestrate_search_events("quiet apartment in Baku", intent, **kwargs)
+    ]
+    names = [event["event"] for event in events]
+
+    assert names == [
+        "intent",
+        "structured_results",
+        "fallback_resolution",
+        "fallback_resolution",
+        "final",
+    ]
+    assert events[0]["data"]["active_intent"]["city"] == "Baku"
+    assert len(events[1]["data"]["results"]) == 2
+    assert events[2]["data"]["constraint_resolution_results"][0]["decision"] == "YES"
+
+    final = events[-1]["data"]
+    plain = await orchestrate_search("quiet apartment in Baku", intent, **kwargs)
+    assert [r["title"] for r in final["results"]] == [r["title"] for r in plain["results"]]
+    assert final["pagination"] == plain["pagination"]
+
+
+
+@pytest.mark.asyncio
+async def test_validated_search_request_is_not_revalidated(monkeypatch):
+    from app.schemas.query import SearchRequest
+
+    intent = {
+        "city": "Baku",
+        "check_in": "2026-04-08",
+        "check_out": "2026-04-15",
+        "constraints": [
+            {
+                "raw_text": "kitchen",
+                "normalized_text": "kitchen",
+                "priority": "must",
+                "category": "amenity",
+                "mapping_status": "known",
+                "mapped_fields": ["kitchen"],
+                "evidence_strategy": "structured",
+            }
+        ],
+    }
+    from_dict = await orchestrate_search("Baku", intent, source="fixtures", max_items=10,
+                                         fallback_policy=FallbackPolicy(enabled=False))
+
+    async def fail_validation(*args, **kwargs):
+        raise AssertionError("SearchRequest intent must not be validated again")
+
+    monkeypatch.setattr(orchestrate_search_tool, "_validate_and_repair_intent", fail_validation)
+    out = await orchestrate_search("Baku", SearchRequest.model_validate(intent), source="fixtures", max_items=10,
+                                   fallback_policy=FallbackPolicy(enabled=False))
+
+    assert out["need_clarification"] is False
+    assert [r["title"] for r in out["results"]] == [r["title"] for r in from_dict["results"]]
+
+
+def test_ranking_path_does_not_import_llm_sdks():
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import sys\n"
+        "import app.tools.orchestrate_search_tool, app.logic.conversation_flow\n"
+        "print(sorted(m for m in ('google.adk', 'google.genai', 'requests') if m in sys.modules))\n"
+    )
+    root = Path(__file__).resolve().parent.parent
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+
+    assert out.stdout.strip() == "[]"
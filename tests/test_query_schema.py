@@ -0,0 +1,17 @@
+from datetime import date
+
+import pytest
+
+from app.schemas.filters import SearchFilters
+from app.schemas.query import SearchRequest
+
+
+def test_search_request_from_trusted_keeps_objects_and_checks_date_range():
+    filters = SearchFilters(bedrooms_min=2)
+    req = SearchRequest.from_trusted(city="Baku", check_in=date(2026, 4, 10), check_out=date(2026, 4, 15), filters=filters)
+
+    assert req.filters is filters
+    assert req.adults == 2 and req.constraints == []
+
+    with pytest.raises(ValueError):
+        SearchRequest.from_trusted(city="Baku", check_in=date(2026, 4, 15), check_out=date(2026, 4, 10))
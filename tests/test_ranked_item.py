@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from app.logic import explanations, ranked_item
+from app.logic.normalize_search_response import normalize_search_response
+from app.logic.ranked_item import RankedItem
+from app.logic.result_selection import classify_ranked_item, select_ranked_items
+from app.retrieval.fixtures import load_fixture_listings
+from app.schemas.query import SearchRequest
+from app.tools.orchestrate_search_tool import _apply_constraint_resolution_scoring, _rank_structured
+
+
+def _request() -> SearchRequest:
+    return SearchRequest.model_validate(
+        {
+            "city": "Baku",
+            "check_in": "2026-04-08",
+            "check_out": "2026-04-15",
+            "constraints": [
+                {
+                    "raw_text": "kitchen",
+                    "normalized_text": "kitchen",
+                    "priority": "must",
+                    "category": "amenity",
+                    "mapping_status": "known",
+                    "mapped_fields": ["kitchen"],
+                    "evidence_strategy": "structured",
+                }
+            ],
+        }
+    )
+
+
+def test_ranked_items_reference_the_listing_and_keep_dict_access():
+    listings = load_fixture_listings()
+    ranked = _rank_structured(_request(), listings)
+    item = ranked[0]
+
+    assert isinstance(item, RankedItem)
+    assert any(item.listing is lst for lst in listings)
+    assert item["matches"] is item.report.matches
+    assert item.get("listing_name") == item.listing.name
+    assert "score" in item and "eligibility_status" not in item
+    assert item.get("constraint_resolution_results", []) == []
+
+    item["constraint_resolution_results"] = []
+    assert item.constraint_resolution_results == []
+
+
+def test_why_is_recorded_as_codes_and_rendered_only_for_returned_results(monkeypatch):
+    req = _request()
+    ranked = _rank_structured(req, load_fixture_listings())
+    for item in ranked:
+        item.constraint_resolution_results = [
+            {"normalized_text": "quiet", "priority": "nice", "decision": "YES"},
+        ]
+    _apply_constraint_resolution_scoring(ranked)
+    assert len(ranked) > 3
+
+    item = ranked[0]
+    assert item.why_codes[0][0] == explanations.MUST_FIELD
+    assert item.why_codes[-1] == (explanations.CONSTRAINT, "nice", "YES", "quiet")
+    assert item["why"][0].startswith("KITCHEN: ")
+    assert item["why"][-1] == "CONSTRAINT_MATCH: nice-to-have 'quiet' confirmed by listing text"
+
+    for item in ranked:
+        item.constraint_resolution_results = []
+    rendered = []
+    render = ranked_item.render_why
+    monkeypatch.setattr(ranked_item, "render_why", lambda codes: rendered.append(codes) or render(codes))
+
+    out = normalize_search_response(req, ranked, top_n=3, dropped_requests=[])
+
+    assert len(rendered) == 3
+    assert out.results[0].why == ranked[0].why
+
+
+def test_classify_updates_ranked_items_in_place_but_copies_dicts():
+    ranked = _rank_structured(_request(), load_fixture_listings())
+    item = ranked[0]
+    item.constraint_resolution_results = []
+
+    assert classify_ranked_item(item) is item
+    assert item.match_tier == "strong"
+
+    plain = {"score": 1.0, "matched_must_total": 1, "matched_must_count": 1}
+    classified = classify_ranked_item(plain)
+    assert classified is not plain and "match_tier" not in plain
+
+    selected = select_ranked_items([plain, item], top_n=2)
+    assert selected[0] is item
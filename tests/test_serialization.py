@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import gc
+import json
+from datetime import date
+
+from app.logic.conversation_router import _build_router_prompt
+from app.logic.intent_update import _build_update_prompt
+from app.schemas.query import SearchRequest
+from app.services import serialization
+from app.services.serialization import dump_model, dump_model_json, dumps, dumps_debug
+
+
+def _state() -> SearchRequest:
+    return SearchRequest(city="Bakı", check_in=date(2026, 4, 20), check_out=date(2026, 4, 26), adults=2)
+
+
+def test_dump_model_is_computed_once_per_model_instance(monkeypatch):
+    state = _state()
+    calls = []
+    original = SearchRequest.model_dump
+    monkeypatch.setattr(SearchRequest, "model_dump", lambda self, **kw: calls.append(kw) or original(self, **kw))
+
+    _build_router_prompt(user_message="cheaper please", previous_state=state)
+    _build_update_prompt(state, "cheaper please")
+    payload = dump_model(state)
+
+    assert calls == [{"mode": "json", "exclude_none": True}]
+    assert payload["city"] == "Bakı"
+    assert payload["check_in"] == "2026-04-20"
+    assert "budget_max" not in payload
+
+    updated = state.model_copy(update={"adults": 3})
+    assert dump_model(updated)["adults"] == 3
+    assert len(calls) == 2
+
+
+def test_dump_model_returns_a_private_copy_per_caller():
+    state = _state()
+    text = dump_model_json(state)
+
+    payload = dump_model(state)
+    payload["city"] = "Tbilisi"
+    payload.setdefault("filters", {})["bedrooms_min"] = 3
+
+    assert dump_model(state)["city"] == "Bakı"
+    assert "filters" not in dump_model(state)
+    assert dump_model_json(state) == text
+    assert '"city":"Bakı"' in _build_update_prompt(state, "cheaper please")
+
+
+def test_dump_model_forgets_collected_models():
+    state = _state()
+    key = id(state)
+    dump_model(state)
+    assert key in serialization._DUMPS
+
+    del state
+    gc.collect()
+    assert key not in serialization._DUMPS
+
+
+def test_dumps_is_compact_and_keeps_unicode():
+    text = dumps({"city": "Bakı", "when": date(2026, 4, 20), "n": [1, 2]})
+
+    assert text == '{"city":"Bakı","when":"2026-04-20","n":[1,2]}'
+    assert json.loads(dumps_debug({"a": 1})) == {"a": 1}
+    assert "\n" in dumps_debug({"a": 1})
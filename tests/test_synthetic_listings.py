@@ -0,0 +1,42 @@
+import json
+from datetime import date
+
+import pytest
+
+from app.logic.numeric_filters import extract_area_sqm, extract_bedroom_count
+from app.retrieval.fixtures import FixturesRetriever, load_fixture_listings
+from app.retrieval.synthetic import iter_synthetic_listings, write_synthetic_corpus
+from app.schemas.listing import ListingRaw
+from app.schemas.query import SearchRequest
+
+
+def test_synthetic_corpus_is_seeded_and_prefix_stable():
+    small = list(iter_synthetic_listings(20, seed=7))
+    large = list(iter_synthetic_listings(50, seed=7))
+
+    assert small == large[:20]
+    assert small != list(iter_synthetic_listings(20, seed=8))
+    assert len({item["id"] for item in large}) == 50
+
+
+def test_synthetic_listings_feed_numeric_extraction():
+    listings = [ListingRaw.model_validate(x) for x in iter_synthetic_listings(50, seed=1)]
+
+    assert sum(extract_area_sqm(lst)[0] is not None for lst in listings) == 50
+    assert sum(extract_bedroom_count(lst)[0] is not None for lst in listings) > 25
+    assert len({lst.currency for lst in listings}) > 1
+
+
+@pytest.mark.asyncio
+async def test_written_corpus_loads_as_fixtures(tmp_path):
+    jsonl = tmp_path / "corpus.jsonl"
+    array = tmp_path / "corpus.json"
+
+    assert write_synthetic_corpus(jsonl, 120, seed=3) == 120
+    write_synthetic_corpus(array, 120, seed=3)
+
+    assert len(json.loads(array.read_text(encoding="utf-8"))) == 120
+    assert load_fixture_listings(jsonl) == load_fixture_listings(array)
+
+    req = SearchRequest(city="Baku", check_in=date(2026, 4, 8), check_out=date(2026, 4, 15))
+    assert len(await FixturesRetriever(jsonl).get_candidates(req, max_items=100)) == 100
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+
+import pytest
+
+from app.schemas.fallback_policy import FallbackPolicy
+from app.services.cassette import Cassette, use_cassette
+from app.services.tracing import (
+    current_span,
+    incr,
+    iterate_in_span,
+    span,
+    start_span,
+    trace,
+)
+from app.tools.orchestrate_search_tool import orchestrate_search
+
+
+def test_span_is_noop_without_trace():
+    with span("stage") as sp:
+        incr("hits")
+        assert sp is None
+    assert current_span() is None
+
+
+def test_trace_nests_spans_and_collects_attrs():
+    with trace("turn") as root:
+        with span("retrieval", source="fixtures"):
+            incr("cache_hits")
+            incr("cache_hits")
+        with span("rank_structured"):
+            pass
+
+    assert current_span() is None
+    assert root.is_root
+    assert [c.name for c in root.children] == ["retrieval", "rank_structured"]
+    assert root.children[0].attrs == {"source": "fixtures", "cache_hits": 2}
+    assert set(root.breakdown()) == {"turn", "retrieval", "rank_structured"}
+
+
+@pytest.mark.asyncio
+async def test_iterate_in_span_survives_steps_in_separate_contexts():
+    async def stages():
+        with span("first"):
+            yield 1
+            with span("nested"):
+                pass
+        yield 2
+
+    root = start_span("root")
+    agen = iterate_in_span(stages(), root)
+
+    # Each step in its own task with a fresh context, as the UI loop does.
+    items = []
+    while True:
+        try:
+            items.append(await asyncio.create_task(agen.__anext__(), context=contextvars.Context()))
+        except StopAsyncIteration:
+            break
+    root.finish()
+
+    assert items == [1, 2]
+    first = root.children[0]
+    assert first.name == "first"
+    assert [c.name for c in first.children] == ["nested"]
+
+
+@pytest.mark.asyncio
+async def test_orchestrate_search_attaches_stage_timings():
+    intent = {
+        "city": "Baku",
+        "check_in": "2026-04-08",
+        "check_out": "2026-04-15",
+        "constraints": [
+            {
+                "raw_text": "kitchen",
+                "normalized_text": "kitchen",
+                "priority": "must",
+                "category": "amenity",
+                "mapping_status": "known",
+                "mapped_fields": ["kitchen"],
+                "evidence_strategy": "structured",
+            }
+        ],
+    }
+    with use_cassette(Cassette("stub")):
+        out = await orchestrate_search(
+            "Baku",
+            intent,
+            source="fixtures",
+            max_items=10,
+            fallback_policy=FallbackPolicy(enabled=False),
+            debug_timings=True,
+        )
+        plain = await orchestrate_search(
+            "Baku",
+            intent,
+            source="fixtures",
+            max_items=10,
+            fallback_policy=FallbackPolicy(enabled=False),
+        )
+
+    timings = out["debug"]["timings"]
+    assert {
+        "orchestrate_search",
+        "intent_validation",
+        "retrieval",
+        "initial_filters",
+        "rank_structured",
+        "fallback_layer",
+        "selection",
+        "normalize",
+    } <= set(timings["by_stage_ms"])
+    assert timings["spans"]["name"] == "orchestrate_search"
+    assert "debug" not in plain
@@ -40,6 +40,9 @@ def render_messages() -> None:
                     search_request = debug_data.get("search_request")
                     state_after = debug_data.get("state_after")
                     answer_payload = debug_data.get("answer_payload")
+                    timings = debug_data.get("timings")
+                    llm_usage = debug_data.get("llm_usage")
+                    session_llm_usage = debug_data.get("session_llm_usage")
 
                     if parsed_intent is not None:
                         st.markdown("**Parsed intent**")
@@ -62,6 +65,24 @@ def render_messages() -> None:
                             language="json",
                         )
                         
+                    if timings is not None:
+                        st.markdown(f"**Timings** ({timings.get('total_ms')} ms)")
+                        st.code(
+                            json.dumps(timings.get("by_stage_ms"), ensure_ascii=False, indent=2),
+                            language="json",
+                        )
+
+                    if llm_usage is not None:
+                        session_cost = (session_llm_usage or {}).get("cost_usd")
+                        st.markdown(
+                            f"**LLM usage** ({llm_usage.get('total_tokens')} tokens, "
+                            f"${llm_usage.get('cost_usd')}; session ${session_cost})"
+                        )
+                        st.code(
+                            json.dumps(llm_usage.get("by_stage"), ensure_ascii=False, indent=2),
+                            language="json",
+                        )
+
                     if answer_payload is not None:
                         st.markdown("**Answer payload**")
                         st.code(
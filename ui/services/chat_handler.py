@@ -1,6 +1,5 @@
 from __future__ import annotations
 from app.config.settings import MAX_ITEMS_HARD_CAP
-import asyncio
 import sys
 from pathlib import Path
 from typing import Any
@@ -11,15 +10,22 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from app.logic.conversation_flow import handle_user_message
+from app.logic.conversation_flow import handle_user_message_events
 from app.schemas.query import SearchRequest
 
 from ui.formatters import build_display_answer
-from ui.state import append_message, get_search_state, set_search_state
+from ui.services.event_loop import get_background_loop
+from ui.state import append_message, get_llm_usage, get_result_context, get_search_state, set_search_state
 
 
 def run_async(coro: Any) -> Any:
-    return asyncio.run(coro)
+    return get_background_loop().run(coro)
+
+
+_STAGE_LABELS = {
+    "parsed_intent": "Searching listings...",
+    "structured_results": "Checking listing details...",
+}
 
 
 def process_user_message(user_message: str) -> None:
@@ -30,24 +36,49 @@ def process_user_message(user_message: str) -> None:
     if current_state is not None:
         previous_state = SearchRequest.model_validate(current_state)
 
-    with st.spinner("Thinking..."):
-        result = run_async(
-            handle_user_message(
-                user_message=user_message,
-                previous_state=previous_state,
-                source="fixtures",
-                top_n=5,
-                fallback_policy=FallbackPolicy(enabled=True, top_k=5),
-                max_items=MAX_ITEMS_HARD_CAP,
-            )
+    result: dict[str, Any] = {}
+    checked = 0
+
+    with st.status("Thinking...") as status:
+        events = handle_user_message_events(
+            user_message=user_message,
+            previous_state=previous_state,
+            source="fixtures",
+            top_n=5,
+            fallback_policy=FallbackPolicy(enabled=True, top_k=5),
+            max_items=MAX_ITEMS_HARD_CAP,
+            result_context=get_result_context(),
+            debug_timings=True,
+            llm_usage=get_llm_usage(),
         )
 
+        for event in get_background_loop().iterate(events):
+            name = event["event"]
+
+            if name == "final":
+                result = event["data"]
+            elif name == "structured_results":
+                titles = [r.get("title") for r in event["data"].get("results") or []]
+                if titles:
+                    status.write("Preliminary matches: " + ", ".join(t for t in titles if t))
+                status.update(label=_STAGE_LABELS[name])
+            elif name == "fallback_resolution":
+                checked += 1
+                status.update(label=f"Checked {checked} listing(s)...")
+            elif name in _STAGE_LABELS:
+                status.update(label=_STAGE_LABELS[name])
+
+        status.update(label="Done", state="complete", expanded=False)
+
     assistant_answer, answer_payload = build_display_answer(result)
     debug_data = {
         "parsed_intent": result.get("parsed_intent"),
         "search_request": result.get("search_request"),
         "state_after": result.get("state"),
         "answer_payload": answer_payload,
+        "timings": (result.get("debug") or {}).get("timings"),
+        "llm_usage": (result.get("debug") or {}).get("llm_usage"),
+        "session_llm_usage": get_llm_usage().to_dict(),
     }
 
     append_message("assistant", assistant_answer, debug_data=debug_data)
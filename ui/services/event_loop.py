@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Coroutine, Iterator
+
+
+class BackgroundEventLoop:
+    """
+    One long-lived asyncio loop running in a daemon thread.
+
+    Streamlit runs every rerun in a script thread; calling asyncio.run there
+    creates and closes a loop per message, which drops pooled HTTP
+    connections, cached clients and pending background tasks. Submitting
+    coroutines to this loop instead keeps them alive for the whole process.
+    """
+
+    def __init__(self, name: str = "booking-agent-loop") -> None:
+        self._name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self.start()
+
+    def is_running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and self._thread is not None and self._thread.is_alive():
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=_run, name=self._name, daemon=True)
+            thread.start()
+            ready.wait()
+
+            self._loop = loop
+            self._thread = thread
+            return loop
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        """Thread-safe: schedule coro on the background loop."""
+        return asyncio.run_coroutine_threadsafe(coro, self.start())
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: float | None = None) -> Any:
+        """Block the calling (Streamlit script) thread until coro finishes."""
+        return self.submit(coro).result(timeout=timeout)
+
+    def iterate(self, agen: AsyncIterator[Any], timeout: float | None = None) -> Iterator[Any]:
+        """Drive an async generator on the loop, yielding its items in the calling thread."""
+
+        async def _next() -> Any:
+            return await agen.__anext__()
+
+        try:
+            while True:
+                try:
+                    yield self.run(_next(), timeout=timeout)
+                except StopAsyncIteration:
+                    return
+        finally:
+            aclose = getattr(agen, "aclose", None)
+            if aclose is not None and self.is_running():
+                self.run(aclose(), timeout=timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+
+        if loop is None:
+            return
+
+        async def _shutdown() -> None:
+            tasks = [
+                t for t in asyncio.all_tasks()
+                if t is not asyncio.current_task()
+            ]
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        try:
+            asyncio.run_coroutine_threadsafe(_shutdown(), loop).result(timeout=timeout)
+        except Exception:
+            pass
+
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=timeout)
+        loop.close()
+
+
+_BACKGROUND_LOOP = BackgroundEventLoop()
+atexit.register(_BACKGROUND_LOOP.stop)
+
+
+def get_background_loop() -> BackgroundEventLoop:
+    """Process-wide loop shared by all Streamlit sessions."""
+    return _BACKGROUND_LOOP
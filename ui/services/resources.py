@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Any
+
+import streamlit as st
+
+from app.services.logs import configure_logging
+from app.services.warmup import warm_up
+from ui.services.event_loop import BackgroundEventLoop, get_background_loop
+
+
+@st.cache_resource(show_spinner="Warming up...")
+def warm_up_resources() -> dict[str, dict[str, Any]]:
+    """Runs once per Streamlit server process, shared by all sessions."""
+    configure_logging()
+    return warm_up()
+
+
+@st.cache_resource
+def background_loop() -> BackgroundEventLoop:
+    loop = get_background_loop()
+    loop.start()
+    return loop
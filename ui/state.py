@@ -1,5 +1,8 @@
 import streamlit as st
 
+from app.logic.search_context import SearchResultContext
+from app.services.llm_usage import LLMUsage
+
 
 def init_session_state() -> None:
     if "messages" not in st.session_state:
@@ -8,6 +11,12 @@ def init_session_state() -> None:
     if "search_state" not in st.session_state:
         st.session_state.search_state = None
 
+    if "result_context" not in st.session_state:
+        st.session_state.result_context = SearchResultContext()
+
+    if "llm_usage" not in st.session_state:
+        st.session_state.llm_usage = LLMUsage()
+
 
 def get_messages():
     return st.session_state.messages
@@ -21,6 +30,18 @@ def set_search_state(state) -> None:
     st.session_state.search_state = state
 
 
+def get_result_context() -> SearchResultContext:
+    if "result_context" not in st.session_state:
+        st.session_state.result_context = SearchResultContext()
+    return st.session_state.result_context
+
+
+def get_llm_usage() -> LLMUsage:
+    if "llm_usage" not in st.session_state:
+        st.session_state.llm_usage = LLMUsage()
+    return st.session_state.llm_usage
+
+
 def append_message(role: str, content: str, debug_data=None) -> None:
     message = {
         "role": role,
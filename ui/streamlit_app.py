@@ -13,6 +13,7 @@ from ui.components.chat import render_messages
 from ui.components.empty_state import render_empty_state
 from ui.components.header import render_header
 from ui.components.input_bar import render_input_area
+from ui.services.resources import background_loop, warm_up_resources
 from ui.state import get_messages, init_session_state
 from ui.styles import apply_styles
 
@@ -26,6 +27,8 @@ st.set_page_config(
 
 def main() -> None:
     apply_styles()
+    warm_up_resources()
+    background_loop()
     init_session_state()
 
     render_header()